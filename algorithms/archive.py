@@ -0,0 +1,216 @@
+from typing import Optional
+import numpy as np
+from .protocol_nsga3 import Vector
+from utils.reference_index import ReferenceIndex
+
+
+class _Node:
+    """Nó da ND-tree: folha (pontos em `F`/`X`) ou nó interno (`children`)."""
+
+    __slots__ = ("ideal", "nadir", "children", "F", "X")
+
+    def __init__(self, f: Vector):
+        self.ideal: Vector = f.copy()
+        self.nadir: Vector = f.copy()
+        self.children: Optional[list["_Node"]] = None
+        self.F: list[Vector] = []
+        self.X: list[Optional[Vector]] = []
+
+    @property
+    def empty(self) -> bool:
+        return not self.children if self.children is not None else not self.F
+
+
+class NDTreeArchive:
+    """
+    Arquivo externo de soluções não dominadas (minimização) sobre uma ND-tree
+    (Jaszkiewicz & Lust, 2018).
+
+    Cada nó guarda aproximações do ponto ideal e do nadir dos seus pontos, o que
+    permite decidir subárvores inteiras em O(M): um ponto coberto pelo nadir de um
+    nó é dominado por todos os pontos do nó (rejeitado), um ponto que cobre o ideal
+    domina todos (o nó é removido) e um ponto incomparável com a caixa
+    [ideal, nadir] não interage com o nó. Assim a atualização visita, em geral,
+    poucos nós, em vez de comparar o ponto com todo o arquivo.
+
+    Com `capacity`, o arquivo é truncado após cada lote de inserções: os pontos,
+    normalizados pelos extremos do arquivo, são associados aos pontos de
+    referência (`ref_index`) e removidos um a um do nicho mais cheio, começando
+    pelo mais distante da sua referência.
+
+    :param capacity: Número máximo de pontos (None = ilimitado)
+    :param ref_index: Índice dos pontos de referência usados na truncagem
+    :param max_leaf: Pontos por folha antes da divisão
+    :param n_children: Filhos criados na divisão de uma folha (padrão: M + 1)
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        ref_index: Optional[ReferenceIndex] = None,
+        max_leaf: int = 20,
+        n_children: Optional[int] = None
+    ):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity deve ser positivo")
+        if capacity is not None and ref_index is None:
+            raise ValueError("Um arquivo limitado precisa de ref_index para a truncagem")
+        self.capacity = capacity
+        self.ref_index = ref_index
+        self.max_leaf = max_leaf
+        self.n_children = n_children
+        self.n_inserted: int = 0
+        self.n_truncated: int = 0
+        self._root: Optional[_Node] = None
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def update(self, f: Vector, x: Optional[Vector] = None) -> bool:
+        """
+        Oferece um ponto ao arquivo. Se nenhum ponto arquivado o domina (ou é igual
+        a ele), remove os que ele domina e o insere. Não aplica a truncagem.
+
+        :return: True se o ponto foi inserido
+        """
+        f = np.array(f, dtype=float)
+        x = None if x is None else np.array(x, copy=True)
+        if self._root is not None and not self._update_node(self._root, f):
+            return False
+        if self._root is None or self._root.empty:
+            self._root = _Node(f)
+        self._insert(self._root, f, x)
+        self._size += 1
+        self.n_inserted += 1
+        return True
+
+    def update_batch(self, F: Vector, X: Optional[Vector] = None) -> int:
+        """Oferece as linhas de F (com as soluções X) e trunca o arquivo; retorna quantas foram inseridas."""
+        inserted = sum(
+            self.update(f, None if X is None else X[i])
+            for i, f in enumerate(np.asarray(F, dtype=float))
+        )
+        if self.capacity is not None and self._size > self.capacity:
+            self._truncate()
+        return inserted
+
+    def objectives(self) -> Vector:
+        """Objetivos dos pontos arquivados, np.ndarray (N, M)."""
+        F, _ = self._collect()
+        return F
+
+    def solutions(self) -> Optional[Vector]:
+        """Soluções dos pontos arquivados (mesma ordem de `objectives`), se informadas."""
+        _, X = self._collect()
+        return X
+
+    def stats(self) -> dict[str, int]:
+        return {"size": self._size, "inserted": self.n_inserted, "truncated": self.n_truncated}
+
+    def _update_node(self, node: _Node, y: Vector) -> bool:
+        """Remove de `node` os pontos dominados por y; False se y for dominado (ou repetido)."""
+        if (node.nadir <= y).all():
+            return False
+        if (y <= node.ideal).all():
+            self._size -= self._count(node)
+            node.children, node.F, node.X = None, [], []
+            return True
+        if not ((y <= node.nadir).all() or (node.ideal <= y).all()):
+            return True
+        if node.children is None:
+            F = np.array(node.F)
+            if (F <= y).all(axis=1).any():
+                return False
+            keep = ~(y <= F).all(axis=1)
+            if not keep.all():
+                node.F = [f for f, k in zip(node.F, keep) if k]
+                node.X = [x for x, k in zip(node.X, keep) if k]
+                self._size -= int((~keep).sum())
+            return True
+        for child in node.children:
+            if not self._update_node(child, y):
+                return False
+        node.children = [child for child in node.children if not child.empty]
+        return True
+
+    def _insert(self, node: _Node, f: Vector, x: Optional[Vector]) -> None:
+        while True:
+            np.minimum(node.ideal, f, out=node.ideal)
+            np.maximum(node.nadir, f, out=node.nadir)
+            if node.children is None:
+                node.F.append(f)
+                node.X.append(x)
+                if len(node.F) > self.max_leaf:
+                    self._split(node)
+                return
+            centers = np.array([(child.ideal + child.nadir) / 2 for child in node.children])
+            node = node.children[int(np.argmin(np.linalg.norm(centers - f, axis=1)))]
+
+    def _split(self, node: _Node) -> None:
+        """Divide uma folha cheia: sementes espalhadas (ponto mais distante) e atribuição à mais próxima."""
+        F = np.array(node.F)
+        n_children = min(self.n_children or F.shape[1] + 1, len(F))
+        distances = np.linalg.norm(F[:, None, :] - F[None, :, :], axis=2)
+        seeds = [int(np.argmax(distances.mean(axis=1)))]
+        while len(seeds) < n_children:
+            seeds.append(int(np.argmax(distances[:, seeds].min(axis=1))))
+        assignment = np.argmin(distances[:, seeds], axis=1)
+        children = []
+        for c in range(n_children):
+            members = np.flatnonzero(assignment == c)
+            if len(members) == 0:
+                continue
+            child = _Node(F[members[0]])
+            child.ideal = F[members].min(axis=0)
+            child.nadir = F[members].max(axis=0)
+            child.F = [node.F[i] for i in members]
+            child.X = [node.X[i] for i in members]
+            children.append(child)
+        node.children, node.F, node.X = children, [], []
+
+    def _truncate(self) -> None:
+        F, X = self._collect()
+        ideal = F.min(axis=0)
+        scale = F.max(axis=0) - ideal
+        scale[scale == 0] = 1
+        niches, dists = self.ref_index.nearest((F - ideal) / scale)
+
+        # Membros de cada nicho, do mais próximo ao mais distante da referência
+        members: dict[int, list[int]] = {}
+        for i in np.lexsort((dists, niches)):
+            members.setdefault(int(niches[i]), []).append(int(i))
+        keep = np.ones(len(F), dtype=bool)
+        n_remove = len(F) - self.capacity
+        for _ in range(n_remove):
+            niche = max(members, key=lambda ref: len(members[ref]))
+            keep[members[niche].pop()] = False
+        self.n_truncated += n_remove
+
+        self._root = None
+        self._size = 0
+        for i in np.flatnonzero(keep):
+            if self._root is None:
+                self._root = _Node(F[i])
+            self._insert(self._root, F[i], None if X is None else X[i])
+            self._size += 1
+
+    def _collect(self) -> tuple[Vector, Optional[Vector]]:
+        F: list[Vector] = []
+        X: list[Optional[Vector]] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.children is None:
+                F.extend(node.F)
+                X.extend(node.X)
+            else:
+                stack.extend(node.children)
+        F_array = np.array(F, dtype=float) if F else np.empty((0, 0))
+        X_array = np.array(X) if X and all(x is not None for x in X) else None
+        return F_array, X_array
+
+    def _count(self, node: _Node) -> int:
+        if node.children is None:
+            return len(node.F)
+        return sum(self._count(child) for child in node.children)
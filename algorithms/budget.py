@@ -0,0 +1,76 @@
+import time
+from typing import Callable
+from .protocol_nsga3 import Vector
+
+
+class EvaluationBudget:
+    """
+    Orçamento de execução compartilhado pelas implementações do NSGA-III.
+
+    Envolve a função multiobjetivo contando cada avaliação e mede o tempo de
+    parede desde a criação. As implementações chamam `notify()` ao fim de cada
+    geração e consultam `exhausted()` antes da próxima, de modo que o orçamento
+    pode ser excedido em no máximo uma geração; os valores efetivamente
+    consumidos são informados por `report()`.
+
+    :param functions: Função multiobjetivo f(x) -> Vector
+    :param max_evals: Número máximo de avaliações (None = sem limite)
+    :param time_budget: Tempo máximo de parede em segundos (None = sem limite)
+    :param callback: Função callback(gen, F) chamada a cada geração com os
+                     objetivos da população; retornando True a execução para
+    """
+
+    def __init__(
+        self,
+        functions: Callable[[Vector], Vector],
+        max_evals: int | None = None,
+        time_budget: float | None = None,
+        callback: Callable[[int, Vector], bool] | None = None
+    ):
+        self.functions = functions
+        self.max_evals = max_evals
+        self.time_budget = time_budget
+        self.callback = callback
+        self.n_evals: int = 0
+        self.n_gen: int = 0
+        self.stopped: bool = False
+        self.stop_reason: str = "generations"
+        self.start_time: float = time.perf_counter()
+
+    def __call__(self, x: Vector) -> Vector:
+        self.n_evals += 1
+        return self.functions(x)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def notify(self, F: Vector) -> None:
+        self.n_gen += 1
+        if self.callback is not None and self.callback(self.n_gen, F):
+            self.stopped = True
+            self.stop_reason = "callback"
+
+    def exhausted(self) -> bool:
+        if self.stopped:
+            return True
+        if self.max_evals is not None and self.n_evals >= self.max_evals:
+            self.stop_reason = "max_evals"
+            return True
+        if self.time_budget is not None and self.elapsed() >= self.time_budget:
+            self.stop_reason = "time_budget"
+            return True
+        return False
+
+    def restore(self, report: dict[str, float | int | str]) -> None:
+        """Retoma a contagem a partir de um `report()` salvo (ex.: checkpoint)."""
+        self.n_evals = int(report["n_evals"])
+        self.n_gen = int(report["n_gen"])
+        self.start_time = time.perf_counter() - float(report["elapsed_time"])
+
+    def report(self) -> dict[str, float | int | str]:
+        return {
+            "n_evals": self.n_evals,
+            "n_gen": self.n_gen,
+            "elapsed_time": self.elapsed(),
+            "stop_reason": self.stop_reason,
+        }
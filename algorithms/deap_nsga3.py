@@ -1,7 +1,173 @@
 from deap import base, creator, tools, algorithms
 import numpy as np
-from typing import Callable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable
 from .protocol_nsga3 import Vector, Bounds, ObjVec
+from .budget import EvaluationBudget
+from utils.profiling import RunProfiler
+from utils.seeding import seed_all
+
+
+class DeapNSGA3Session:
+    """
+    Sessão do NSGA-III no DEAP para uma configuração fixa de problema.
+
+    Os tipos do `creator`, o toolbox (inicialização e seleção) e os pontos de
+    referência são construídos uma única vez; `run` executa otimizações
+    sucessivas reaproveitando essa preparação.
+
+    Os indivíduos são arrays NumPy (`creator.NumpyIndividual<M>`), repassados aos
+    operadores sem conversão. Se crossover e mutação oferecerem `batch` (ver
+    `SBXCrossover`/`PolynomialMutation`), a variação de cada geração é feita
+    sobre a matriz da população inteira em vez do `varAnd` par a par.
+
+    :param functions: Função multiobjetivo f(x) -> Vector
+    :param bounds: Limites [(min, max), ...]
+    :param divisions: Número de divisões dos pontos de referência
+    :param ref_points: Pontos de referência (None = gerados por `divisions`)
+    """
+
+    def __init__(
+        self,
+        functions: Callable[[Vector], Vector],
+        bounds: Bounds,
+        divisions: int = 10,
+        ref_points: Vector = None
+    ):
+        self.functions = functions
+        self.bounds = bounds
+
+        # Número de objetivos
+        test_obj = functions(np.zeros(len(bounds)))
+        if not isinstance(test_obj, Vector):
+            raise ValueError("A função multiobjetivo deve retornar Vector")
+        self.n_obj = test_obj.shape[0]
+
+        # Tipos básicos para DEAP. Os tipos do `creator` são globais no processo e
+        # os pesos fixam o número de objetivos, então há um par de tipos por M
+        fitness_name = f"FitnessMin{self.n_obj}"
+        individual_name = f"NumpyIndividual{self.n_obj}"
+        if not hasattr(creator, fitness_name):
+            creator.create(fitness_name, base.Fitness, weights=(-1.0,) * self.n_obj)
+        if not hasattr(creator, individual_name):
+            creator.create(individual_name, np.ndarray, fitness=getattr(creator, fitness_name))
+        self.individual_type = individual_type = getattr(creator, individual_name)
+
+        self.toolbox = base.Toolbox()
+
+        # Inicializador de indivíduos
+        self.toolbox.register(
+            "individual",
+            lambda: individual_type(
+                [np.random.uniform(b[0], b[1]) for b in bounds]
+            ),
+        )
+        self.toolbox.register("population", tools.initRepeat, list, self.toolbox.individual)
+
+        # Operador de seleção
+        self.toolbox.register("select", tools.selNSGA3)
+
+        # Geração dos pontos de referência para o NSGA-III
+        if ref_points is None:
+            ref_points = tools.uniform_reference_points(nobj=self.n_obj, p=divisions)
+        self.ref_points = ref_points
+
+    def run(
+        self,
+        pop_size: int,
+        generations: int,
+        crossover: Callable[[Vector, Vector], tuple[Vector, Vector]],
+        mutation: Callable[[Vector, Bounds], Vector],
+        initial_pop: list[Vector] = None,
+        max_evals: int | None = None,
+        time_budget: float | None = None,
+        callback: Callable[[int, Vector], bool] | None = None,
+        seed: int | None = None,
+        info: dict[str, Any] | None = None
+    ) -> list[ObjVec]:
+        """Executa uma otimização; parâmetros com o mesmo significado de `nsga3_deap_func`."""
+        if seed is not None:
+            seed_all(seed)
+
+        bounds = self.bounds
+        toolbox = self.toolbox
+        individual_type = self.individual_type
+        budget = EvaluationBudget(self.functions, max_evals, time_budget, callback)
+
+        # Avaliação personalizada
+        def evaluate(individual):
+            x = np.asarray(individual, dtype=float)
+            obj_vec = budget(x)
+            if not isinstance(obj_vec, Vector):
+                raise ValueError("A função multiobjetivo deve retornar Vector")
+            return tuple(float(v) for v in obj_vec)
+
+        toolbox.register("evaluate", evaluate)
+
+        # Crossover personalizado
+        def custom_crossover(ind1, ind2):
+            child1, child2 = crossover(np.asarray(ind1), np.asarray(ind2))
+            return individual_type(child1), individual_type(child2)
+
+        toolbox.register("mate", custom_crossover)
+
+        # Mutação personalizada
+        def custom_mutation(individual):
+            mutated = mutation(np.asarray(individual), bounds)
+            individual[:] = mutated
+            return individual,
+
+        toolbox.register("mutate", custom_mutation)
+
+        # Variação em lote: pares consecutivos cruzam (como no varAnd com
+        # cxpb=1.0) e toda a prole é mutada de uma vez
+        def batch_variation(population):
+            X = np.asarray(population, dtype=float)
+            Y = X.copy()
+            n_pairs = len(X) // 2 * 2
+            Y[0:n_pairs:2], Y[1:n_pairs:2] = crossover.batch(X[0:n_pairs:2], X[1:n_pairs:2])
+            Y = mutation.batch(Y, bounds)
+            return [individual_type(y) for y in Y]
+
+        use_batch = hasattr(crossover, "batch") and hasattr(mutation, "batch")
+
+        # Inicialização da população
+        if initial_pop:
+            population = [individual_type(ind) for ind in initial_pop]
+        else:
+            population = toolbox.population(n=pop_size)
+
+        # Avaliação inicial da população
+        invalid_ind = [ind for ind in population if not ind.fitness.valid]
+        fitnesses = map(toolbox.evaluate, invalid_ind)
+        for ind, fit in zip(invalid_ind, fitnesses):
+            ind.fitness.values = fit
+
+        # Loop evolutivo
+        for gen in range(generations):
+            if budget.exhausted():
+                break
+            if use_batch:
+                offspring = batch_variation(population)
+            else:
+                offspring = algorithms.varAnd(population, toolbox, cxpb=1.0, mutpb=1.0)
+            fits = toolbox.map(toolbox.evaluate, offspring)
+            for fit, ind in zip(fits, offspring):
+                ind.fitness.values = fit
+            population = toolbox.select(offspring, k=len(population), ref_points=self.ref_points)
+            budget.notify(np.array([ind.fitness.values for ind in population], dtype=float))
+
+        front = tools.emo.sortNondominated(population, len(population), first_front_only=True)[0]
+
+        # Retornar a frente de Pareto
+        pareto_front = [tuple(ind.fitness.values) for ind in front]
+
+        if info is not None:
+            info.update(budget.report())
+
+        return pareto_front
+
 
 def nsga3_deap_func(
     pop_size: int,
@@ -12,91 +178,31 @@ def nsga3_deap_func(
     mutation: Callable[[Vector, Bounds], Vector],
     initial_pop: list[Vector] = None,
     divisions: int = 10,
-    ref_points: Vector = None
+    ref_points: Vector = None,
+    max_evals: int | None = None,
+    time_budget: float | None = None,
+    callback: Callable[[int, Vector], bool] | None = None,
+    seed: int | None = None,
+    info: dict[str, Any] | None = None,
+    profile: str | Path | None = None
 ) -> list[ObjVec]:
     """
     Utiliza DEAP para resolver NSGA-III com os parâmetros especificados.
     Suporta tanto lista de funções escalares [f1, f2, ..., fM]
     quanto uma única função multiobjetivo f(x) -> Vector.
+    A execução termina ao atingir `generations`, `max_evals`, `time_budget` ou
+    quando `callback(gen, F)` retornar True, o que ocorrer primeiro; o consumo
+    efetivo é registrado em `info`. Com `seed`, a execução é reprodutível.
+    Com `profile`, a otimização é perfilada e o perfil salvo nesse arquivo (ver
+    `utils.profiling.RunProfiler`).
+    Para muitas execuções da mesma configuração, use `DeapNSGA3Session`.
     """
-    # Número de objetivos
-    test_obj = functions(np.zeros(len(bounds)))
-    if not isinstance(test_obj, Vector):
-        raise ValueError("A função multiobjetivo deve retornar Vector")
-    n_obj = test_obj.shape[0]
-
-    # Criação dos tipos básicos para DEAP
-    if not hasattr(creator, "FitnessMin"):
-        creator.create("FitnessMin", base.Fitness, weights=(-1.0,) * n_obj)
-    if not hasattr(creator, "Individual"):
-        creator.create("Individual", list, fitness=creator.FitnessMin)
-
-    toolbox = base.Toolbox()
-
-    # Inicializador de indivíduos
-    toolbox.register(
-        "individual",
-        lambda: creator.Individual(
-            [np.random.uniform(b[0], b[1]) for b in bounds]
-        ),
-    )
-    toolbox.register("population", tools.initRepeat, list, toolbox.individual)
-
-    # Avaliação personalizada
-    def evaluate(individual):
-        x = np.array(individual, dtype=float)
-        obj_vec = functions(x)
-        if not isinstance(obj_vec, Vector):
-            raise ValueError("A função multiobjetivo deve retornar Vector")
-        return tuple(float(v) for v in obj_vec)
-
-    toolbox.register("evaluate", evaluate)
-
-    # Geração dos pontos de referência para o NSGA-III
-    if ref_points is None:
-        ref_points = tools.uniform_reference_points(nobj=n_obj, p=divisions)
-        
-    # Crossover personalizado
-    def custom_crossover(ind1, ind2):
-        child1, child2 = crossover(np.array(ind1), np.array(ind2))
-        return creator.Individual(child1.tolist()), creator.Individual(child2.tolist())
-
-    toolbox.register("mate", custom_crossover)
-
-    # Mutação personalizada
-    def custom_mutation(individual):
-        mutated = mutation(np.array(individual), bounds)
-        individual[:] = mutated.tolist()
-        return individual,
-
-    toolbox.register("mutate", custom_mutation)
-
-    # Operador de seleção
-    toolbox.register("select", tools.selNSGA3)
-
-    # Inicialização da população
-    if initial_pop:
-        population = [creator.Individual(ind.tolist()) for ind in initial_pop]
-    else:
-        population = toolbox.population(n=pop_size)
-    
-    # Avaliação inicial da população
-    invalid_ind = [ind for ind in population if not ind.fitness.valid]
-    fitnesses = map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitnesses):
-        ind.fitness.values = fit
-        
-    # Loop evolutivo
-    for gen in range(generations):
-        offspring = algorithms.varAnd(population, toolbox, cxpb=1.0, mutpb=1.0)
-        fits = toolbox.map(toolbox.evaluate, offspring)
-        for fit, ind in zip(fits, offspring):
-            ind.fitness.values = fit
-        population = toolbox.select(offspring, k=len(population), ref_points=ref_points)
-        
-    front = tools.emo.sortNondominated(population, len(population), first_front_only=True)[0]
-
-    # Retornar a frente de Pareto
-    pareto_front = [tuple(ind.fitness.values) for ind in front]
-            
-    return pareto_front
+    session = DeapNSGA3Session(functions, bounds, divisions, ref_points)
+    with RunProfiler(profile) if profile is not None else nullcontext():
+        return session.run(
+            pop_size, generations, crossover, mutation, initial_pop,
+            max_evals=max_evals, time_budget=time_budget, callback=callback, seed=seed, info=info,
+        )
+
+
+nsga3_deap_func.session_factory = DeapNSGA3Session
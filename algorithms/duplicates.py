@@ -0,0 +1,58 @@
+from typing import Iterable
+import numpy as np
+from .protocol_nsga3 import Vector
+
+
+def check_tolerance(tol: float | None) -> None:
+    """Valida a tolerância de quantização: None (duplicatas exatas) ou positiva."""
+    if tol is not None and not tol > 0:
+        raise ValueError("tol deve ser positivo (None = duplicatas exatas)")
+
+
+def genotype_key(x: Vector, tol: float | None = None) -> bytes:
+    """
+    Chave de hash de um vetor (de decisão ou de objetivos).
+
+    Sem `tol`, a chave é o conteúdo exato em bytes do vetor em float64. Com `tol`,
+    o vetor é quantizado em uma grade de passo `tol`: vetores na mesma célula
+    compartilham a chave. A detecção com tolerância é aproximada — dois vetores a
+    menos de `tol` de distância podem cair em células vizinhas.
+    """
+    check_tolerance(tol)
+    x = np.asarray(x, dtype=float)
+    if tol is None:
+        return np.ascontiguousarray(x).tobytes()
+    return np.round(x / tol).astype(np.int64).tobytes()
+
+
+def row_keys(X: Vector, tol: float | None = None) -> list[bytes]:
+    """Chaves de `genotype_key` para cada linha de X, com a quantização vetorizada."""
+    check_tolerance(tol)
+    X = np.asarray(X, dtype=float)
+    if tol is not None:
+        X = np.round(X / tol).astype(np.int64)
+    X = np.ascontiguousarray(X)
+    return [row.tobytes() for row in X]
+
+
+def unique_mask(
+    X: Vector,
+    tol: float | None = None,
+    exclude: Iterable[bytes] | None = None
+) -> Vector:
+    """
+    Detecção de duplicatas por hash em O(N): máscara das linhas de X que são a
+    primeira ocorrência da sua chave e não aparecem em `exclude`.
+
+    :param X: np.ndarray de shape (N, D)
+    :param tol: Tolerância de quantização (None = duplicatas exatas)
+    :param exclude: Chaves já existentes (ex.: da população de pais)
+    :return: np.ndarray booleano de shape (N,)
+    """
+    seen: set[bytes] = set(exclude) if exclude is not None else set()
+    mask = np.zeros(len(X), dtype=bool)
+    for i, key in enumerate(row_keys(X, tol)):
+        if key not in seen:
+            seen.add(key)
+            mask[i] = True
+    return mask
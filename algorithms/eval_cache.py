@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from typing import Callable
+import numpy as np
+from .protocol_nsga3 import Vector
+from .duplicates import genotype_key
+
+
+class EvaluationCache:
+    """
+    Memoização da função multiobjetivo por genótipo, com descarte LRU.
+
+    A chave é o conteúdo em bytes do vetor de decisão. Com `tol`, o vetor é
+    quantizado em uma grade de passo `tol` antes de gerar a chave, e vetores na
+    mesma célula reutilizam a mesma avaliação (aproximação controlada por `tol`).
+    Quando o cache excede `maxsize` entradas, a menos recentemente usada é descartada.
+
+    No motor puro só os filhos de cada geração são avaliados, então os acertos
+    são genótipos repetidos: em geral filhos que não foram alterados pelo
+    crossover nem pela mutação (cópias de um pai). Com os operadores padrão do
+    runner (pb_c=0.9, pb_m=0.1) a taxa de acerto fica em torno de 10%.
+
+    :param functions: Função multiobjetivo f(x) -> Vector
+    :param maxsize: Número máximo de entradas
+    :param tol: Tolerância de quantização (None = comparação exata)
+    """
+
+    def __init__(
+        self,
+        functions: Callable[[Vector], Vector],
+        maxsize: int = 10000,
+        tol: float | None = None
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize deve ser positivo")
+        self.functions = functions
+        self.maxsize = maxsize
+        self.tol = tol
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[bytes, Vector] = OrderedDict()
+
+    def get(self, x: Vector) -> Vector | None:
+        """Consulta o cache (contabilizando acerto/falha); None se ausente."""
+        key = genotype_key(x, self.tol)
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value.copy()
+
+    def put(self, x: Vector, value: Vector) -> None:
+        """Armazena uma avaliação feita fora do cache (ex.: em paralelo)."""
+        self._entries[genotype_key(x, self.tol)] = np.array(value, copy=True)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __call__(self, x: Vector) -> Vector:
+        value = self.get(x)
+        if value is not None:
+            return value
+        value = self.functions(x)
+        self.put(x, value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float | int]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
@@ -0,0 +1,83 @@
+import multiprocessing as mp
+import weakref
+from typing import Any, Callable, Sequence
+import numpy as np
+from .protocol_nsga3 import Vector
+from utils.shared_population import SharedPopulation
+
+# Estado de cada processo trabalhador (preenchido pelo initializer do Pool)
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(functions: Callable[[Vector], Vector], descriptor: tuple) -> None:
+    _worker["functions"] = functions
+    _worker["buffer"] = SharedPopulation.attach(descriptor)
+
+
+def _evaluate_rows(rows: tuple[int, int]) -> None:
+    buffer: SharedPopulation = _worker["buffer"]
+    functions = _worker["functions"]
+    for i in range(*rows):
+        buffer.F[i] = functions(buffer.X[i])
+
+
+def mp_context() -> Any:
+    """Contexto de multiprocessing preferido: fork quando disponível (herda closures sem serializá-las)."""
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+class ParallelEvaluator:
+    """
+    Avaliação da população em processos trabalhadores sobre buffers compartilhados.
+
+    A população é copiada para a matriz X em memória compartilhada, cada
+    trabalhador avalia um bloco contíguo de linhas e escreve os objetivos
+    diretamente em F; apenas os limites dos blocos trafegam pelo Pool.
+    Com o método spawn, `functions` precisa ser serializável (ex.: functools.partial).
+
+    :param functions: Função multiobjetivo f(x) -> Vector
+    :param n_workers: Número de processos
+    :param capacity: Número de linhas dos buffers (populações maiores são avaliadas em lotes)
+    :param n_var: Número de variáveis de decisão
+    :param n_obj: Número de objetivos
+    """
+
+    def __init__(
+        self,
+        functions: Callable[[Vector], Vector],
+        n_workers: int,
+        capacity: int,
+        n_var: int,
+        n_obj: int
+    ):
+        self.n_workers = n_workers
+        self.buffer = SharedPopulation.create(capacity, n_var, n_obj)
+        self.pool = mp_context().Pool(
+            n_workers, initializer=_init_worker, initargs=(functions, self.buffer.descriptor())
+        )
+        self._finalizer = weakref.finalize(self, ParallelEvaluator._cleanup, self.pool, self.buffer)
+
+    @staticmethod
+    def _cleanup(pool: Any, buffer: SharedPopulation) -> None:
+        pool.terminate()
+        pool.join()
+        buffer.close()
+        buffer.unlink()
+
+    def evaluate(self, population: Sequence[Vector]) -> Vector:
+        n_total = len(population)
+        capacity = self.buffer.capacity
+        F: Vector = np.empty((n_total, self.buffer.F.shape[1]), dtype=float)
+        for start in range(0, n_total, capacity):
+            batch = population[start:start + capacity]
+            n = len(batch)
+            self.buffer.X[:n] = np.asarray(batch, dtype=float)
+            limits = np.linspace(0, n, min(self.n_workers, n) + 1).astype(int)
+            self.pool.map(_evaluate_rows, list(zip(limits[:-1], limits[1:])))
+            F[start:start + n] = self.buffer.F[:n]
+        return F
+
+    def close(self) -> None:
+        self._finalizer()
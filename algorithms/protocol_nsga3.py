@@ -1,4 +1,4 @@
-from typing import Callable, Protocol
+from typing import Any, Callable, Protocol
 import numpy as np
 
 Vector = np.ndarray
@@ -21,4 +21,9 @@ class NSGA3Callable(Protocol):
         initial_pop: list[Vector] | None = None,
         divisions: int = 10,
         ref_points: np.ndarray | None = None,
-    ) -> list[tuple[float, ...]]: ...
\ No newline at end of file
+        max_evals: int | None = None,
+        time_budget: float | None = None,
+        callback: Callable[[int, np.ndarray], bool] | None = None,
+        seed: int | None = None,
+        info: dict[str, Any] | None = None,
+    ) -> list[tuple[float, ...]]: ...
@@ -1,7 +1,132 @@
 import random
 import numpy as np
-from typing import Callable, Optional, Sequence, DefaultDict
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, DefaultDict
 from .protocol_nsga3 import Vector, Bounds, ObjVec
+from .budget import EvaluationBudget
+from .eval_cache import EvaluationCache
+from .duplicates import check_tolerance, genotype_key, unique_mask
+from .archive import NDTreeArchive
+from .parallel_eval import ParallelEvaluator
+from utils.checkpoint import save_checkpoint, load_checkpoint
+from utils.profiling import RunProfiler
+from utils.reference_index import ReferenceIndex
+from utils.seeding import seed_all
+
+# Componentes do NSGA-III puro em nível de módulo (usados por `nsga3_func` e
+# medidos isoladamente em `experiments.microbench`)
+
+def dominates(obj1: ObjVec, obj2: ObjVec) -> bool:
+    return all(x <= y for x, y in zip(obj1, obj2)) and any(x < y for x, y in zip(obj1, obj2))
+
+def fast_nondominated_sort(objectives: Sequence[ObjVec]) -> list[list[int]]:
+    population_size: int = len(objectives)
+    S: list[list[int]] = [[] for _ in range(population_size)]
+    n: list[int] = [0] * population_size
+    fronts: list[list[int]] = [[]]
+
+    for p in range(population_size):
+        for q in range(population_size):
+            if dominates(objectives[p], objectives[q]):
+                S[p].append(q)
+            elif dominates(objectives[q], objectives[p]):
+                n[p] += 1
+        if n[p] == 0:
+            fronts[0].append(p)
+
+    i: int = 0
+    while fronts[i]:
+        next_front: list[int] = []
+        for p in fronts[i]:
+            for q in S[p]:
+                n[q] -= 1
+                if n[q] == 0:
+                    next_front.append(q)
+        i += 1
+        fronts.append(next_front)
+    fronts.pop()
+    return fronts
+
+
+def niching_selection(
+    front: list[int],
+    objectives: list[ObjVec],
+    ref_index: ReferenceIndex,
+    N: int,
+    dtype: str | np.dtype = "float64"
+) -> list[int]:
+    """
+    Seleciona N indivíduos de `front` (última frente admitida) pelo niching do
+    NSGA-III: associação aos pontos de referência (`ref_index`) na frente
+    normalizada e preenchimento dos nichos menos ocupados, com desempate
+    aleatório (módulo `random`). `dtype` é a precisão das matrizes do niching.
+    """
+    selected: list[int] = []
+    objs: Vector = np.array([objectives[i] for i in front], dtype=dtype)
+    ideal_point: Vector = np.min(objs, axis=0)
+    normalized_objs: Vector = objs - ideal_point
+
+    max_values: Vector = np.max(normalized_objs, axis=0)
+    max_values[max_values == 0] = 1
+    normalized_objs = normalized_objs / max_values
+
+    nearest_refs, nearest_dists = ref_index.nearest(normalized_objs)
+    reference_associations: DefaultDict[int, list[tuple[int, float]]] = DefaultDict(list)
+    for idx, ref_idx, dist in zip(front, nearest_refs.tolist(), nearest_dists.tolist()):
+        reference_associations[ref_idx].append((idx, dist))
+
+    # Só os nichos com indivíduos associados podem ser escolhidos; os demais
+    # mantêm contagem zero e apenas fixam a contagem mínima em zero
+    niche_counts: dict[int, int] = {ref: 0 for ref in sorted(reference_associations)}
+    has_empty_niche: bool = len(niche_counts) < len(ref_index)
+    selected_flags: dict[int, bool] = {idx: False for idx in front}
+
+    while len(selected) < N:
+        min_niche_count: int = 0 if has_empty_niche else min(niche_counts.values())
+        min_refs: list[int] = [ref for ref, count in niche_counts.items() if count == min_niche_count]
+
+        for ref_idx in min_refs:
+            assoc_inds: list[tuple[int, float]] = reference_associations.get(ref_idx, [])
+            unselected_inds: list[tuple[int, float]] = [(idx, dist) for idx, dist in assoc_inds if not selected_flags[idx]]
+
+            if unselected_inds:
+                unselected_inds.sort(key=lambda x: x[1])
+                selected_idx: int = unselected_inds[0][0]
+                selected.append(selected_idx)
+                selected_flags[selected_idx] = True
+                niche_counts[ref_idx] += 1
+                break
+        else:
+            remaining: list[int] = [idx for idx in front if not selected_flags[idx]]
+            if remaining:
+                selected_idx = random.choice(remaining)
+                selected.append(selected_idx)
+                selected_flags[selected_idx] = True
+            else:
+                break
+
+    return selected[:N]
+
+
+def compute_individual_ranks(fronts: list[list[int]]) -> dict[int, int]:
+    individual_ranks: dict[int, int] = {}
+    for rank, front in enumerate(fronts):
+        for idx in front:
+            individual_ranks[idx] = rank
+    return individual_ranks
+
+def tournament_selection(population: list[Vector], individual_ranks: dict[int, int]) -> Vector:
+    i1, i2 = random.sample(range(len(population)), 2)
+    rank1: int = individual_ranks[i1]
+    rank2: int = individual_ranks[i2]
+    if rank1 < rank2:
+        return population[i1]
+    elif rank2 < rank1:
+        return population[i2]
+    else:
+        return population[random.choice([i1, i2])]
+
 
 def nsga3_func(
     pop_size: int,
@@ -12,7 +137,22 @@ def nsga3_func(
     mutation: Callable[[Vector, Bounds], Vector],
     initial_pop: Optional[list[Vector]] = None,
     divisions: int = 10,
-    ref_points: Optional[Vector] = None
+    ref_points: Optional[Vector] = None,
+    max_evals: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    callback: Optional[Callable[[int, Vector], bool]] = None,
+    seed: Optional[int] = None,
+    info: Optional[dict[str, Any]] = None,
+    checkpoint_path: Optional[str | Path] = None,
+    checkpoint_every: int = 1,
+    cache_size: Optional[int] = None,
+    cache_tol: Optional[float] = None,
+    eliminate_duplicates: bool | float = False,
+    duplicates_space: str = "decision",
+    n_workers: Optional[int] = None,
+    archive_size: Optional[int] = None,
+    dtype: str | np.dtype = "float64",
+    profile: Optional[str | Path] = None
 ) -> list[ObjVec]:
     """
     NSGA-III generalizado para N dimensões.
@@ -24,12 +164,39 @@ def nsga3_func(
     :param crossover: Função de crossover que aceita dois pais e retorna filhos
     :param mutation: Função de mutação que aceita um indivíduo e retorna um indivíduo mutado
     :param divisions: Número de divisões para geração dos pontos de referência
-    :return: Fronteira de Pareto da última geração
+    :param max_evals: Número máximo de avaliações da função objetivo (critério de parada adicional)
+    :param time_budget: Tempo máximo de parede em segundos (critério de parada adicional)
+    :param callback: Função callback(gen, F) chamada a cada geração com os objetivos da população; True interrompe
+    :param seed: Semente dos geradores aleatórios (None = estado global atual)
+    :param info: Dicionário opcional preenchido com avaliações, gerações e tempo consumidos
+    :param checkpoint_path: Arquivo de checkpoint binário; se existir, a execução é retomada a partir dele.
+        O estado do `callback` também é salvo e restaurado, se ele oferecer `get_state`/`set_state`
+        (ex.: `StagnationStopping`, `TrajectoryRecorder`)
+    :param checkpoint_every: Intervalo, em gerações, entre checkpoints
+    :param cache_size: Se informado, memoiza avaliações por genótipo (LRU com esse número de entradas)
+    :param cache_tol: Tolerância de quantização das chaves do cache (None = genótipos idênticos)
+    :param eliminate_duplicates: True elimina duplicatas exatas; um float elimina duplicatas com essa tolerância.
+        Filhos repetidos (em relação aos pais e entre si) são descartados antes da avaliação e a
+        população combinada é filtrada antes da seleção
+    :param duplicates_space: Espaço da filtragem antes da seleção: "decision" ou "objective"
+    :param n_workers: Se informado, avalia a população em paralelo nesse número de processos,
+        usando buffers de população em memória compartilhada
+    :param archive_size: Se informado, mantém um arquivo externo de soluções não dominadas
+        (ND-tree, ver `algorithms.archive`) com até esse número de pontos, atualizado com os
+        filhos de cada geração e truncado pelos pontos de referência
+    :param dtype: Precisão de ponto flutuante ("float64" ou "float32") dos vetores de
+        decisão, dos pontos de referência e das matrizes do niching; "float32" reduz à
+        metade a memória desses arrays. Os objetivos são arredondados para essa precisão
+        após a avaliação, mas seguem guardados como tuplas de floats do Python (sem
+        economia de memória na população nem no arquivo); só o checkpoint os grava em `dtype`
+    :param profile: Se informado, perfila a execução e salva o perfil nesse arquivo
+        (.prof = cProfile, .json = amostragem; ver `utils.profiling.RunProfiler`)
+    :return: Fronteira de Pareto da última geração (com `archive_size`, o conteúdo do arquivo)
     """
 
     def initialize_population(size: int, bounds: list[tuple[float, float]]) -> list[Vector]:
         return [
-            np.array([random.uniform(b[0], b[1]) for b in bounds], dtype=float)
+            np.array([random.uniform(b[0], b[1]) for b in bounds], dtype=float_dtype)
             for _ in range(size)
         ]
 
@@ -41,48 +208,34 @@ def nsga3_func(
         Avalia a população em dois modos:
         - Lista de funções objetivos: [f1, f2, ..., fM], cada uma retornando float.
         - Única função multiobjetivo: f(x) -> Vector com M objetivos.
+        Com `n_workers`, delega ao avaliador paralelo.
         """
+        if evaluator is not None:
+            return evaluate_parallel(population)
+
         objectives: list[ObjVec] = []
 
         for x in population:
             obj_vec = functions(x)
             if isinstance(obj_vec, Vector):
-                objectives.append(tuple(float(v) for v in obj_vec))
+                objectives.append(tuple(float(v) for v in obj_vec.astype(float_dtype, copy=False)))
             else:
                 raise ValueError("A função multiobjetivo deve retornar um Vector")
 
         return objectives
 
-    def dominates(obj1: ObjVec, obj2: ObjVec) -> bool:
-        return all(x <= y for x, y in zip(obj1, obj2)) and any(x < y for x, y in zip(obj1, obj2))
-
-    def fast_nondominated_sort(objectives: Sequence[ObjVec]) -> list[list[int]]:
-        population_size: int = len(objectives)
-        S: list[list[int]] = [[] for _ in range(population_size)]
-        n: list[int] = [0] * population_size
-        fronts: list[list[int]] = [[]]
-
-        for p in range(population_size):
-            for q in range(population_size):
-                if dominates(objectives[p], objectives[q]):
-                    S[p].append(q)
-                elif dominates(objectives[q], objectives[p]):
-                    n[p] += 1
-            if n[p] == 0:
-                fronts[0].append(p)
-
-        i: int = 0
-        while fronts[i]:
-            next_front: list[int] = []
-            for p in fronts[i]:
-                for q in S[p]:
-                    n[q] -= 1
-                    if n[q] == 0:
-                        next_front.append(q)
-            i += 1
-            fronts.append(next_front)
-        fronts.pop()
-        return fronts
+    def evaluate_parallel(population: Sequence[Vector]) -> list[ObjVec]:
+        # Consulta o cache no processo principal e avalia em paralelo apenas as ausências
+        results: list[Optional[Vector]] = [cache.get(x) if cache is not None else None for x in population]
+        pending: list[int] = [i for i, r in enumerate(results) if r is None]
+        if pending:
+            F: Vector = evaluator.evaluate([population[i] for i in pending])
+            budget.n_evals += len(pending)
+            for i, row in zip(pending, F):
+                results[i] = row
+                if cache is not None:
+                    cache.put(population[i], row)
+        return [tuple(float(v) for v in np.asarray(r, dtype=float_dtype)) for r in results]
 
     def generate_reference_points(M: int, p: int) -> Vector:
         def generate_recursive(
@@ -111,130 +264,169 @@ def nsga3_func(
         population: list[Vector],
         objectives: list[ObjVec],
         fronts: list[list[int]],
-        reference_points: Vector,
+        ref_index: ReferenceIndex,
         pop_size: int
-    ) -> list[Vector]:
+    ) -> tuple[list[Vector], list[ObjVec]]:
         next_population_indices: list[int] = []
         for front in fronts:
             if len(next_population_indices) + len(front) <= pop_size:
                 next_population_indices.extend(front)
             else:
                 N: int = pop_size - len(next_population_indices)
-                selected_indices: list[int] = niching_selection(front, objectives, reference_points, N)
+                selected_indices: list[int] = niching_selection(front, objectives, ref_index, N, float_dtype)
                 next_population_indices.extend(selected_indices)
                 break
         next_population: list[Vector] = [population[i] for i in next_population_indices]
-        return next_population
+        next_objectives: list[ObjVec] = [objectives[i] for i in next_population_indices]
+        return next_population, next_objectives
 
-    def niching_selection(
-        front: list[int],
-        objectives: list[ObjVec],
-        reference_points: Vector,
-        N: int
-    ) -> list[int]:
-        selected: list[int] = []
-        objs: Vector = np.array([objectives[i] for i in front], dtype=float)
-        ideal_point: Vector = np.min(objs, axis=0)
-        normalized_objs: Vector = objs - ideal_point
-
-        max_values: Vector = np.max(normalized_objs, axis=0)
-        max_values[max_values == 0] = 1
-        normalized_objs = normalized_objs / max_values
-
-        associations: list[tuple[int, int, float]] = []
-        for idx, obj in zip(front, normalized_objs):
-            distances: Vector = np.linalg.norm(obj - reference_points, axis=1)
-            min_index: int = int(np.argmin(distances))
-            associations.append((idx, min_index, float(distances[min_index])))
-
-        reference_associations: DefaultDict[int, list[tuple[int, float]]] = DefaultDict(list)
-        for idx, ref_idx, dist in associations:
-            reference_associations[ref_idx].append((idx, dist))
-
-        niche_counts: dict[int, int] = {i: 0 for i in range(len(reference_points))}
-        selected_flags: dict[int, bool] = {idx: False for idx in front}
-
-        while len(selected) < N:
-            min_niche_count: int = min(niche_counts.values()) if niche_counts else 0
-            min_refs: list[int] = [ref for ref, count in niche_counts.items() if count == min_niche_count]
-
-            for ref_idx in min_refs:
-                assoc_inds: list[tuple[int, float]] = reference_associations.get(ref_idx, [])
-                unselected_inds: list[tuple[int, float]] = [(idx, dist) for idx, dist in assoc_inds if not selected_flags[idx]]
-
-                if unselected_inds:
-                    unselected_inds.sort(key=lambda x: x[1])
-                    selected_idx: int = unselected_inds[0][0]
-                    selected.append(selected_idx)
-                    selected_flags[selected_idx] = True
-                    niche_counts[ref_idx] += 1
-                    break
+    def remove_duplicates(
+        population: list[Vector],
+        objectives: list[ObjVec]
+    ) -> tuple[list[Vector], list[ObjVec]]:
+        data = objectives if duplicates_space == "objective" else population
+        mask: Vector = unique_mask(np.array(data, dtype=float), dup_tol)
+        # Mantém duplicatas apenas se faltarem indivíduos para completar a população
+        missing: int = pop_size - int(mask.sum())
+        if missing > 0:
+            mask[np.flatnonzero(~mask)[:missing]] = True
+        keep: Vector = np.flatnonzero(mask)
+        return [population[i] for i in keep], [objectives[i] for i in keep]
+
+    with RunProfiler(profile) if profile is not None else nullcontext():
+        if seed is not None:
+            seed_all(seed)
+
+        float_dtype: np.dtype = np.dtype(dtype)
+        if float_dtype not in (np.float32, np.float64):
+            raise ValueError("dtype deve ser 'float32' ou 'float64'")
+
+        if duplicates_space not in ("decision", "objective"):
+            raise ValueError("duplicates_space deve ser 'decision' ou 'objective'")
+        dedup: bool = eliminate_duplicates is not False
+        dup_tol: Optional[float] = None if isinstance(eliminate_duplicates, bool) else float(eliminate_duplicates)
+        check_tolerance(dup_tol)
+
+        # Inicializa a população
+        if initial_pop is None:
+            population: list[Vector] = initialize_population(pop_size, bounds)
+        else:
+            population = initial_pop if float_dtype == np.float64 else [np.asarray(x, dtype=float_dtype) for x in initial_pop]
+
+        # Descobre número de objetivos M
+        test_obj = functions(np.zeros(len(bounds)))
+        if not isinstance(test_obj, Vector):
+            raise ValueError("A função multiobjetivo deve retornar Vector")
+        M: int = test_obj.shape[0]
+
+        if ref_points is None:
+            ref_points = generate_reference_points(M, divisions).astype(float_dtype, copy=False)
+        else:
+            ref_points = np.asarray(ref_points, dtype=float_dtype)
+
+        # O cache fica por fora do orçamento: só avaliações reais são contabilizadas
+        evaluator: Optional[ParallelEvaluator] = None
+        if n_workers is not None:
+            evaluator = ParallelEvaluator(functions, n_workers, 2 * pop_size, len(bounds), M)
+        try:
+            budget = EvaluationBudget(functions, max_evals, time_budget, callback)
+            cache = EvaluationCache(budget, cache_size, cache_tol) if cache_size is not None else None
+            functions = budget if cache is None else cache
+
+            # Retomada a partir do último checkpoint. A normalização do niching é
+            # recalculada a cada geração a partir da frente, então basta restaurar
+            # população, pontos de referência, estados dos geradores, contadores e o estado do callback.
+            start_gen: int = 0
+            state = load_checkpoint(checkpoint_path) if checkpoint_path is not None else None
+            if state is not None:
+                population = [np.array(x, dtype=float_dtype) for x in state["population"]]
+                population_objectives: list[ObjVec] = [tuple(float(v) for v in f) for f in state["objectives"]]
+                ref_points = state["ref_points"]
+                random.setstate(state["random_state"])
+                np.random.set_state(state["numpy_random_state"])
+                budget.restore(state["budget"])
+                start_gen = state["generation"]
+                if state.get("callback") is not None and hasattr(callback, "set_state"):
+                    callback.set_state(state["callback"])
             else:
-                remaining: list[int] = [idx for idx in front if not selected_flags[idx]]
-                if remaining:
-                    selected_idx = random.choice(remaining)
-                    selected.append(selected_idx)
-                    selected_flags[selected_idx] = True
-                else:
+                # Os objetivos da população acompanham a seleção: cada geração avalia só os filhos
+                population_objectives = evaluate_population(population, functions)
+            ref_index = ReferenceIndex(ref_points)
+
+            archive: Optional[NDTreeArchive] = None
+            if archive_size is not None:
+                archive = NDTreeArchive(archive_size, ref_index)
+                if state is not None and "archive" in state:
+                    archive.update_batch(*state["archive"])
+                if len(archive) == 0:
+                    archive.update_batch(np.array(population_objectives, dtype=float), np.array(population, dtype=float))
+
+            for gen in range(start_gen, generations):
+                if budget.exhausted():
                     break
+                fronts: list[list[int]] = fast_nondominated_sort(population_objectives)
+                individual_ranks: dict[int, int] = compute_individual_ranks(fronts)
+                offspring_population: list[Vector] = []
+                seen: set[bytes] = {genotype_key(x, dup_tol) for x in population} if dedup else set()
+                rejected: int = 0
+                while len(offspring_population) < pop_size:
+                    parent1: Vector = tournament_selection(population, individual_ranks)
+                    parent2: Vector = tournament_selection(population, individual_ranks)
+                    children: tuple[Vector, Vector] = crossover(parent1, parent2)
+                    child: Vector = np.asarray(mutation(children[0], bounds), dtype=float_dtype)
+                    # Descarta filhos repetidos antes da avaliação (limitado para não travar em populações convergidas)
+                    if dedup and rejected < 10 * pop_size:
+                        key: bytes = genotype_key(child, dup_tol)
+                        if key in seen:
+                            rejected += 1
+                            continue
+                        seen.add(key)
+                    offspring_population.append(child)
 
-        return selected[:N]
-
-    def compute_individual_ranks(fronts: list[list[int]]) -> dict[int, int]:
-        individual_ranks: dict[int, int] = {}
-        for rank, front in enumerate(fronts):
-            for idx in front:
-                individual_ranks[idx] = rank
-        return individual_ranks
-
-    def tournament_selection(population: list[Vector], individual_ranks: dict[int, int]) -> Vector:
-        i1, i2 = random.sample(range(len(population)), 2)
-        rank1: int = individual_ranks[i1]
-        rank2: int = individual_ranks[i2]
-        if rank1 < rank2:
-            return population[i1]
-        elif rank2 < rank1:
-            return population[i2]
-        else:
-            return population[random.choice([i1, i2])]
+                offspring_objectives: list[ObjVec] = evaluate_population(offspring_population, functions)
+                if archive is not None:
+                    archive.update_batch(
+                        np.array(offspring_objectives, dtype=float),
+                        np.array(offspring_population, dtype=float)
+                    )
+                combined_population: list[Vector] = population + offspring_population
+                combined_objectives: list[ObjVec] = population_objectives + offspring_objectives
+                if dedup:
+                    combined_population, combined_objectives = remove_duplicates(combined_population, combined_objectives)
+                combined_fronts: list[list[int]] = fast_nondominated_sort(combined_objectives)
+                population, population_objectives = environmental_selection(
+                    combined_population, combined_objectives, combined_fronts, ref_index, pop_size
+                )
+                budget.notify(np.array(population_objectives, dtype=float))
 
-    # Inicializa a população
-    if initial_pop is None:
-        population: list[Vector] = initialize_population(pop_size, bounds)
-    else:
-        population = initial_pop
+                if checkpoint_path is not None and (gen + 1) % checkpoint_every == 0:
+                    save_checkpoint(checkpoint_path, {
+                        "generation": gen + 1,
+                        "population": np.array(population, dtype=float_dtype),
+                        "objectives": np.array(population_objectives, dtype=float_dtype),
+                        "ref_points": ref_points,
+                        "random_state": random.getstate(),
+                        "numpy_random_state": np.random.get_state(),
+                        "budget": budget.report(),
+                        "callback": callback.get_state() if hasattr(callback, "get_state") else None,
+                        **({"archive": (archive.objectives(), archive.solutions())} if archive is not None else {}),
+                    })
 
-    # Descobre número de objetivos M
-    test_obj = functions(np.zeros(len(bounds)))
-    if not isinstance(test_obj, Vector):
-        raise ValueError("A função multiobjetivo deve retornar Vector")
-    M: int = test_obj.shape[0]
+            fronts = fast_nondominated_sort(population_objectives)
+            pareto_front: list[ObjVec] = [population_objectives[i] for i in fronts[0]]
+            if archive is not None:
+                pareto_front = [tuple(float(v) for v in f) for f in archive.objectives()]
+            pareto_front.sort()
+        finally:
+            # Encerra os processos e a memória compartilhada também em exceções (callback, interrupção)
+            if evaluator is not None:
+                evaluator.close()
 
-    if ref_points is None:
-        ref_points = generate_reference_points(M, divisions)
-    else:
-        ref_points = np.asarray(ref_points, dtype=float)
-
-    for gen in range(generations):
-        objectives: list[ObjVec] = evaluate_population(population, functions)
-        fronts: list[list[int]] = fast_nondominated_sort(objectives)
-        individual_ranks: dict[int, int] = compute_individual_ranks(fronts)
-        offspring_population: list[Vector] = []
-        while len(offspring_population) < pop_size:
-            parent1: Vector = tournament_selection(population, individual_ranks)
-            parent2: Vector = tournament_selection(population, individual_ranks)
-            children: tuple[Vector, Vector] = crossover(parent1, parent2)
-            child: Vector = mutation(children[0], bounds)
-            offspring_population.append(child)
-
-        combined_population: list[Vector] = population + offspring_population
-        combined_objectives: list[ObjVec] = evaluate_population(combined_population, functions)
-        combined_fronts: list[list[int]] = fast_nondominated_sort(combined_objectives)
-        population = environmental_selection(combined_population, combined_objectives, combined_fronts, ref_points, pop_size)
-
-    objectives = evaluate_population(population, functions)
-    fronts = fast_nondominated_sort(objectives)
-    pareto_front: list[ObjVec] = [objectives[i] for i in fronts[0]]
-    pareto_front.sort()
-
-    return pareto_front
+        if info is not None:
+            info.update(budget.report())
+            if cache is not None:
+                info["cache"] = cache.stats()
+            if archive is not None:
+                info["archive"] = archive.stats()
+
+        return pareto_front
@@ -1,7 +1,251 @@
 import numpy as np
 import pygmo as pg
-from typing import Callable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable
 from .protocol_nsga3 import Vector, Bounds, ObjVec
+from .budget import EvaluationBudget
+from utils.reference_index import das_dennis_divisions
+from utils.profiling import RunProfiler
+from utils.seeding import seed_all
+
+# Topologias de migração aceitas no modo arquipélago
+_TOPOLOGIES: dict[str, Callable[[], Any]] = {
+    "ring": pg.ring,
+    "fully_connected": pg.fully_connected,
+    "unconnected": pg.unconnected,
+}
+
+
+class PygmoProblem:
+    """
+    Problema definido pelo usuário (UDP) do pagmo sobre uma função multiobjetivo.
+
+    Expõe `batch_fitness`, que o pagmo usa nas avaliações em lote (ex.:
+    população inicial): se `functions` tiver um método `batch(X)` (como
+    `problems.dtlz2.DTLZ2`), a matriz inteira é avaliada de uma vez. As
+    avaliações são contadas pelo próprio pagmo (`problem.get_fevals()`). Para
+    ilhas em processos (`pg.mp_island`) o UDP é serializado, então `functions`
+    deve ser serializável.
+
+    :param functions: Função multiobjetivo f(x) -> Vector
+    :param bounds: Limites [(min, max), ...]
+    :param n_obj: Número de objetivos
+    """
+
+    def __init__(self, functions: Callable[[Vector], Vector], bounds: Bounds, n_obj: int):
+        self.functions = functions
+        self.bounds = [tuple(b) for b in bounds]
+        self.n_obj = n_obj
+
+    def fitness(self, x):
+        return np.asarray(self.functions(np.array(x, dtype=float)), dtype=float).tolist()
+
+    def batch_fitness(self, dvs):
+        X = np.asarray(dvs, dtype=float).reshape(-1, len(self.bounds))
+        batch = getattr(self.functions, "batch", None)
+        F = batch(X) if batch is not None else np.array([self.functions(x) for x in X])
+        return np.asarray(F, dtype=float).ravel()
+
+    def get_bounds(self):
+        xl = [b[0] for b in self.bounds]
+        xu = [b[1] for b in self.bounds]
+        return (xl, xu)
+
+    def get_nobj(self):
+        return self.n_obj
+
+    def get_name(self):
+        return "PygmoProblem"
+
+
+class PygmoNSGA3Session:
+    """
+    Sessão do NSGA-III no PyGMO para uma configuração fixa de problema.
+
+    O problema do pagmo (`pg.problem`) é construído uma única vez; `run`
+    executa otimizações sucessivas reaproveitando-o, em uma população única
+    ou, com `n_islands`, em um arquipélago de ilhas em processos com migração.
+
+    O NSGA-III do pagmo gera seus próprios pontos de referência (Das-Dennis)
+    a partir de `divisions`; `ref_points`, se informado, precisa ser uma grade
+    de Das-Dennis, cujo número de divisões é então usado.
+
+    :param functions: Função multiobjetivo f(x) -> Vector
+    :param bounds: Limites [(min, max), ...]
+    :param divisions: Divisões dos pontos de referência
+    :param ref_points: Pontos de referência (grade de Das-Dennis)
+    """
+
+    def __init__(
+        self,
+        functions: Callable[[Vector], Vector],
+        bounds: Bounds,
+        divisions: int = 10,
+        ref_points: Vector | None = None
+    ):
+        self.functions = functions
+        self.bounds = bounds
+
+        if ref_points is not None:
+            ref_divisions = das_dennis_divisions(np.asarray(ref_points, dtype=float))
+            if ref_divisions is None:
+                raise ValueError("O NSGA-III do PyGMO só aceita pontos de referência de Das-Dennis")
+            divisions = ref_divisions
+        self.divisions = divisions
+
+        # Número de variáveis e objetivos
+        n_var = len(bounds)
+        test_obj = functions(np.zeros(n_var))
+        if not isinstance(test_obj, np.ndarray):
+            raise ValueError("A função multiobjetivo deve retornar np.ndarray")
+        self.n_obj = test_obj.shape[0]
+
+        self.problem = pg.problem(PygmoProblem(functions, bounds, self.n_obj))
+
+    def run(
+        self,
+        pop_size: int,
+        generations: int,
+        crossover: Callable[[Vector, Vector], tuple[Vector, Vector]] = None,
+        mutation: Callable[[Vector, Bounds], Vector] = None,
+        initial_pop: list[Vector] | None = None,
+        max_evals: int | None = None,
+        time_budget: float | None = None,
+        callback: Callable[[int, Vector], bool] | None = None,
+        seed: int | None = None,
+        info: dict[str, Any] | None = None,
+        n_islands: int | None = None,
+        topology: str = "ring",
+        migration_interval: int = 1,
+        migration_rate: int | float = 1
+    ) -> list[ObjVec]:
+        """Executa uma otimização; parâmetros com o mesmo significado de `nsga3_pygmo_func`."""
+        if seed is not None:
+            seed_all(seed)
+
+        budget = EvaluationBudget(self.functions, max_evals, time_budget, callback)
+        seed_kwargs = {} if seed is None else {"seed": seed}
+
+        if n_islands is not None:
+            if initial_pop:
+                raise ValueError("initial_pop não é suportado no modo arquipélago (n_islands)")
+            F = self._run_archipelago(
+                pop_size, generations, budget, seed_kwargs,
+                n_islands, topology, migration_interval, migration_rate
+            )
+        else:
+            F = self._run_population(pop_size, generations, initial_pop, budget, seed_kwargs)
+
+        # Extrair fronteira de Pareto (não-dominados)
+        nds = pg.fast_non_dominated_sorting(F)[0][0]
+        pareto_front = [tuple(F[i]) for i in nds]
+
+        if info is not None:
+            info.update(budget.report())
+
+        return pareto_front
+
+    def _run_population(
+        self,
+        pop_size: int,
+        generations: int,
+        initial_pop: list[Vector] | None,
+        budget: EvaluationBudget,
+        seed_kwargs: dict
+    ) -> np.ndarray:
+        prob = self.problem
+
+        # Algoritmo NSGA-III do PyGMO: com orçamento ou callback, evolui uma
+        # geração por vez para verificar avaliações/tempo/convergência entre gerações
+        use_budget = budget.max_evals is not None or budget.time_budget is not None or budget.callback is not None
+        algo = pg.algorithm(pg.nsga3(gen=1 if use_budget else generations, divisions=self.divisions, **seed_kwargs))
+
+        # População inicial (avaliada em lote por `batch_fitness`)
+        if initial_pop:
+            pop = pg.population(prob, **seed_kwargs)
+            for ind in initial_pop:
+                pop.push_back(ind.tolist())
+        else:
+            pop = pg.population(prob, size=pop_size, b=pg.bfe(), **seed_kwargs)
+
+        # Evolve
+        if use_budget:
+            for gen in range(generations):
+                budget.n_evals = pop.problem.get_fevals()
+                if budget.exhausted():
+                    break
+                pop = algo.evolve(pop)
+                budget.notify(pop.get_f())
+        else:
+            pop = algo.evolve(pop)
+            budget.n_gen = generations
+        budget.n_evals = pop.problem.get_fevals()
+        return pop.get_f()
+
+    def _run_archipelago(
+        self,
+        pop_size: int,
+        generations: int,
+        budget: EvaluationBudget,
+        seed_kwargs: dict,
+        n_islands: int,
+        topology: str,
+        migration_interval: int,
+        migration_rate: int | float
+    ) -> np.ndarray:
+        if topology not in _TOPOLOGIES:
+            raise ValueError(f"topology deve ser um de {sorted(_TOPOLOGIES)}")
+        # Cada rodada evolui `migration_interval` gerações em todas as ilhas, em
+        # paralelo, seguidas de migração entre vizinhas da topologia
+        archi = pg.archipelago(
+            n=n_islands,
+            t=pg.topology(_TOPOLOGIES[topology]()),
+            algo=pg.algorithm(pg.nsga3(gen=migration_interval, divisions=self.divisions, **seed_kwargs)),
+            prob=self.problem,
+            pop_size=pop_size,
+            udi=pg.mp_island(),
+            b=pg.bfe(),
+            r_pol=pg.r_policy(pg.fair_replace(rate=migration_rate)),
+            s_pol=pg.s_policy(pg.select_best(rate=migration_rate)),
+            **seed_kwargs
+        )
+        rng = np.random.default_rng(seed_kwargs.get("seed"))
+        round_gens = migration_interval
+
+        def set_round_gens(gens: int) -> None:
+            # Rodadas mais curtas (a última, ou a limitada por `max_evals`) trocam o
+            # algoritmo de cada ilha, com sementes derivadas da semente da execução
+            nonlocal round_gens
+            if gens != round_gens:
+                for island in archi:
+                    seed = int(rng.integers(2 ** 31))
+                    island.set_algorithm(pg.algorithm(pg.nsga3(gen=gens, divisions=self.divisions, seed=seed)))
+                round_gens = gens
+
+        def gather() -> np.ndarray:
+            # Os `pop_size` melhores da união das ilhas (ordenação não-dominada e
+            # crowding), para a fronteira ter o tamanho das demais implementações
+            populations = [island.get_population() for island in archi]
+            budget.n_evals = sum(pop.problem.get_fevals() for pop in populations)
+            F = np.vstack([pop.get_f() for pop in populations])
+            return F[pg.select_best_N_mo(F, pop_size)]
+
+        gather()
+        evals_per_gen = n_islands * pop_size
+        done = 0
+        while done < generations and not budget.exhausted():
+            gens = min(migration_interval, generations - done)
+            if budget.max_evals is not None:
+                # No máximo uma geração do arquipélago além de `max_evals`
+                gens = min(gens, -(-(budget.max_evals - budget.n_evals) // evals_per_gen))
+            set_round_gens(gens)
+            archi.evolve()
+            archi.wait_check()
+            done += gens
+            budget.n_gen += gens - 1
+            budget.notify(gather())
+        return gather()
 
 
 def nsga3_pygmo_func(
@@ -12,59 +256,57 @@ def nsga3_pygmo_func(
     crossover: Callable[[Vector, Vector], tuple[Vector, Vector]],  # ignorado (PyGMO tem os seus)
     mutation: Callable[[Vector, Bounds], Vector],                  # idem
     initial_pop: list[Vector] | None = None,
-    divisions: int = 10,   # não usado explicitamente (PyGMO gere internamente)
-    ref_points: Vector | None = None
+    divisions: int = 10,
+    ref_points: Vector | None = None,
+    max_evals: int | None = None,
+    time_budget: float | None = None,
+    callback: Callable[[int, Vector], bool] | None = None,
+    seed: int | None = None,
+    info: dict[str, Any] | None = None,
+    n_islands: int | None = None,
+    topology: str = "ring",
+    migration_interval: int = 1,
+    migration_rate: int | float = 1,
+    profile: str | Path | None = None
 ) -> list[ObjVec]:
     """
     Resolve NSGA-III usando PyGMO (pagmo).
     O crossover/mutação customizados não são usados aqui, 
     pois o PyGMO encapsula o algoritmo completo.
+    Para muitas execuções da mesma configuração, use `PygmoNSGA3Session`.
 
     :param pop_size: Tamanho da população
     :param generations: Número de gerações
     :param bounds: Limites [(min, max), ...]
-    :param functions: Função multiobjetivo f(x) -> Vector
+    :param functions: Função multiobjetivo f(x) -> Vector (com `batch(X)`, avaliada em lote)
+    :param divisions: Divisões dos pontos de referência (repassadas ao `pg.nsga3`)
+    :param ref_points: Pontos de referência; precisam formar uma grade de Das-Dennis
+    :param max_evals: Número máximo de avaliações (critério de parada adicional)
+    :param time_budget: Tempo máximo de parede em segundos (critério de parada adicional)
+    :param callback: Função callback(gen, F) chamada a cada geração; retornando True a execução para
+    :param seed: Semente do PyGMO e dos geradores globais (None = aleatória)
+    :param info: Dicionário opcional preenchido com avaliações, gerações e tempo consumidos
+    :param n_islands: Se informado, evolui um arquipélago com esse número de ilhas em
+        processos (`pg.mp_island`), cada uma com `pop_size` indivíduos; a fronteira é
+        extraída dos `pop_size` melhores da união das populações (comparável à das
+        demais implementações). `max_evals` limita cada rodada para exceder o orçamento
+        em no máximo uma geração do arquipélago; `time_budget` e `callback` são
+        verificados entre rodadas. Não aceita `initial_pop`
+    :param topology: Topologia de migração: "ring", "fully_connected" ou "unconnected"
+    :param migration_interval: Gerações entre migrações
+    :param migration_rate: Migrantes por migração (inteiro) ou fração da população
+    :param profile: Se informado, perfila a execução (só o processo principal) e salva o
+        perfil nesse arquivo (ver `utils.profiling.RunProfiler`)
     :return: Fronteira de Pareto aproximada
     """
+    session = PygmoNSGA3Session(functions, bounds, divisions, ref_points)
+    with RunProfiler(profile) if profile is not None else nullcontext():
+        return session.run(
+            pop_size, generations, crossover, mutation, initial_pop,
+            max_evals=max_evals, time_budget=time_budget, callback=callback, seed=seed, info=info,
+            n_islands=n_islands, topology=topology,
+            migration_interval=migration_interval, migration_rate=migration_rate,
+        )
 
-    # Número de variáveis e objetivos
-    n_var = len(bounds)
-    test_obj = functions(np.zeros(n_var))
-    if not isinstance(test_obj, np.ndarray):
-        raise ValueError("A função multiobjetivo deve retornar np.ndarray")
-    n_obj = test_obj.shape[0]
-
-    # Definição do problema no estilo PyGMO
-    class PyGMOProblem:
-        def fitness(self, x):
-            return functions(np.array(x, dtype=float)).tolist()
-
-        def get_bounds(self):
-            xl = [b[0] for b in bounds]
-            xu = [b[1] for b in bounds]
-            return (xl, xu)
-
-        def get_nobj(self):
-            return n_obj
-
-    prob = pg.problem(PyGMOProblem())
-
-    # Algoritmo NSGA-III do PyGMO
-    algo = pg.algorithm(pg.nsga3(gen=generations))
-
-    # População inicial
-    if initial_pop:
-        pop = pg.population(prob)
-        for ind in initial_pop:
-            pop.push_back(ind.tolist())
-    else:
-        pop = pg.population(prob, size=pop_size)
-
-    # Evolve
-    pop = algo.evolve(pop)
-
-    # Extrair fronteira de Pareto (não-dominados)
-    nds = pop.get_non_dominated_front()
-    pareto_front = [tuple(pop.get_f()[i]) for i in nds]
 
-    return pareto_front
+nsga3_pygmo_func.session_factory = PygmoNSGA3Session
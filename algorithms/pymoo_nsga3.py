@@ -2,13 +2,249 @@ from pymoo.algorithms.moo.nsga3 import NSGA3
 from pymoo.util.ref_dirs import get_reference_directions
 from pymoo.core.problem import Problem
 from pymoo.core.crossover import Crossover
+from pymoo.core.duplicate import DuplicateElimination, NoDuplicateElimination
 from pymoo.core.mutation import Mutation
 from pymoo.core.population import Population
+from pymoo.core.termination import Termination
 from pymoo.optimize import minimize
 import numpy as np
-from typing import Callable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable
 from .protocol_nsga3 import Vector, Bounds, ObjVec
-    
+from .budget import EvaluationBudget
+from .duplicates import check_tolerance, row_keys, unique_mask
+from utils.profiling import RunProfiler
+from utils.seeding import seed_all
+
+
+class BudgetTermination(Termination):
+    """
+    Critério de parada do PyMoo que combina o número máximo de gerações
+    com o orçamento de avaliações/tempo compartilhado pelas implementações.
+    O `minimize` do PyMoo copia o critério (deepcopy); por isso o orçamento é
+    consultado por meio de closures, que não são duplicadas na cópia.
+
+    O PyMoo conta a população inicial como a geração 1 (`algorithm.n_gen`); aqui,
+    como nas demais implementações, `n_max_gen` conta só as gerações após a
+    inicialização, e `notify` (callback) é chamado apenas ao fim de cada uma delas.
+    """
+    def __init__(self, n_max_gen: int, budget: EvaluationBudget):
+        super().__init__()
+        self.n_max_gen = n_max_gen
+        self.notify = lambda F: budget.notify(F)
+        self.exhausted = lambda: budget.exhausted()
+
+    def _update(self, algorithm) -> float:
+        gen = algorithm.n_gen - 1
+        if gen > 0:
+            self.notify(algorithm.pop.get("F"))
+        if self.exhausted():
+            return 1.0
+        return gen / self.n_max_gen if self.n_max_gen > 0 else 1.0
+
+
+class HashDuplicateElimination(DuplicateElimination):
+    """
+    Eliminação de duplicatas do PyMoo por hash do vetor de decisão, em O(N) no
+    lugar da matriz de distâncias O(N²) da eliminação padrão. Com `tol`, os
+    vetores são quantizados em uma grade de passo `tol` antes do hash.
+    """
+    def __init__(self, tol: float | None = None):
+        super().__init__()
+        check_tolerance(tol)
+        self.tol = tol
+
+    def _do(self, pop, other, is_duplicate):
+        exclude = row_keys(other.get("X"), self.tol) if other is not None else None
+        is_duplicate[~unique_mask(pop.get("X"), self.tol, exclude)] = True
+        return is_duplicate
+
+
+class CustomCrossover(Crossover):
+    """
+    Adapta o crossover do projeto ao PyMoo. Se o operador oferecer `batch`
+    (ver `SBXCrossover`), a matriz de cruzamentos inteira é repassada de uma
+    vez; caso contrário, o operador escalar é chamado para cada par.
+    """
+    def __init__(self, func: Callable[[Vector, Vector], Vector]):
+        super().__init__(n_parents=2, n_offsprings=2)
+        self.func = func
+
+    def _do(self, problem, X, **kwargs):
+        # Corrente do PyMoo: X.shape = (n_parents, n_matings, n_var)
+        n_parents, n_matings, n_var_local = X.shape
+        assert n_parents == 2, "Este crossover requer 2 pais."
+        assert n_var_local == problem.n_var, "Dimensão de variáveis inconsistente."
+
+        # Operador em lote: pais (n_matings, n_var) de uma vez
+        if hasattr(self.func, "batch"):
+            c1, c2 = self.func.batch(X[0], X[1])
+            return np.stack([c1, c2])
+
+        # Saída no formato exigido
+        Q = np.empty((self.n_offsprings, n_matings, n_var_local), dtype=float)
+
+        for k in range(n_matings):
+            p1: Vector = np.asarray(X[0, k, :], dtype=float)
+            p2: Vector = np.asarray(X[1, k, :], dtype=float)
+            c1, c2 = self.func(p1, p2)
+            c1 = np.asarray(c1, dtype=float).reshape(n_var_local)
+            c2 = np.asarray(c2, dtype=float).reshape(n_var_local)
+            Q[0, k, :] = c1
+            Q[1, k, :] = c2
+
+        return Q
+
+
+class CustomMutation(Mutation):
+    """
+    Adapta a mutação do projeto ao PyMoo; usa `batch` sobre a matriz da
+    população quando o operador o oferece (ver `PolynomialMutation`).
+    """
+    def __init__(self, func: Callable[[Vector, Bounds], Vector], bounds: Bounds):
+        super().__init__()
+        self.func = func
+        self.bounds = bounds
+
+    def _do(self, problem, X, **kwargs):
+        if hasattr(self.func, "batch"):
+            return np.asarray(self.func.batch(X, self.bounds), dtype=float)
+        Y = np.empty_like(X, dtype=float)
+        for i, ind in enumerate(X):
+            yi = np.asarray(self.func(ind, self.bounds), dtype=float).reshape(problem.n_var)
+            Y[i, :] = yi
+        return Y
+
+
+class PymooNSGA3Session:
+    """
+    Sessão do NSGA-III no PyMoo para uma configuração fixa de problema.
+
+    O problema do PyMoo e as direções de referência são construídos uma única
+    vez; `run` executa otimizações sucessivas reaproveitando essa preparação.
+    O orçamento de cada execução é consultado pelo problema por meio da sessão.
+
+    :param functions: Função multiobjetivo f(x) -> Vector ou lista de funções escalares
+    :param bounds: Limites [(min, max), ...]
+    :param divisions: Número de divisões das direções de referência
+    :param ref_points: Direções de referência (None = Das-Dennis com `divisions`)
+    """
+
+    def __init__(
+        self,
+        functions: Callable[[Vector], Vector],
+        bounds: Bounds,
+        divisions: int = 10,
+        ref_points: Vector = None
+    ):
+        self.functions = functions
+        self.bounds = bounds
+        self._budget: EvaluationBudget | None = None
+
+        # Número de objetivos
+        if isinstance(functions, list):
+            n_obj = len(functions)
+        elif callable(functions):
+            test_obj = functions(np.zeros(len(bounds)))
+            if not isinstance(test_obj, Vector):
+                raise ValueError("A função multiobjetivo deve retornar Vector")
+            n_obj = test_obj.shape[0]
+        else:
+            raise ValueError("Parâmetro 'functions' inválido")
+        self.n_obj = n_obj
+
+        n_var = len(bounds)
+        session = self
+
+        # Definir o problema personalizado para PyMoo
+        class CustomProblem(Problem):
+            def __init__(self):
+                super().__init__(n_var=n_var, 
+                                 n_obj=n_obj, 
+                                 xl=np.array([b[0] for b in bounds]), 
+                                 xu=np.array([b[1] for b in bounds]))
+            
+            def _evaluate(self, X, out, *args, **kwargs):
+                budget = session._budget
+                if isinstance(functions, list):
+                    budget.n_evals += len(X)
+                    out["F"] = np.array([[f(ind) for f in functions] for ind in X])
+                elif callable(functions):
+                    out["F"] = np.array([budget(ind) for ind in X])
+
+        self.problem = CustomProblem()
+
+        # Direções de referência para NSGA-III
+        if ref_points is None:
+            ref_points = get_reference_directions("das-dennis", n_dim=n_obj, n_partitions=divisions)
+        self.ref_points = ref_points
+
+    def run(
+        self,
+        pop_size: int,
+        generations: int,
+        crossover: Callable[[Vector, Vector], tuple[Vector,Vector]],
+        mutation: Callable[[Vector, Bounds], Vector],
+        initial_pop: list[Vector] = None,
+        max_evals: int | None = None,
+        time_budget: float | None = None,
+        callback: Callable[[int, Vector], bool] | None = None,
+        seed: int | None = None,
+        info: dict[str, Any] | None = None,
+        eliminate_duplicates: bool | float | None = None
+    ) -> list[ObjVec]:
+        """Executa uma otimização; parâmetros com o mesmo significado de `nsga3_pymoo_func`."""
+        if seed is not None:
+            seed_all(seed)
+
+        budget = EvaluationBudget(self.functions, max_evals, time_budget, callback)
+        self._budget = budget
+
+        # Configuração inicial da população, se fornecida
+        initial_population = None
+        if initial_pop:
+            initial_population = Population.new("X", np.array(initial_pop))
+
+        # Configurar algoritmo NSGA-III (None mantém a eliminação padrão do PyMoo)
+        duplicates = {}
+        if eliminate_duplicates is False:
+            duplicates["eliminate_duplicates"] = NoDuplicateElimination()
+        elif eliminate_duplicates is not None:
+            duplicates["eliminate_duplicates"] = HashDuplicateElimination(
+                None if eliminate_duplicates is True else float(eliminate_duplicates)
+            )
+        algorithm = NSGA3(
+            pop_size=pop_size,
+            ref_dirs=self.ref_points,
+            crossover=CustomCrossover(crossover),
+            mutation=CustomMutation(mutation, self.bounds),
+            **duplicates,
+        )
+
+        # Resolver o problema
+        try:
+            result = minimize(
+                self.problem,
+                algorithm,
+                termination=BudgetTermination(generations, budget),
+                seed=1 if seed is None else seed,
+                verbose=False,
+                save_history=False,
+                initial_population=initial_population,
+            )
+        finally:
+            self._budget = None
+
+        # Extrair a solução
+        pareto_front = [tuple(ind) for ind in result.F]
+
+        if info is not None:
+            info.update(budget.report())
+
+        return pareto_front
+
+
 def nsga3_pymoo_func(
     pop_size: int,
     generations: int,
@@ -18,113 +254,35 @@ def nsga3_pymoo_func(
     mutation: Callable[[Vector, Bounds], Vector],
     initial_pop: list[Vector] = None,
     divisions: int = 10,
-    ref_points: Vector = None
+    ref_points: Vector = None,
+    max_evals: int | None = None,
+    time_budget: float | None = None,
+    callback: Callable[[int, Vector], bool] | None = None,
+    seed: int | None = None,
+    info: dict[str, Any] | None = None,
+    eliminate_duplicates: bool | float | None = None,
+    profile: str | Path | None = None
 ) -> list[ObjVec]:
     """
     Utiliza PyMoo para resolver o NSGA-III com os parâmetros especificados.
-    """    
-    # Número de objetivos
-    if isinstance(functions, list):
-        n_obj = len(functions)
-    elif callable(functions):
-        test_obj = functions(np.zeros(len(bounds)))
-        if not isinstance(test_obj, Vector):
-            raise ValueError("A função multiobjetivo deve retornar Vector")
-        n_obj = test_obj.shape[0]
-    else:
-        raise ValueError("Parâmetro 'functions' inválido")
-
-    n_var = len(bounds)
-
-    # Definir o problema personalizado para PyMoo
-    class CustomProblem(Problem):
-        def __init__(self):
-            super().__init__(n_var=n_var, 
-                             n_obj=n_obj, 
-                             xl=np.array([b[0] for b in bounds]), 
-                             xu=np.array([b[1] for b in bounds]))
-        
-        def _evaluate(self, X, out, *args, **kwargs):
-            if isinstance(functions, list):
-                out["F"] = np.array([[f(ind) for f in functions] for ind in X])
-            elif callable(functions):
-                out["F"] = np.array([functions(ind) for ind in X])
-
-    problem = CustomProblem()
-
-    # Direções de referência para NSGA-III
-    if ref_points is None:
-        ref_points = get_reference_directions("das-dennis", n_dim=n_obj, n_partitions=divisions)
-
-    # Configurar operadores personalizados
-    class CustomCrossover(Crossover):
-        def __init__(self, func: Callable[[Vector, Vector], Vector]):
-            super().__init__(n_parents=2, n_offsprings=2)
-            self.func = func
-
-        def _do(self, problem, X, **kwargs):
-            # Corrente do PyMoo: X.shape = (n_parents, n_matings, n_var)
-            n_parents, n_matings, n_var_local = X.shape
-            assert n_parents == 2, "Este crossover requer 2 pais."
-            assert n_var_local == problem.n_var, "Dimensão de variáveis inconsistente."
-
-            # Saída no formato exigido
-            Q = np.empty((self.n_offsprings, n_matings, n_var_local), dtype=float)
-
-            for k in range(n_matings):
-                p1: Vector = np.asarray(X[0, k, :], dtype=float)
-                p2: Vector = np.asarray(X[1, k, :], dtype=float)
-                c1, c2 = self.func(p1, p2)
-                c1 = np.asarray(c1, dtype=float).reshape(n_var_local)
-                c2 = np.asarray(c2, dtype=float).reshape(n_var_local)
-                Q[0, k, :] = c1
-                Q[1, k, :] = c2
-
-            return Q
-
-    crossover_operator = CustomCrossover(crossover)
-    
-    class CustomMutation(Mutation):
-        def __init__(self, func: Callable[[Vector, Bounds], Vector], bounds: Bounds):
-            super().__init__()
-            self.func = func
-            self.bounds = bounds
-
-        def _do(self, problem, X, **kwargs):
-            Y = np.empty_like(X, dtype=float)
-            for i, ind in enumerate(X):
-                yi = np.asarray(self.func(ind, self.bounds), dtype=float).reshape(problem.n_var)
-                Y[i, :] = yi
-            return Y
-    
-    mutation_operator = CustomMutation(mutation, bounds)
-
-    # Configuração inicial da população, se fornecida
-    initial_population = None
-    if initial_pop:
-        initial_population = Population.new("X", np.array(initial_pop))
-
-    # Configurar algoritmo NSGA-III
-    algorithm = NSGA3(
-        pop_size=pop_size,
-        ref_dirs=ref_points,
-        crossover=crossover_operator,
-        mutation=mutation_operator,
-    )
-
-    # Resolver o problema
-    result = minimize(
-        problem,
-        algorithm,
-        termination=('n_gen', generations),
-        seed=1,
-        verbose=False,
-        save_history=False,
-        initial_population=initial_population,
-    )
-
-    # Extrair a solução
-    pareto_front = [tuple(ind) for ind in result.F]
-
-    return pareto_front
+    A execução termina ao atingir `generations`, `max_evals`, `time_budget` ou
+    quando `callback(gen, F)` retornar True, o que ocorrer primeiro; o consumo
+    efetivo é registrado em `info`. `seed` semeia o PyMoo e os geradores
+    globais usados pelos operadores (padrão: semente 1 do PyMoo).
+    `eliminate_duplicates=None` mantém a eliminação padrão do PyMoo; True usa
+    eliminação por hash, um float define a tolerância do hash e False desativa
+    a eliminação.
+    Com `profile`, a otimização é perfilada e o perfil salvo nesse arquivo (ver
+    `utils.profiling.RunProfiler`).
+    Para muitas execuções da mesma configuração, use `PymooNSGA3Session`.
+    """
+    session = PymooNSGA3Session(functions, bounds, divisions, ref_points)
+    with RunProfiler(profile) if profile is not None else nullcontext():
+        return session.run(
+            pop_size, generations, crossover, mutation, initial_pop,
+            max_evals=max_evals, time_budget=time_budget, callback=callback, seed=seed, info=info,
+            eliminate_duplicates=eliminate_duplicates,
+        )
+
 
+nsga3_pymoo_func.session_factory = PymooNSGA3Session
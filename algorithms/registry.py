@@ -0,0 +1,75 @@
+import importlib
+import importlib.util
+from .protocol_nsga3 import NSGA3Callable
+
+# Implementações conhecidas: nome -> ("módulo:atributo", bibliotecas exigidas).
+# O módulo (e a biblioteca do backend) só é importado no primeiro uso.
+_BACKENDS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "nsga3_func": ("algorithms.pure_nsga3:nsga3_func", ()),
+    "nsga3_deap_func": ("algorithms.deap_nsga3:nsga3_deap_func", ("deap",)),
+    "nsga3_pymoo_func": ("algorithms.pymoo_nsga3:nsga3_pymoo_func", ("pymoo",)),
+    "nsga3_pygmo_func": ("algorithms.pygmo_nsga3:nsga3_pygmo_func", ("pygmo",)),
+}
+
+# Nomes curtos aceitos como sinônimos
+_ALIASES: dict[str, str] = {
+    "pure": "nsga3_func",
+    "deap": "nsga3_deap_func",
+    "pymoo": "nsga3_pymoo_func",
+    "pygmo": "nsga3_pygmo_func",
+}
+
+_loaded: dict[str, NSGA3Callable] = {}
+
+
+def register_backend(name: str, target: str, requires: tuple[str, ...] = ()) -> None:
+    """
+    Registra uma implementação `NSGA3Callable` pelo nome.
+
+    :param name: Nome da implementação (usado nos resultados)
+    :param target: Caminho "módulo:atributo" da função
+    :param requires: Bibliotecas que o módulo importa (para `available_backends`)
+    """
+    _BACKENDS[name] = (target, tuple(requires))
+    _loaded.pop(name, None)
+
+
+def available_backends() -> list[str]:
+    """Nomes registrados cujas bibliotecas estão instaladas (sem importá-las)."""
+    return [
+        name for name, (_, requires) in _BACKENDS.items()
+        if all(importlib.util.find_spec(lib) is not None for lib in requires)
+    ]
+
+
+def get_backend(name: str) -> NSGA3Callable:
+    """Importa (na primeira chamada) e retorna a implementação registrada como `name`."""
+    name = _ALIASES.get(name, name)
+    if name in _loaded:
+        return _loaded[name]
+    if name not in _BACKENDS:
+        raise ValueError(f"Implementação desconhecida: {name!r} (disponíveis: {sorted(_BACKENDS)})")
+
+    target, requires = _BACKENDS[name]
+    module_name, attr = target.split(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        raise ImportError(f"A implementação {name!r} requer {', '.join(requires) or module_name}: {exc}") from exc
+    func = getattr(module, attr)
+    _loaded[name] = func
+    return func
+
+
+def resolve_backend(implementation: str | NSGA3Callable) -> NSGA3Callable:
+    """Aceita o nome registrado ou a própria função."""
+    if isinstance(implementation, str):
+        return get_backend(implementation)
+    return implementation
+
+
+def backend_name(implementation: str | NSGA3Callable) -> str:
+    """Nome da implementação sem importá-la (o `__name__` da função)."""
+    if isinstance(implementation, str):
+        return _ALIASES.get(implementation, implementation)
+    return implementation.__name__
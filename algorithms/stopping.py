@@ -0,0 +1,134 @@
+from collections import deque
+import numpy as np
+from .protocol_nsga3 import Vector
+
+
+def non_dominated_mask(F: Vector) -> Vector:
+    """
+    Máscara booleana dos pontos não-dominados de F (minimização), vetorizada.
+
+    :param F: np.ndarray de shape (N, M)
+    :return: np.ndarray de shape (N,), True para os não-dominados
+    """
+    F = np.asarray(F, dtype=float)
+    leq = np.all(F[:, None, :] <= F[None, :, :], axis=2)
+    lt = np.any(F[:, None, :] < F[None, :, :], axis=2)
+    dominated = np.any(leq & lt, axis=0)
+    return ~dominated
+
+
+class StagnationStopping:
+    """
+    Critério de parada por convergência baseado em indicadores online baratos.
+
+    A cada geração recebe a matriz de objetivos da população e calcula um
+    indicador de progresso. A execução é interrompida quando o indicador fica
+    abaixo de `tol` durante `window` gerações consecutivas.
+
+    Indicadores disponíveis:
+    - "ideal_nadir": maior deslocamento dos pontos ideal e nadir, normalizado
+      pela amplitude atual da população;
+    - "igd": variação do IGD em relação a uma fronteira de referência cacheada;
+    - "nd_fraction": fração de soluções não-dominadas que não estavam no
+      conjunto não-dominado da geração anterior.
+
+    Pode ser passado diretamente como `callback` das implementações do NSGA-III.
+
+    :param indicator: Nome do indicador
+    :param tol: Tolerância abaixo da qual a geração é considerada estagnada
+    :param window: Número de gerações estagnadas consecutivas para parar
+    :param ref_front: Fronteira de referência (obrigatória para "igd")
+    :param min_gen: Número mínimo de gerações antes de permitir a parada
+    """
+
+    INDICATORS = ("ideal_nadir", "igd", "nd_fraction")
+
+    def __init__(
+        self,
+        indicator: str = "ideal_nadir",
+        tol: float = 1e-3,
+        window: int = 3,
+        ref_front: Vector | None = None,
+        min_gen: int = 1
+    ):
+        if indicator not in self.INDICATORS:
+            raise ValueError(f"Indicador desconhecido: {indicator}")
+        if indicator == "igd" and ref_front is None:
+            raise ValueError("O indicador 'igd' requer ref_front")
+        self.indicator = indicator
+        self.tol = tol
+        self.window = window
+        self.min_gen = min_gen
+
+        # Fronteira de referência e normas quadradas pré-calculadas
+        self.ref_front: Vector | None = None
+        self._ref_sq: Vector | None = None
+        if ref_front is not None:
+            self.ref_front = np.asarray(ref_front, dtype=float)
+            self._ref_sq = np.sum(self.ref_front ** 2, axis=1)
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.history: list[float] = []
+        self._recent: deque[float] = deque(maxlen=self.window)
+        self._prev: Vector | float | set[bytes] | None = None
+
+    def get_state(self) -> dict:
+        """Estado do critério, salvo nos checkpoints das implementações (ver `set_state`)."""
+        return {"history": list(self.history), "recent": list(self._recent), "prev": self._prev}
+
+    def set_state(self, state: dict) -> None:
+        self.history = list(state["history"])
+        self._recent = deque(state["recent"], maxlen=self.window)
+        self._prev = state["prev"]
+
+    def __call__(self, gen: int, F: Vector) -> bool:
+        F = np.asarray(F, dtype=float)
+        value = self._progress(F)
+        if value is None:
+            return False
+        self.history.append(value)
+        self._recent.append(value)
+        return (
+            gen >= self.min_gen
+            and len(self._recent) == self.window
+            and max(self._recent) <= self.tol
+        )
+
+    def _progress(self, F: Vector) -> float | None:
+        if self.indicator == "ideal_nadir":
+            return self._ideal_nadir_movement(F)
+        if self.indicator == "igd":
+            return self._igd_change(F)
+        return self._new_nd_fraction(F)
+
+    def _ideal_nadir_movement(self, F: Vector) -> float | None:
+        ideal = np.min(F, axis=0)
+        nadir = np.max(F, axis=0)
+        prev, self._prev = self._prev, (ideal, nadir)
+        if prev is None:
+            return None
+        prev_ideal, prev_nadir = prev
+        scale = nadir - ideal
+        scale[scale == 0] = 1
+        delta_ideal = np.max(np.abs(ideal - prev_ideal) / scale)
+        delta_nadir = np.max(np.abs(nadir - prev_nadir) / scale)
+        return float(max(delta_ideal, delta_nadir))
+
+    def _igd_change(self, F: Vector) -> float | None:
+        # ||z - a||^2 = ||z||^2 + ||a||^2 - 2 z.a, reaproveitando ||z||^2 da referência
+        sq = self._ref_sq[:, None] + np.sum(F ** 2, axis=1)[None, :] - 2 * self.ref_front @ F.T
+        value = float(np.mean(np.sqrt(np.maximum(np.min(sq, axis=1), 0))))
+        prev, self._prev = self._prev, value
+        if prev is None:
+            return None
+        return abs(prev - value) / max(abs(prev), 1e-12)
+
+    def _new_nd_fraction(self, F: Vector) -> float | None:
+        nd = F[non_dominated_mask(F)]
+        keys = {row.tobytes() for row in nd}
+        prev, self._prev = self._prev, keys
+        if prev is None:
+            return None
+        return sum(1 for k in keys if k not in prev) / len(keys)
@@ -1,9 +1,11 @@
 import numpy as np
+from utils.reference_index import ReferenceIndex
 
 def count_points_per_niche_dtlz2(
     pareto_front: np.ndarray,
     ref_points: np.ndarray,
-    r: float
+    r: float,
+    index: ReferenceIndex | None = None
 ) -> tuple[np.ndarray, int]:
     """
     Conta quantos pontos da fronteira estão a menos que r de cada ponto de referência
@@ -12,26 +14,25 @@ def count_points_per_niche_dtlz2(
     :param pareto_front: np.ndarray de shape (N, M), pontos da fronteira aproximada
     :param ref_points: np.ndarray de shape (K, M), pontos de referência
     :param r: raio de associação
+    :param index: Índice sobre `ref_points` (ver `utils.reference_index`), para
+        reaproveitá-lo entre chamadas; criado aqui se omitido
     :return: (counts, n_fora)
              counts -> array de shape (K,), com número de pontos associados a cada ref
              n_out -> número de pontos que não caíram em nenhum nicho
     """
     pareto_front = np.asarray(pareto_front, dtype=float)
+    if index is None:
+        index = ReferenceIndex(ref_points)
 
-    # Projetar ref_points na hiperesfera (DTLZ2)
-    proj_refs = ref_points / np.linalg.norm(ref_points, axis=1, keepdims=True)
+    counts = np.zeros(len(index), dtype=int)
+    if len(pareto_front) == 0:
+        return counts, 0
 
-    counts = np.zeros(len(proj_refs), dtype=int)
-    n_out = 0
-
-    for p in pareto_front:
-        # Distâncias até todos os pontos de referência
-        dist = np.linalg.norm(proj_refs - p, axis=1)
-        min_idx = np.argmin(dist)
-        if dist[min_idx] <= r:
-            counts[min_idx] += 1
-        else:
-            n_out += 1
+    # Ponto de referência projetado na hiperesfera (DTLZ2) mais próximo de cada ponto
+    nearest, dist = index.nearest_direction(pareto_front)
+    inside = dist <= r
+    counts += np.bincount(nearest[inside], minlength=len(index))
+    n_out = int(np.sum(~inside))
 
     return counts, n_out
 
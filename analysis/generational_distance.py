@@ -1,7 +1,7 @@
 import numpy as np
 from algorithms.protocol_nsga3 import ObjVec
 
-def gd(approx_front: list[ObjVec], true_front: np.ndarray) -> float:
+def gd(approx_front: list[ObjVec], true_front: np.ndarray, dtype: str | np.dtype = "float64") -> float:
     """
     Generational Distance (GD).
     
@@ -12,9 +12,11 @@ def gd(approx_front: list[ObjVec], true_front: np.ndarray) -> float:
     
     :param approx_front: np.ndarray, shape (N, M) = fronteira aproximada
     :param true_front: np.ndarray, shape (K, M) = fronteira de Pareto verdadeira
+    :param dtype: Precisão das distâncias ("float64" ou "float32")
     :return: float, valor do GD
     """
-    approx_front = np.asarray(approx_front, dtype=float)
+    approx_front = np.asarray(approx_front, dtype=dtype)
+    true_front = np.asarray(true_front, dtype=dtype)
 
     if approx_front.ndim != 2 or true_front.ndim != 2:
         raise ValueError("As entradas devem ser matrizes 2D (N x M e K x M).")
@@ -26,15 +28,17 @@ def gd(approx_front: list[ObjVec], true_front: np.ndarray) -> float:
 
     return float(np.mean(distances))
 
-def igd(approx_front: list[ObjVec], true_front: np.ndarray) -> float:
+def igd(approx_front: list[ObjVec], true_front: np.ndarray, dtype: str | np.dtype = "float64") -> float:
     """
     Calcula o IGD (Inverted Generational Distance).
 
     :param approx_front: np.ndarray de shape (N, M), fronteira aproximada
     :param true_front: np.ndarray de shape (K, M), fronteira de Pareto de referência
+    :param dtype: Precisão das distâncias ("float64" ou "float32")
     :return: valor do IGD
     """
-    approx_front = np.asarray(approx_front, dtype=float)
+    approx_front = np.asarray(approx_front, dtype=dtype)
+    true_front = np.asarray(true_front, dtype=dtype)
 
     if approx_front.size == 0 or true_front.size == 0:
         raise ValueError("As fronteiras não podem ser vazias")
@@ -45,3 +49,38 @@ def igd(approx_front: list[ObjVec], true_front: np.ndarray) -> float:
         distances.append(np.min(d))
 
     return float(np.mean(distances))
+
+class TrueFrontIndex:
+    """
+    Fronteira verdadeira preparada para calcular GD e IGD repetidamente (ex.: a
+    cada geração), com uma única matriz de distâncias por consulta.
+
+    As normas quadradas da fronteira verdadeira são calculadas uma vez e as
+    distâncias vêm de ||a - z||² = ||a||² + ||z||² - 2 a·z (um produto de
+    matrizes), em vez dos laços de `gd`/`igd`. Com `dtype="float32"` os pontos
+    são arredondados para float32, mas a expansão é acumulada em float64: em
+    float32 o cancelamento perto da convergência (distâncias muito menores que
+    as normas) perderia a maior parte dos dígitos. Os valores coincidem com os de
+    `gd`/`igd` na mesma precisão a menos de arredondamento.
+
+    :param true_front: np.ndarray (K, M), fronteira de Pareto verdadeira
+    :param dtype: Precisão dos pontos ("float64" ou "float32")
+    """
+
+    def __init__(self, true_front: np.ndarray, dtype: str | np.dtype = "float64"):
+        self.true_front = np.ascontiguousarray(true_front, dtype=dtype)
+        if self.true_front.ndim != 2 or self.true_front.size == 0:
+            raise ValueError("A fronteira verdadeira deve ser uma matriz 2D não vazia")
+        self._front = self.true_front.astype(np.float64)
+        self._sq = np.einsum("ij,ij->i", self._front, self._front)
+
+    def distances(self, approx_front: np.ndarray) -> np.ndarray:
+        """Matriz (K, N) de distâncias (float64) entre a fronteira verdadeira e `approx_front`."""
+        A = np.asarray(approx_front, dtype=self.true_front.dtype).astype(np.float64)
+        sq = self._sq[:, None] + np.einsum("ij,ij->i", A, A)[None, :] - 2 * (self._front @ A.T)
+        return np.sqrt(np.maximum(sq, 0, out=sq), out=sq)
+
+    def gd_igd(self, approx_front: np.ndarray) -> tuple[float, float]:
+        """(GD, IGD) de `approx_front` a partir de uma única matriz de distâncias."""
+        D = self.distances(approx_front)
+        return float(np.mean(D.min(axis=0))), float(np.mean(D.min(axis=1)))
@@ -1,13 +1,15 @@
 import numpy as np
-from pymoo.indicators.gd import GD
-from pymoo.indicators.igd import IGD
-from deap.tools._hypervolume import hv
+
+# PyMoo e DEAP são importados dentro das funções, para que carregar este módulo
+# não exija (nem pague o custo de importar) bibliotecas que não serão usadas.
 
 def gd(approx_front: np.ndarray, true_front: np.ndarray) -> float:
+    from pymoo.indicators.gd import GD
     ind = GD(pf=true_front)
     return ind(approx_front)
     
 def igd(approx_front: np.ndarray, true_front: np.ndarray) -> float:
+    from pymoo.indicators.igd import IGD
     ind = IGD(pf=true_front)
     return ind(approx_front)
 
@@ -31,4 +33,5 @@ def hypervolume(
     if np.any(pf > ref):
         raise ValueError("reference_point must be >= all Pareto points in each objective (minimization).")
     
+    from deap.tools._hypervolume import hv
     return hv.hypervolume(pareto_front, reference_point)
@@ -0,0 +1,61 @@
+import numpy as np
+from .generational_distance import gd, igd
+from .indicators import hypervolume
+from .stat_tests import mann_whitney_u
+
+
+def indicator_precision_error(
+    pareto_front: np.ndarray,
+    true_front: np.ndarray,
+    delta: float = 0.1
+) -> dict[str, dict[str, float]]:
+    """
+    Erro introduzido pela precisão simples nos indicadores de uma mesma fronteira:
+    HV, GD e IGD calculados com fronteira aproximada e verdadeira em float64 e
+    em float32 (ponto de referência do HV calculado como no runner).
+
+    :return: {indicador: {"float64", "float32", "abs_error", "rel_error"}}
+    """
+    report: dict[str, dict[str, float]] = {}
+    values: dict[str, dict[str, float]] = {}
+    for dtype in ("float64", "float32"):
+        front = np.asarray(pareto_front, dtype=dtype)
+        ref_front = np.asarray(true_front, dtype=dtype)
+        values[dtype] = {
+            "hypervolume": hypervolume(front, (np.max(front, axis=0) + delta).tolist()),
+            "gd": gd(front, ref_front, dtype=dtype),
+            "igd": igd(front, ref_front, dtype=dtype),
+        }
+    for key in values["float64"]:
+        exact, single = float(values["float64"][key]), float(values["float32"][key])
+        report[key] = {
+            "float64": exact,
+            "float32": single,
+            "abs_error": abs(single - exact),
+            "rel_error": abs(single - exact) / abs(exact) if exact != 0 else 0.0,
+        }
+    return report
+
+
+def compare_precision(
+    samples64: dict[str, list[float]],
+    samples32: dict[str, list[float]]
+) -> dict[str, dict[str, float]]:
+    """
+    Compara métricas de execuções pareadas (mesmas sementes) em float64 e float32:
+    médias, diferença relativa das médias, maior diferença pareada e p-valor de
+    Mann–Whitney entre as duas amostras.
+    """
+    report: dict[str, dict[str, float]] = {}
+    for metric, values64 in samples64.items():
+        a = np.asarray(values64, dtype=float)
+        b = np.asarray(samples32[metric], dtype=float)
+        mean64, mean32 = float(a.mean()), float(b.mean())
+        report[metric] = {
+            "mean_float64": mean64,
+            "mean_float32": mean32,
+            "rel_diff_mean": (mean32 - mean64) / abs(mean64) if mean64 != 0 else 0.0,
+            "max_abs_paired_diff": float(np.max(np.abs(b - a))) if len(a) == len(b) and len(a) else float("nan"),
+            "pvalue": mann_whitney_u(a, b)[1],
+        }
+    return report
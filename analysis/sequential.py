@@ -0,0 +1,94 @@
+from itertools import combinations
+import numpy as np
+from .stat_tests import bootstrap_mean_ci, mann_whitney_u
+
+
+class SequentialStopping:
+    """
+    Regra de parada sequencial para o número de repetições de um experimento.
+
+    Após cada lote de repetições, cada métrica em `metrics` é considerada
+    resolvida quando:
+      - todas as comparações entre pares de implementações são significativas
+        (Mann–Whitney bilateral, nível `alpha` com correção de Bonferroni
+        sobre os pares), ou
+      - o intervalo de confiança bootstrap da média de cada implementação tem
+        meia-largura até `rel_width` × |média|.
+    A execução para quando todas as métricas estão resolvidas, com pelo menos
+    `min_loops` repetições. Como os testes são refeitos a cada lote, o erro
+    tipo I efetivo é maior que `alpha`; use `alpha` conservador.
+
+    :param metrics: Métricas do JSON por execução a acompanhar
+    :param alpha: Nível de significância das comparações
+    :param confidence: Nível dos intervalos de confiança
+    :param rel_width: Meia-largura relativa alvo dos intervalos
+    :param min_loops: Repetições mínimas antes da primeira decisão
+    :param batch_size: Repetições executadas entre decisões
+    :param n_boot: Reamostragens do bootstrap
+    :param seed: Semente do bootstrap
+    """
+
+    def __init__(
+        self,
+        metrics: tuple[str, ...] | list[str] = ("elapsed_time", "hypervolume"),
+        alpha: float = 0.05,
+        confidence: float = 0.95,
+        rel_width: float = 0.05,
+        min_loops: int = 10,
+        batch_size: int = 5,
+        n_boot: int = 2000,
+        seed: int | None = 0
+    ):
+        if min_loops < 2 or batch_size < 1:
+            raise ValueError("min_loops deve ser >= 2 e batch_size >= 1")
+        self.metrics = list(metrics)
+        self.alpha = alpha
+        self.confidence = confidence
+        self.rel_width = rel_width
+        self.min_loops = min_loops
+        self.batch_size = batch_size
+        self.n_boot = n_boot
+        self.seed = seed
+
+    def batches(self, num_loops: int) -> list[tuple[int, int]]:
+        """Intervalos [início, fim) de repetições: `min_loops` e depois lotes de `batch_size`."""
+        limits = [0, min(self.min_loops, num_loops)]
+        while limits[-1] < num_loops:
+            limits.append(min(limits[-1] + self.batch_size, num_loops))
+        return list(zip(limits[:-1], limits[1:]))
+
+    def decide(self, samples: dict[str, dict[str, list[float]]]) -> dict:
+        """
+        Avalia a regra sobre `samples[implementação][métrica]` (valores por repetição).
+        Retorna o relatório da decisão, com `stop` indicando se a execução pode parar.
+        """
+        names = list(samples)
+        n = min((len(samples[name][metric]) for name in names for metric in self.metrics), default=0)
+        report: dict = {"n": n, "stop": False, "metrics": {}}
+        if n < self.min_loops:
+            return report
+
+        pairs = list(combinations(names, 2))
+        all_done = True
+        for metric in self.metrics:
+            values = {name: np.asarray(samples[name][metric], dtype=float) for name in names}
+            pvalues = {f"{a} vs {b}": mann_whitney_u(values[a], values[b])[1] for a, b in pairs}
+            resolved = bool(pairs) and all(p < self.alpha / len(pairs) for p in pvalues.values())
+
+            intervals = {}
+            precise = True
+            for name in names:
+                low, high = bootstrap_mean_ci(values[name], self.confidence, self.n_boot, self.seed)
+                intervals[name] = [low, high]
+                precise &= (high - low) / 2 <= self.rel_width * abs(float(values[name].mean()))
+
+            report["metrics"][metric] = {
+                "resolved": resolved,
+                "precise": bool(precise),
+                "pvalues": pvalues,
+                "ci": intervals,
+            }
+            all_done &= resolved or precise
+
+        report["stop"] = bool(all_done)
+        return report
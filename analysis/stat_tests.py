@@ -0,0 +1,189 @@
+import math
+import numpy as np
+
+
+def rankdata(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Postos (1..n) com média nos empates, como `scipy.stats.rankdata`.
+
+    :return: (postos, tamanhos dos grupos de empate)
+    """
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(values, kind="mergesort")
+    ranks = np.empty(len(values), dtype=float)
+    ranks[order] = np.arange(1, len(values) + 1)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    mean_ranks = np.bincount(inverse, weights=ranks) / counts
+    return mean_ranks[inverse], counts
+
+
+def mann_whitney_u(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """
+    Teste U de Mann–Whitney bilateral (aproximação normal com correção de
+    continuidade e de empates).
+
+    :return: (U de `x`, p-valor)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        return math.nan, 1.0
+    ranks, ties = rankdata(np.concatenate([x, y]))
+    u1 = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    mu = n1 * n2 / 2
+    tie_term = float(np.sum(ties ** 3 - ties)) / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return float(u1), 1.0
+    z = (abs(u1 - mu) - 0.5) / sigma
+    return float(u1), min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def bootstrap_mean_ci(
+    values: np.ndarray,
+    confidence: float = 0.95,
+    n_boot: int = 2000,
+    seed: int | None = 0
+) -> tuple[float, float]:
+    """Intervalo de confiança percentil (bootstrap) para a média de `values`."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return -math.inf, math.inf
+    rng = np.random.default_rng(seed)
+    means = values[rng.integers(0, len(values), size=(n_boot, len(values)))].mean(axis=1)
+    alpha = 1 - confidence
+    low, high = np.quantile(means, [alpha / 2, 1 - alpha / 2])
+    return float(low), float(high)
+
+
+def _gamma_q(a: float, x: float) -> float:
+    """Função gama incompleta superior regularizada Q(a, x) (série ou fração contínua)."""
+    if x <= 0:
+        return 1.0
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Série para P(a, x)
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+    # Fração contínua de Lentz para Q(a, x)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, h * math.exp(log_prefactor))
+
+
+def _beta_inc(a: float, b: float, x: float) -> float:
+    """Função beta incompleta regularizada I_x(a, b) (fração contínua de Lentz)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _beta_inc(b, a, 1 - x)
+    log_prefactor = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    tiny = 1e-300
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / (tiny if abs(d) < tiny else d)
+    h = d
+    for m in range(1, 1000):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1 + numerator * d
+            d = 1 / (tiny if abs(d) < tiny else d)
+            c = 1 + numerator / c
+            c = tiny if abs(c) < tiny else c
+            h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefactor) * h / a
+
+
+def chi2_sf(x: float, df: float) -> float:
+    """Função de sobrevivência P(X > x) da qui-quadrado com `df` graus de liberdade."""
+    return _gamma_q(df / 2, x / 2)
+
+
+def student_t_sf(t: float, df: float) -> float:
+    """Função de sobrevivência P(T > t) da t de Student com `df` graus de liberdade."""
+    tail = 0.5 * _beta_inc(df / 2, 0.5, df / (df + t * t))
+    return tail if t >= 0 else 1.0 - tail
+
+
+def friedman_test(costs: np.ndarray) -> tuple[float, float, np.ndarray]:
+    """
+    Teste de Friedman (aproximação qui-quadrado, com correção de empates) sobre a
+    matriz `costs` (blocos × tratamentos), com postos atribuídos dentro de cada bloco.
+
+    :return: (estatística, p-valor, soma dos postos de cada tratamento)
+    """
+    costs = np.asarray(costs, dtype=float)
+    n_blocks, k = costs.shape
+    ranks = np.vstack([rankdata(row)[0] for row in costs])
+    rank_sums = ranks.sum(axis=0)
+    a = float(np.sum(ranks ** 2))
+    c = n_blocks * k * (k + 1) ** 2 / 4
+    if k < 2 or a - c <= 0:
+        return 0.0, 1.0, rank_sums
+    statistic = (k - 1) * float(np.sum((rank_sums - n_blocks * (k + 1) / 2) ** 2)) / (a - c)
+    return statistic, chi2_sf(statistic, k - 1), rank_sums
+
+
+def friedman_posthoc(costs: np.ndarray, reference: int) -> np.ndarray:
+    """
+    Comparações post-hoc de Conover após o teste de Friedman: p-valores bilaterais
+    de cada tratamento contra o tratamento `reference` (1.0 para ele mesmo).
+    Com variância nula dos postos (todos os blocos ordenam os tratamentos da mesma
+    forma), as diferenças são exatas: p = 0 para quem difere da referência.
+    """
+    costs = np.asarray(costs, dtype=float)
+    n_blocks, k = costs.shape
+    ranks = np.vstack([rankdata(row)[0] for row in costs])
+    rank_sums = ranks.sum(axis=0)
+    df = (n_blocks - 1) * (k - 1)
+    variance = 2 * (n_blocks * float(np.sum(ranks ** 2)) - float(np.sum(rank_sums ** 2))) / df if df > 0 else 0.0
+    pvalues = np.ones(k)
+    if df <= 0:
+        return pvalues
+    if variance <= 0:
+        pvalues[~np.isclose(rank_sums, rank_sums[reference])] = 0.0
+        return pvalues
+    for j in range(k):
+        if j != reference:
+            t = abs(rank_sums[j] - rank_sums[reference]) / math.sqrt(variance)
+            pvalues[j] = min(1.0, 2 * student_t_sf(t, df))
+    return pvalues
+
+
+def holm_adjust(pvalues: np.ndarray) -> np.ndarray:
+    """P-valores ajustados de Holm–Bonferroni (controle do erro familiar), na ordem original."""
+    pvalues = np.asarray(pvalues, dtype=float)
+    m = len(pvalues)
+    order = np.argsort(pvalues, kind="mergesort")
+    adjusted = np.minimum(1.0, np.maximum.accumulate((m - np.arange(m)) * pvalues[order]))
+    result = np.empty(m)
+    result[order] = adjusted
+    return result
@@ -0,0 +1,249 @@
+import math
+import numpy as np
+
+
+def _finite(value: float) -> float | None:
+    """`value` se finito; None (null no JSON) para NaN e infinitos, que o JSON não representa."""
+    return float(value) if math.isfinite(value) else None
+
+
+class RunningStats:
+    """
+    Estatísticas de uma métrica acumuladas em fluxo: contagem, média e variância
+    (Welford) e mínimo/máximo, em memória O(1).
+
+    Dois acumuladores de fluxos disjuntos são combinados por `merge` em O(1)
+    (fórmula de Chan et al.), de modo que resumos parciais (shards) produzidos em
+    processos ou nós diferentes podem ser agregados sem reler as execuções.
+    """
+
+    def __init__(self):
+        self.n: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    def update(self, value: float) -> None:
+        value = float(value)
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Incorpora `other` (fluxo disjunto) a este acumulador e o retorna."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Variância amostral (ddof=1); NaN com menos de duas observações."""
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.n > 1 else math.nan
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Estado serializável em JSON (ver `from_dict`)."""
+        return {"n": self.n, "mean": self.mean, "m2": self.m2, "min": _finite(self.min), "max": _finite(self.max)}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "RunningStats":
+        stats = cls()
+        stats.n = int(state["n"])
+        stats.mean = float(state["mean"])
+        stats.m2 = float(state["m2"])
+        stats.min = math.inf if state["min"] is None else float(state["min"])
+        stats.max = -math.inf if state["max"] is None else float(state["max"])
+        return stats
+
+
+class QuantileSketch:
+    """
+    Esboço de quantis mesclável no estilo t-digest (variante "merging").
+
+    Os valores são resumidos em centróides (média, peso) cujo peso máximo segue a
+    função de escala k1 (asin): centróides pequenos nas caudas e maiores no centro,
+    o que mantém erro relativo baixo nos quantis extremos com no máximo
+    ~`compression` centróides. Enquanto houver até `compression` valores, cada
+    centróide é um único valor e os quantis coincidem com a interpolação linear
+    do NumPy.
+
+    :param compression: Parâmetro δ do t-digest (mais centróides = mais precisão)
+    """
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self._means: list[float] = []
+        self._weights: list[float] = []
+        self._buffer: list[float] = []
+
+    def update(self, value: float) -> None:
+        value = float(value)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self._buffer.append(value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Incorpora os centróides de `other` a este esboço e o retorna."""
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._means += other._means + other._buffer
+        self._weights += other._weights + [1.0] * len(other._buffer)
+        self._compress()
+        return self
+
+    @property
+    def count(self) -> float:
+        return sum(self._weights) + len(self._buffer)
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inv(self, k: float) -> float:
+        return (math.sin(min(k * 2 * math.pi / self.compression, math.pi / 2)) + 1) / 2
+
+    def _compress(self) -> None:
+        means = self._means + self._buffer
+        weights = self._weights + [1.0] * len(self._buffer)
+        self._buffer = []
+        if not means:
+            return
+        order = np.argsort(means, kind="stable")
+        if len(means) <= self.compression:  # ainda cabe sem fundir centróides
+            self._means = [means[i] for i in order]
+            self._weights = [weights[i] for i in order]
+            return
+        total = float(sum(weights))
+
+        new_means: list[float] = []
+        new_weights: list[float] = []
+        cur_mean, cur_weight = means[order[0]], weights[order[0]]
+        weight_before = 0.0
+        limit = total * self._k_inv(self._k(0.0) + 1)
+        for i in order[1:]:
+            mean, weight = means[i], weights[i]
+            if weight_before + cur_weight + weight <= limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                new_means.append(cur_mean)
+                new_weights.append(cur_weight)
+                weight_before += cur_weight
+                limit = total * self._k_inv(self._k(weight_before / total) + 1)
+                cur_mean, cur_weight = mean, weight
+        new_means.append(cur_mean)
+        new_weights.append(cur_weight)
+        self._means, self._weights = new_means, new_weights
+
+    def quantile(self, q: float) -> float:
+        """Quantil aproximado `q` ∈ [0, 1]; NaN se o esboço estiver vazio."""
+        self._compress()
+        if not self._means:
+            return math.nan
+        weights = np.asarray(self._weights)
+        total = weights.sum()
+        centers = np.cumsum(weights) - weights / 2
+        # Interpolação entre os centros dos centróides, ancorada no mínimo e no máximo
+        xs = np.concatenate([[0.0], centers, [total]])
+        ys = np.concatenate([[self.min], self._means, [self.max]])
+        if len(self._means) == total:  # centróides unitários: quantis exatos
+            xs, ys = centers, np.asarray(self._means)
+            return float(np.interp(q * (total - 1) + 0.5, xs, ys))
+        return float(np.interp(q * total, xs, ys))
+
+    def to_dict(self) -> dict:
+        """Estado serializável em JSON (ver `from_dict`)."""
+        self._compress()
+        return {
+            "compression": self.compression,
+            "min": _finite(self.min),
+            "max": _finite(self.max),
+            "means": list(self._means),
+            "weights": list(self._weights),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "QuantileSketch":
+        sketch = cls(float(state["compression"]))
+        sketch.min = math.inf if state["min"] is None else float(state["min"])
+        sketch.max = -math.inf if state["max"] is None else float(state["max"])
+        sketch._means = [float(v) for v in state["means"]]
+        sketch._weights = [float(v) for v in state["weights"]]
+        return sketch
+
+
+class StreamingMetric:
+    """
+    Acumulador completo de uma métrica: momentos e extremos (`RunningStats`)
+    e quantis (`QuantileSketch`), mesclável e serializável em JSON.
+    """
+
+    QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+    def __init__(self, compression: float = 100.0):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(compression)
+
+    def update(self, value: float) -> None:
+        self.stats.update(value)
+        self.sketch.update(value)
+
+    def merge(self, other: "StreamingMetric") -> "StreamingMetric":
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def n(self) -> int:
+        return self.stats.n
+
+    @property
+    def mean(self) -> float:
+        return self.stats.mean if self.stats.n > 0 else math.nan
+
+    def summary(self) -> dict[str, float | int | None]:
+        """
+        Resumo legível: n, média, desvio padrão, extremos e quantis p05..p95.
+        Valores indefinidos (métrica não medida, desvio com n < 2) são None.
+        """
+        summary: dict[str, float | int | None] = {
+            "n": self.stats.n,
+            "mean": _finite(self.mean),
+            "std": _finite(self.stats.std),
+            "min": _finite(self.stats.min),
+            "max": _finite(self.stats.max),
+        }
+        for q in self.QUANTILES:
+            summary[f"p{round(q * 100):02d}"] = _finite(self.sketch.quantile(q))
+        return summary
+
+    def to_dict(self) -> dict:
+        return {**self.stats.to_dict(), "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "StreamingMetric":
+        metric = cls()
+        metric.stats = RunningStats.from_dict(state)
+        metric.sketch = QuantileSketch.from_dict(state["sketch"])
+        return metric
@@ -0,0 +1,188 @@
+import math
+import time
+from typing import Callable
+import numpy as np
+
+from algorithms.stopping import non_dominated_mask
+from .generational_distance import TrueFrontIndex
+from .indicators import hypervolume
+from .streaming_stats import StreamingMetric
+
+# Indicadores que podem ser registrados ao longo da execução
+TRAJECTORY_METRICS = ("hypervolume", "igd", "gd")
+
+
+class TrajectoryRecorder:
+    """
+    Registra a trajetória de indicadores (curva "anytime") de uma execução.
+
+    Usado como `callback(gen, F)` das implementações do NSGA-III: nas gerações
+    de registro, calcula os indicadores de `metrics` sobre os pontos
+    não-dominados da população. O registro acontece na primeira geração e depois
+    a cada `every` gerações e/ou sempre que passarem `time_interval` segundos
+    desde o último registro.
+
+    Para que o registro não domine o tempo da execução, os dados fixos são
+    preparados uma vez: GD e IGD vêm de um `TrueFrontIndex` (compartilhável entre
+    execuções) com uma única matriz de distâncias, e o hypervolume usa um ponto
+    de referência fixo, derivado da fronteira verdadeira (máximo + `delta`), o
+    que também torna os valores comparáveis entre gerações e execuções; pontos
+    que não dominam a referência são ignorados no hypervolume. O tempo gasto no
+    registro (`overhead`) é descontado dos instantes registrados, mas continua
+    incluído no tempo total medido da execução.
+
+    Com `callback`, a chamada é repassada a ele depois do registro (ex.: um
+    `StagnationStopping`), e o seu retorno decide a parada.
+
+    :param front_index: Fronteira verdadeira indexada (ver `TrueFrontIndex`)
+    :param every: Intervalo em gerações entre registros (None = só por tempo)
+    :param time_interval: Intervalo em segundos entre registros (None = só por geração)
+    :param metrics: Indicadores registrados, entre `TRAJECTORY_METRICS`
+    :param hv_reference: Ponto de referência do hypervolume (padrão: máximo da fronteira verdadeira + delta)
+    :param delta: Margem do ponto de referência padrão
+    :param callback: Callback repassado após o registro
+    """
+
+    def __init__(
+        self,
+        front_index: TrueFrontIndex,
+        every: int | None = 1,
+        time_interval: float | None = None,
+        metrics: tuple[str, ...] | list[str] = ("hypervolume", "igd"),
+        hv_reference: list[float] | np.ndarray | None = None,
+        delta: float = 0.1,
+        callback: Callable[[int, np.ndarray], bool] | None = None
+    ):
+        if every is None and time_interval is None:
+            raise ValueError("Informe every e/ou time_interval")
+        if (every is not None and every < 1) or (time_interval is not None and time_interval <= 0):
+            raise ValueError("every deve ser >= 1 e time_interval positivo")
+        unknown = set(metrics) - set(TRAJECTORY_METRICS)
+        if unknown:
+            raise ValueError(f"Indicadores desconhecidos na trajetória: {sorted(unknown)}")
+        self.front_index = front_index
+        self.every = every
+        self.time_interval = time_interval
+        self.metrics = list(metrics)
+        if hv_reference is None:
+            hv_reference = np.max(front_index.true_front, axis=0) + delta
+        self.hv_reference = np.asarray(hv_reference, dtype=float)
+        self.callback = callback
+        self.columns: dict[str, list] = {"gen": [], "time": [], **{metric: [] for metric in self.metrics}}
+        self.overhead: float = 0.0
+        self._next_time: float = 0.0
+        self._start: float = time.perf_counter()
+
+    def __call__(self, gen: int, F: np.ndarray) -> bool:
+        now = time.perf_counter()
+        elapsed = now - self._start - self.overhead
+        if self._due(gen, elapsed):
+            self._record(gen, elapsed, np.asarray(F))
+            if self.time_interval is not None:
+                self._next_time = (math.floor(elapsed / self.time_interval) + 1) * self.time_interval
+            self.overhead += time.perf_counter() - now
+        return bool(self.callback(gen, F)) if self.callback is not None else False
+
+    def get_state(self) -> dict:
+        """
+        Estado do registro (e do `callback` repassado, se ele tiver estado), salvo nos
+        checkpoints das implementações. Ao retomar (`set_state`), o relógio continua
+        do tempo registrado até o checkpoint.
+        """
+        return {
+            "columns": {key: list(values) for key, values in self.columns.items()},
+            "overhead": self.overhead,
+            "next_time": self._next_time,
+            "elapsed": time.perf_counter() - self._start,
+            "callback": self.callback.get_state() if hasattr(self.callback, "get_state") else None,
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.columns = {key: list(values) for key, values in state["columns"].items()}
+        self.overhead = state["overhead"]
+        self._next_time = state["next_time"]
+        self._start = time.perf_counter() - state["elapsed"]
+        if state["callback"] is not None and hasattr(self.callback, "set_state"):
+            self.callback.set_state(state["callback"])
+
+    def _due(self, gen: int, elapsed: float) -> bool:
+        if gen == 1 or (self.every is not None and gen % self.every == 0):
+            return True
+        return self.time_interval is not None and elapsed >= self._next_time
+
+    def _record(self, gen: int, elapsed: float, F: np.ndarray) -> None:
+        front = F[non_dominated_mask(F)]
+        self.columns["gen"].append(int(gen))
+        self.columns["time"].append(elapsed)
+        if "gd" in self.columns or "igd" in self.columns:
+            gdv, igdv = self.front_index.gd_igd(front)
+            if "gd" in self.columns:
+                self.columns["gd"].append(gdv)
+            if "igd" in self.columns:
+                self.columns["igd"].append(igdv)
+        if "hypervolume" in self.columns:
+            inside = front[np.all(front < self.hv_reference, axis=1)]
+            hv = hypervolume(inside, self.hv_reference) if len(inside) else 0.0
+            self.columns["hypervolume"].append(float(hv))
+
+    def to_dict(self) -> dict:
+        """Trajetória em colunas (uma lista por campo), como salva no JSON da execução."""
+        return {
+            **self.columns,
+            "overhead": self.overhead,
+            "hv_reference": self.hv_reference.tolist(),
+        }
+
+
+class TrajectoryStats:
+    """
+    Acumula as trajetórias de várias execuções por geração registrada: para cada
+    geração e indicador, um `StreamingMetric` (mesclável, ver `merge`). Execuções
+    que pararam antes contribuem só para as gerações que alcançaram.
+    """
+
+    def __init__(self):
+        self.by_gen: dict[int, dict[str, StreamingMetric]] = {}
+
+    def update(self, trajectory: dict) -> None:
+        metrics = [key for key in TRAJECTORY_METRICS + ("time",) if key in trajectory]
+        for i, gen in enumerate(trajectory["gen"]):
+            entry = self.by_gen.setdefault(int(gen), {})
+            for metric in metrics:
+                entry.setdefault(metric, StreamingMetric()).update(trajectory[metric][i])
+
+    def merge(self, other: "TrajectoryStats") -> "TrajectoryStats":
+        for gen, entry in other.by_gen.items():
+            target = self.by_gen.setdefault(gen, {})
+            for metric, values in entry.items():
+                target.setdefault(metric, StreamingMetric()).merge(values)
+        return self
+
+    def summary(self) -> dict:
+        """Curvas por geração: `gen` e, para cada indicador, listas de n, média e quantis."""
+        gens = sorted(self.by_gen)
+        metrics = sorted({metric for entry in self.by_gen.values() for metric in entry})
+        curves: dict = {"gen": gens}
+        for metric in metrics:
+            rows = [self.by_gen[gen].get(metric) for gen in gens]
+            summaries = [row.summary() if row is not None else None for row in rows]
+            curves[metric] = {
+                key: [s[key] if s is not None else None for s in summaries]
+                for key in ("n", "mean", "p25", "p50", "p75")
+            }
+        return curves
+
+    def to_dict(self) -> dict:
+        return {
+            str(gen): {metric: values.to_dict() for metric, values in entry.items()}
+            for gen, entry in self.by_gen.items()
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "TrajectoryStats":
+        stats = cls()
+        stats.by_gen = {
+            int(gen): {metric: StreamingMetric.from_dict(values) for metric, values in entry.items()}
+            for gen, entry in state.items()
+        }
+        return stats
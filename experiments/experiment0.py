@@ -5,9 +5,7 @@ from pathlib import Path
 from algorithms.protocol_nsga3 import NSGA3Callable
 from genetic_operators.crossover import sbx_crossover
 from genetic_operators.mutation import polynomial_mutation
-from algorithms.pure_nsga3 import nsga3_func
-from algorithms.deap_nsga3 import nsga3_deap_func
-from algorithms.pymoo_nsga3 import nsga3_pymoo_func
+from algorithms.registry import get_backend
 from problems.dtlz2 import dtlz2
 from analysis.coverege_per_niche import count_points_per_niche_dtlz2, analyze_niche_distribution
 from analysis.indicators import hypervolume
@@ -30,9 +28,9 @@ output_dir.mkdir(parents=True, exist_ok=True)
 ref_pts = generate_reference_points(NUM_OBJ, DIVISIONS)
 
 impl: list[NSGA3Callable] = [
-    nsga3_func,
-    nsga3_deap_func,
-    nsga3_pymoo_func
+    get_backend("nsga3_func"),
+    get_backend("nsga3_deap_func"),
+    get_backend("nsga3_pymoo_func")
 ]
 
 # Loop de execuções
@@ -1,10 +1,6 @@
 from pathlib import Path
 
 from .experiment_runner import run_experiemnt_with_dtlz2
-from algorithms.protocol_nsga3 import NSGA3Callable
-from algorithms.pure_nsga3 import nsga3_func
-from algorithms.deap_nsga3 import nsga3_deap_func
-from algorithms.pymoo_nsga3 import nsga3_pymoo_func
 
 # Parameters
 NUM_OBJ = 4
@@ -18,10 +14,10 @@ R = 0.15 # ~(pi/2)/DIVISIONS
 output_dir = Path("results/experiment4")
 output_dir.mkdir(parents=True, exist_ok=True)
  
-impl: list[NSGA3Callable] = [
-    nsga3_func,
-    nsga3_deap_func,
-    nsga3_pymoo_func
+impl: list[str] = [
+    "nsga3_func",
+    "nsga3_deap_func",
+    "nsga3_pymoo_func"
 ]
 
 run_experiemnt_with_dtlz2(
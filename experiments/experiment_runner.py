@@ -1,16 +1,495 @@
+import gc
+import inspect
+import io
 import json
+import multiprocessing as mp
+import os
 import time
+from contextlib import nullcontext, redirect_stdout
 from pathlib import Path
 import numpy as np
 
 from algorithms.protocol_nsga3 import Bounds, NSGA3Callable
-from genetic_operators.crossover import sbx_crossover
-from genetic_operators.mutation import polynomial_mutation
-from problems.dtlz2 import dtlz2, dtlz2_true_front
+from algorithms.registry import backend_name, resolve_backend
+from algorithms.stopping import StagnationStopping
+from algorithms.parallel_eval import mp_context
+from genetic_operators.crossover import sbx_crossover, SBXCrossover
+from genetic_operators.mutation import polynomial_mutation, PolynomialMutation
+from problems.dtlz2 import DTLZ2, dtlz2_true_front
 from analysis.coverege_per_niche import count_points_per_niche_dtlz2, analyze_niche_distribution
 from analysis.indicators import hypervolume
-from analysis.generational_distance import gd, igd
+from analysis.streaming_stats import StreamingMetric
+from analysis.sequential import SequentialStopping
+from analysis.generational_distance import TrueFrontIndex, gd, igd
+from analysis.trajectory import TrajectoryRecorder, TrajectoryStats
 from utils.generate_points import generate_reference_points
+from utils.reference_index import ReferenceIndex
+from utils.benchmark_env import blas_env, current_affinity, pin_blas_threads, release_blas_threads, set_affinity
+from utils.checkpoint import save_json
+from utils.memory_profile import MemoryProfiler
+from utils.profiling import PROFILE_SUFFIXES, RunProfiler, hotspots
+from utils.run_cache import RunCache
+from utils.shared_population import SharedArray
+from .runner_config import AlgorithmConfig, BenchmarkConfig, BudgetConfig, CacheConfig, ProfilingConfig
+
+# Dados comuns a todas as execuções de um experimento (fronteira verdadeira e pontos
+# de referência). Nos processos trabalhadores são views sobre memória compartilhada.
+_context: dict = {}
+
+def _accepts(func: NSGA3Callable, param: str) -> bool:
+    """Indica se a implementação aceita o parâmetro opcional `param`."""
+    return param in inspect.signature(func).parameters
+
+# Métricas acumuladas por implementação, na ordem do summary; as de
+# `_MEAN_METRICS` aparecem no summary com o prefixo "mean_"
+METRICS = [
+    "elapsed_time",
+    "hv_elapsed_time",
+    "count_elapsed_time",
+    "analyze_elapsed_time",
+    "gd_elapsed_time",
+    "igd_elapsed_time",
+    "n_evals",
+    "n_gen",
+    "hypervolume",
+    "gd",
+    "igd",
+    "coverage",
+    "empty_ratio",
+    "outside_rate",
+    "entropy_norm",
+    "gini",
+    "chi2",
+    "avg_active",
+    "max_density",
+    "std_density",
+    "CUS",
+    "peak_rss_mb",
+    "peak_rss_delta_mb",
+    "cpu_time",
+]
+_MEAN_METRICS = set(METRICS[:11])
+
+def new_stats() -> dict[str, StreamingMetric]:
+    return {key: StreamingMetric() for key in METRICS}
+
+def stats_state(func_stats: dict[str, StreamingMetric]) -> dict[str, dict]:
+    return {key: metric.to_dict() for key, metric in func_stats.items()}
+
+def stats_from_state(state: dict[str, dict]) -> dict[str, StreamingMetric]:
+    # Métricas ausentes em estados salvos por versões anteriores começam vazias
+    return {key: StreamingMetric.from_dict(state[key]) if key in state else StreamingMetric() for key in METRICS}
+
+def summarize(func_stats: dict[str, StreamingMetric]) -> dict:
+    """
+    Seção `results` do summary para uma implementação: as médias (chaves
+    históricas), o resumo de dispersão e quantis de cada métrica (`stats`) e o
+    estado mesclável dos acumuladores (`state`, ver `merge_summaries`).
+    """
+    stats = {key: func_stats[key].summary() for key in METRICS}
+    # Métricas não medidas (ex.: memória sem `memory_profile`) ficam None (null no JSON)
+    results: dict = {
+        (f"mean_{key}" if key in _MEAN_METRICS else key): stats[key]["mean"]
+        for key in METRICS
+    }
+    results["stats"] = stats
+    results["state"] = stats_state(func_stats)
+    return results
+
+def merge_summaries(summaries: list[dict]) -> dict:
+    """
+    Combina `summary.json` de execuções disjuntas da mesma configuração (ex.:
+    shards de uma varredura) sem reler os JSON por execução: os acumuladores de
+    cada implementação são mesclados a partir da seção `state`.
+    """
+    merged: dict[str, dict[str, StreamingMetric]] = {}
+    for summary in summaries:
+        for name, results in summary["results"].items():
+            func_stats = stats_from_state(results["state"])
+            if name in merged:
+                for key in METRICS:
+                    merged[name][key].merge(func_stats[key])
+            else:
+                merged[name] = func_stats
+    parameters = dict(summaries[0]["parameters"]) if summaries else {}
+    parameters["num_loops"] = sum(summary["parameters"].get("num_loops", 0) for summary in summaries)
+    return {
+        "parameters": parameters,
+        "results": {name: summarize(func_stats) for name, func_stats in merged.items()},
+    }
+
+def metric_value(data: dict, key: str) -> float | None:
+    """Valor da métrica `key` nos dados de uma execução (JSON por execução); None se não medida."""
+    return data[key] if key in data else data["niche_metrics"].get(key)
+
+# Medições da otimização que, numa execução retomada de checkpoint, cobrem só o último trecho
+_OPTIMIZER_MEASUREMENTS = {"elapsed_time", "cpu_time", "peak_rss_mb", "peak_rss_delta_mb"}
+
+# Medições que dependem da máquina e da carga: numa execução vinda do cache, não são deste experimento
+_MACHINE_MEASUREMENTS = _OPTIMIZER_MEASUREMENTS | {key for key in METRICS if key.endswith("_elapsed_time")}
+
+def cacheable(run_config: dict) -> bool:
+    """
+    Só execuções reprodutíveis vão para o cache de execuções: semeadas e sem
+    orçamento de tempo (com `time_budget`, o resultado depende da máquina e da carga).
+    """
+    return run_config["seed"] is not None and run_config["time_budget"] is None
+
+def measurements(data: dict) -> dict[str, float]:
+    """
+    Métricas medidas numa execução (dados do JSON por execução), sem as não medidas,
+    sem as medições da otimização de execuções retomadas de checkpoint
+    (`resumed_from_checkpoint`), que não representam a execução inteira, e sem
+    tempos e memória de execuções vindas do cache (`cached`), medidos em outro experimento.
+    """
+    skip = set()
+    if data.get("resumed_from_checkpoint"):
+        skip |= _OPTIMIZER_MEASUREMENTS
+    if data.get("cached"):
+        skip |= _MACHINE_MEASUREMENTS
+    values = {key: metric_value(data, key) for key in METRICS if key not in skip}
+    return {key: value for key, value in values.items() if value is not None}
+
+def accumulate(func_stats: dict[str, StreamingMetric], data: dict) -> None:
+    """Acumula as métricas medidas de uma execução (ver `measurements`)."""
+    for key, value in measurements(data).items():
+        func_stats[key].update(value)
+
+def _init_worker(true_front_desc: tuple, ref_pts_desc: tuple) -> None:
+    shared = [SharedArray.attach(true_front_desc), SharedArray.attach(ref_pts_desc)]
+    _context["shared"] = shared  # mantém os segmentos anexados enquanto o processo viver
+    _context["true_front"] = shared[0].array
+    _context["ref_pts"] = shared[1].array
+
+def _ref_index(ref_pts: np.ndarray) -> ReferenceIndex:
+    """Índice sobre os pontos de referência, criado uma vez por processo e por conjunto de pontos."""
+    indexes = _context.setdefault("ref_indexes", {})
+    if id(ref_pts) not in indexes:
+        indexes[id(ref_pts)] = (ref_pts, ReferenceIndex(ref_pts))  # mantém o array vivo: o id não é reaproveitado
+    return indexes[id(ref_pts)][1]
+
+def _front_index(true_front: np.ndarray, dtype: str) -> TrueFrontIndex:
+    """Fronteira verdadeira indexada para as trajetórias, criada uma vez por processo e por fronteira."""
+    indexes = _context.setdefault("front_indexes", {})
+    key = (id(true_front), dtype)
+    if key not in indexes:
+        indexes[key] = (true_front, TrueFrontIndex(true_front, dtype))
+    return indexes[key][1]
+
+def profile_selected(profile: dict | None, index: int) -> bool:
+    """Indica se a repetição `index` deve ser perfilada (`profile["runs"]`: índices; None = todas)."""
+    return profile is not None and (profile.get("runs") is None or index in profile["runs"])
+
+
+def build_run_config(name: str, params: dict, index: int, seed: int | None, benchmark: dict | None = None) -> dict:
+    """
+    Configuração de uma execução: vai para o JSON da execução e é a chave do cache de
+    execuções (`utils.run_cache`), então runner, varredura, fila de trabalho e ajuste a
+    constroem todos por aqui para compartilhar o cache.
+
+    :param name: Nome registrado da implementação
+    :param params: Parâmetros do runner; `bounds`, ou `num_var` para limites [0, 1] (varreduras)
+    :param index: Repetição, com semente `seed + index`
+    :param seed: Semente base (None = execuções não semeadas)
+    :param benchmark: Modo benchmark (`BenchmarkConfig.to_dict()`), só no runner
+    """
+    bounds = params["bounds"] if "bounds" in params else [[0.0, 1.0]] * params["num_var"]
+    return {
+        "implementation": name,
+        "problem": "dtlz2",
+        "pop_size": params["pop_size"],
+        "num_gen": params["num_gen"],
+        "bounds": [list(b) for b in bounds],
+        "num_obj": params["num_obj"],
+        "divisions": params["divisions"],
+        "radius_ref": params["radius_ref"],
+        "pb_c": params["pb_c"],
+        "eta_c": params["eta_c"],
+        "pb_m": params["pb_m"],
+        "eta_m": params["eta_m"],
+        "pb_pg_m": params["pb_pg_m"],
+        "max_evals": params["max_evals"],
+        "time_budget": params["time_budget"],
+        "early_stopping": params["early_stopping"],
+        "eval_cache_tol": params["eval_cache_tol"],
+        "eliminate_duplicates": params["eliminate_duplicates"],
+        "batch_operators": params["batch_operators"],
+        "dtype": params["dtype"],
+        "n_islands": params["n_islands"],
+        "trajectory": params["trajectory"],
+        "memory_profile": params["memory_profile"],
+        "profile": params["profile"] if profile_selected(params["profile"], index) else None,
+        "benchmark": benchmark,
+        "seed": None if seed is None else seed + index,
+        "true_front": {"n_points": 600, "seed": seed},
+    }
+
+def build_run_kwargs(params: dict) -> dict:
+    """Opções das implementações pedidas em `params`; `execute_run` filtra as que cada uma não aceita."""
+    run_kwargs: dict = {}
+    if params["eval_cache_size"] is not None:
+        run_kwargs["cache_size"] = params["eval_cache_size"]
+        run_kwargs["cache_tol"] = params["eval_cache_tol"]
+    if params["eliminate_duplicates"] is not None:
+        run_kwargs["eliminate_duplicates"] = params["eliminate_duplicates"]
+    if params["n_islands"] is not None:
+        run_kwargs["n_islands"] = params["n_islands"]
+    return run_kwargs
+
+def _run_profiler(config: dict, profile_path: str | Path | None, phase: str):
+    """Perfilador de uma fase ("optimizer" ou "indicators") da execução, ou um contexto nulo."""
+    profile = config["profile"]
+    if profile_path is None or (phase == "indicators" and not profile.get("indicators", True)):
+        return nullcontext()
+    kind = profile.get("kind", "cprofile")
+    return RunProfiler(f"{profile_path}_{phase}{PROFILE_SUFFIXES[kind]}", kind, profile.get("interval", 0.005))
+
+def write_hotspots(profile_dir: Path, names: list[str], profile: dict) -> dict:
+    """
+    Combina os perfis por execução de `profile_dir` (arquivos
+    `run_NNN_<implementação>_<fase>.<ext>`) e salva os pontos quentes por
+    implementação e fase em `profile_dir/hotspots.json`.
+    """
+    suffix = PROFILE_SUFFIXES[profile.get("kind", "cprofile")]
+    result: dict = {"profile": profile, "implementations": {}}
+    for name in names:
+        by_phase = {}
+        for phase in ("optimizer", "indicators"):
+            tail = f"_{name}_{phase}{suffix}"
+            # O nome exato evita misturar implementações cujo nome contém o de outra
+            paths = [
+                path for path in sorted(profile_dir.glob(f"run_*{tail}"))
+                if path.name.startswith("run_") and path.name[len("run_000"):] == tail
+            ]
+            if paths:
+                by_phase[phase] = {"runs": len(paths), "hotspots": hotspots(paths, profile.get("top", 30))}
+        result["implementations"][name] = by_phase
+    save_json(profile_dir / "hotspots.json", result)
+    return result
+
+def _get_session(func: NSGA3Callable, config: dict):
+    """
+    Sessão da implementação para o problema de `config`, criada na primeira
+    chamada e reaproveitada nas seguintes (None se a implementação não tiver sessão).
+    """
+    factory = getattr(func, "session_factory", None)
+    if factory is None:
+        return None
+    bounds = [tuple(b) for b in config["bounds"]]
+    num_obj = config["num_obj"]
+    key = (func.__name__, num_obj, tuple(bounds), config["divisions"])
+    sessions = _context.setdefault("sessions", {})
+    if key not in sessions:
+        sessions[key] = factory(DTLZ2(num_obj), bounds, config["divisions"])
+    return sessions[key]
+
+def execute_run(
+    implementation: str | NSGA3Callable,
+    config: dict,
+    run_kwargs: dict,
+    reuse_session: bool = False,
+    true_front: np.ndarray | None = None,
+    ref_pts: np.ndarray | None = None
+) -> dict:
+    """
+    Executa uma implementação com a configuração `config` e calcula as métricas.
+    A implementação é importada aqui (ver `algorithms.registry`), de modo que cada
+    processo só carrega as bibliotecas que executa; dos `run_kwargs`, são repassados
+    apenas os parâmetros que ela aceita. Com `reuse_session`, usa a sessão da implementação (ver `_get_session`), e a
+    preparação do backend fica fora do tempo medido. `true_front`/`ref_pts`
+    (padrão: os do experimento corrente) servem às métricas. Com
+    `run_kwargs["profile_path"]` (prefixo dos arquivos), a otimização e os
+    indicadores são perfilados segundo `config["profile"]` (ver `_run_profiler`).
+    Retorna o dicionário salvo no JSON da execução.
+    """
+    true_front = _context["true_front"] if true_front is None else true_front
+    ref_pts = _context["ref_pts"] if ref_pts is None else ref_pts
+    bounds = [tuple(b) for b in config["bounds"]]
+    num_obj = config["num_obj"]
+    name = config["implementation"]
+    func = resolve_backend(implementation)
+    profile_path = run_kwargs.get("profile_path")
+    run_kwargs = {"dtype": config["dtype"], **run_kwargs}
+    run_kwargs = {key: value for key, value in run_kwargs.items() if _accepts(func, key)}
+    session = _get_session(func, config) if reuse_session else None
+
+    print(f"[{name}] running")
+
+    run_info: dict = {}
+    stopping = None
+    if config["early_stopping"] is not None:
+        stopping_params = dict(config["early_stopping"])
+        if stopping_params.get("indicator") == "igd":
+            stopping_params.setdefault("ref_front", true_front)
+        stopping = StagnationStopping(**stopping_params)
+    recorder = None
+    if config["trajectory"] is not None:
+        recorder = TrajectoryRecorder(_front_index(true_front, config["dtype"]), callback=stopping, **config["trajectory"])
+    resumed = "checkpoint_path" in run_kwargs and Path(run_kwargs["checkpoint_path"]).exists()
+
+    if config["batch_operators"]:
+        crossover = SBXCrossover(bounds, eta=config["eta_c"], cxpb=config["pb_c"])
+        mutation = PolynomialMutation(eta=config["eta_m"], mutation_rate=config["pb_m"], per_gene_prob=config["pb_pg_m"])
+    else:
+        crossover = lambda p1, p2 : sbx_crossover(p1, p2, bounds, eta=config["eta_c"], cxpb=config["pb_c"])
+        mutation = lambda ind, bds : polynomial_mutation(ind, bds, eta=config["eta_m"], mutation_rate=config["pb_m"], per_gene_prob=config["pb_pg_m"])
+    options = dict(
+        max_evals=config["max_evals"],
+        time_budget=config["time_budget"],
+        callback=recorder if recorder is not None else stopping,
+        seed=config["seed"],
+        info=run_info,
+        **run_kwargs
+    )
+
+    memory = MemoryProfiler(**config["memory_profile"]) if config["memory_profile"] is not None else None
+    with memory if memory is not None else nullcontext(), _run_profiler(config, profile_path, "optimizer"):
+        start_time = time.perf_counter() # START TIME
+        start_cpu = time.process_time()
+        if session is not None:
+            pareto_front = session.run(config["pop_size"], config["num_gen"], crossover, mutation, **options)
+        else:
+            pareto_front = func(
+                config["pop_size"],
+                config["num_gen"],
+                bounds,
+                DTLZ2(num_obj),
+                crossover,
+                mutation,
+                divisions=config["divisions"],
+                **options
+            )
+        elapsed_time = time.perf_counter() - start_time # ELAPSED
+        cpu_time = time.process_time() - start_cpu
+    memory_report = memory.report() if memory is not None else None
+
+    # Indicadores calculados (e fronteira armazenada) na precisão configurada
+    pareto_front = np.asarray(pareto_front, dtype=config["dtype"])
+
+    with _run_profiler(config, profile_path, "indicators"):
+        start_time = time.perf_counter() # START TIME
+        delta = 0.1
+        worst_pt = np.max(pareto_front, axis=0) + delta
+        hv = hypervolume(pareto_front, worst_pt.tolist())
+        hv_elapsed_time = time.perf_counter() - start_time # ELAPSED
+
+        ref_index = _ref_index(ref_pts)
+        start_time = time.perf_counter() # START TIME
+        ptin, ptout = count_points_per_niche_dtlz2(pareto_front, ref_pts, config["radius_ref"], ref_index)
+        counter_elapsed_time = time.perf_counter() - start_time # ELAPSED
+
+        start_time = time.perf_counter() # START TIME
+        niche_metrics = analyze_niche_distribution(ptin, ptout)
+        analyze_elapsed_time = time.perf_counter() - start_time # ELAPSED
+
+        start_time = time.perf_counter() # START TIME
+        gdv = gd(pareto_front, true_front, dtype=config["dtype"])
+        gd_elapsed_time = time.perf_counter() - start_time # ELAPSED
+
+        start_time = time.perf_counter() # START TIME
+        igdv = igd(pareto_front, true_front, dtype=config["dtype"])
+        igd_elapsed_time = time.perf_counter() - start_time # ELAPSED
+
+    print_data = {
+        "implementation": name,
+        "elapsed_time": elapsed_time,
+        "cpu_time": cpu_time,
+        "hv_elapsed_time": hv_elapsed_time,
+        "count_elapsed_time": counter_elapsed_time,
+        "analyze_elapsed_time": analyze_elapsed_time,
+        "gd_elapsed_time": gd_elapsed_time,
+        "igd_elapsed_time": igd_elapsed_time,
+        "n_evals": run_info["n_evals"],
+        "n_gen": run_info["n_gen"],
+        "stop_reason": run_info["stop_reason"],
+        "memory": memory_report,
+        "worst_point": worst_pt.tolist(),
+        "delta": delta,
+        "hypervolume": hv,
+        "gd": gdv,
+        "igd": igdv,
+        "points_out_r": ptout,
+        "niche_metrics": niche_metrics,
+    }
+    print(json.dumps(print_data, indent=2))
+
+    data = {
+        "implementation": name,
+        "seed": config["seed"],
+        "elapsed_time": elapsed_time,
+        "cpu_time": cpu_time,
+        "hv_elapsed_time": hv_elapsed_time,
+        "count_elapsed_time": counter_elapsed_time,
+        "analyze_elapsed_time": analyze_elapsed_time,
+        "gd_elapsed_time": gd_elapsed_time,
+        "igd_elapsed_time": igd_elapsed_time,
+        "n_evals": run_info["n_evals"],
+        "n_gen": run_info["n_gen"],
+        "optimizer_elapsed_time": run_info["elapsed_time"],
+        "stop_reason": run_info["stop_reason"],
+        "resumed_from_checkpoint": resumed,
+        "eval_cache": run_info.get("cache"),
+        "peak_rss_mb": memory_report["peak_rss_mb"] if memory_report is not None else None,
+        "peak_rss_delta_mb": memory_report["peak_rss_delta_mb"] if memory_report is not None else None,
+        "memory": memory_report,
+        "benchmark": _benchmark_report() if config["benchmark"] is not None else None,
+        "worst_point": worst_pt.tolist(),
+        "delta": delta,
+        "hypervolume": hv,
+        "gd": gdv,
+        "igd": igdv,
+        "points_per_niche": [float(v) for v in ptin],
+        "points_out_r": ptout,
+        "niche_metrics": niche_metrics,
+        "trajectory": recorder.to_dict() if recorder is not None else None,
+        # Representação mais curta na precisão da fronteira (float32 ocupa menos texto)
+        "pareto_front": [[float(str(v)) for v in sol] for sol in pareto_front],
+    }
+    return data
+
+def _execute_task(task: tuple[int, str | NSGA3Callable, dict, dict, bool]) -> tuple[int, dict]:
+    index, implementation, config, run_kwargs, reuse_session = task
+    return index, execute_run(implementation, config, run_kwargs, reuse_session)
+
+def _prepare_benchmark_process(benchmark: dict) -> None:
+    """
+    Aplica ao processo corrente as threads de BLAS e a afinidade do modo
+    benchmark. Com `cpus`, cada processo trabalhador fica em uma CPU da lista
+    (em rodízio) e o processo principal em todas elas.
+    """
+    info: dict = {}
+    if benchmark.get("blas_threads") is not None:
+        info.update(pin_blas_threads(benchmark["blas_threads"]))
+    cpus = benchmark.get("cpus")
+    if cpus:
+        identity = mp.current_process()._identity  # vazio no processo principal
+        info["affinity_set"] = set_affinity([cpus[(identity[0] - 1) % len(cpus)]] if identity else cpus)
+    _context["benchmark_env"] = info
+
+def _init_benchmark_worker(true_front_desc: tuple, ref_pts_desc: tuple, benchmark: dict) -> None:
+    _init_worker(true_front_desc, ref_pts_desc)
+    _prepare_benchmark_process(benchmark)
+
+def _benchmark_report() -> dict:
+    """Ambiente em que a execução medida rodou (modo benchmark)."""
+    return {**_context.get("benchmark_env", {}), "pid": os.getpid(), "affinity": current_affinity()}
+
+def _execute_benchmark_task(task: tuple[int, str | NSGA3Callable, dict, dict, bool]) -> tuple[int, dict]:
+    """
+    Execução do modo benchmark: na primeira execução de cada implementação no
+    processo, `warmup` execuções descartadas (importações, caches e compilação
+    do backend); antes da execução medida, uma coleta de lixo completa.
+    """
+    index, implementation, config, run_kwargs, reuse_session = task
+    warmed: set[str] = _context.setdefault("warmed", set())
+    if config["implementation"] not in warmed:
+        warmup_kwargs = {k: v for k, v in run_kwargs.items() if k not in ("checkpoint_path", "profile_path")}
+        with redirect_stdout(io.StringIO()):
+            for _ in range(config["benchmark"].get("warmup", 1)):
+                execute_run(implementation, config, warmup_kwargs, reuse_session)
+        warmed.add(config["implementation"])
+    gc.collect()
+    return index, execute_run(implementation, config, run_kwargs, reuse_session)
 
 def run_experiemnt_with_dtlz2(
     pop_size: int,
@@ -19,141 +498,221 @@ def run_experiemnt_with_dtlz2(
     num_obj: int,
     divisions: int,
     radius_ref: float,
-    implementations: list[NSGA3Callable],
+    implementations: list[str | NSGA3Callable],
     num_loops: int,
     output_dir: Path,
     pb_c: float = 0.9,
     eta_c: float = 20.0,
     pb_m: float = 0.1,
     eta_m: float = 20.0,
-    pb_pg_m: float | None = None
+    pb_pg_m: float | None = None,
+    seed: int | None = None,
+    n_workers: int | None = None,
+    reuse_sessions: bool = False,
+    algorithm: AlgorithmConfig | None = None,
+    budget: BudgetConfig | None = None,
+    caching: CacheConfig | None = None,
+    profiling: ProfilingConfig | None = None,
+    benchmark: BenchmarkConfig | None = None
     )->None:
-    
-    # Pontos de referência précalculados para uso nas comparações   
-    ref_pts = generate_reference_points(num_obj, divisions)
-    
-    true_front = dtlz2_true_front(600, num_obj)
-    
-    stats = {
-        func.__name__: {
-            "elapsed_time": [], 
-            "hv_elapsed_time": [], 
-            "count_elapsed_time": [], 
-            "analyze_elapsed_time": [], 
-            "gd_elapsed_time": [], 
-            "igd_elapsed_time": [], 
-            "hypervolume": [],
-            "coverage": [],
-            "empty_ratio": [],
-            "outside_rate": [],
-            "entropy_norm": [],
-            "gini": [],
-            "chi2": [],
-            "avg_active": [],
-            "max_density": [],
-            "std_density": [],
-            "CUS": [],
-            "gd": [],
-            "igd": []
-            } for func in implementations}
-
-    for exp_index in range(num_loops):
+    """
+    Executa `num_loops` repetições de cada implementação no DTLZ2 (pelo nome registrado
+    em `algorithms.registry` ou pela função) e salva um JSON por execução e o
+    `summary.json` em `output_dir`. Com `seed`, a repetição `i` usa a semente `seed + i`;
+    com `n_workers`, as execuções rodam em um Pool de processos; com `reuse_sessions`,
+    as sessões das implementações são reaproveitadas entre repetições. Os demais grupos
+    de opções estão em `experiments.runner_config`.
+    """
+    algorithm = algorithm or AlgorithmConfig()
+    budget = budget or BudgetConfig()
+    caching = caching or CacheConfig()
+    profiling = profiling or ProfilingConfig()
+    eliminate_duplicates, batch_operators = algorithm.eliminate_duplicates, algorithm.batch_operators
+    dtype, n_islands = algorithm.dtype, algorithm.n_islands
+    max_evals, time_budget = budget.max_evals, budget.time_budget
+    early_stopping, sequential = budget.early_stopping, budget.sequential
+    cache_dir, eval_cache_size, eval_cache_tol = caching.cache_dir, caching.eval_cache_size, caching.eval_cache_tol
+    resume, checkpoint_every = caching.resume, caching.checkpoint_every
+    trajectory, memory_profile, profile = profiling.trajectory, profiling.memory_profile, profiling.profile
+    # O modo benchmark segue como dicionário na configuração de cada execução (e nos processos)
+    benchmark = benchmark.to_dict() if benchmark is not None else None
+
+    # Pontos de referência précalculados para uso nas comparações
+    ref_pts = generate_reference_points(num_obj, divisions, dtype=dtype)
+
+    true_front_file = output_dir / "true_front.npy"
+    if resume and true_front_file.exists():
+        true_front = np.load(true_front_file).astype(dtype, copy=False)
+    else:
+        true_front = dtlz2_true_front(600, num_obj, seed=seed, dtype=dtype)
+        np.save(true_front_file, true_front)
+    _context["true_front"] = true_front
+    _context["ref_pts"] = ref_pts
+
+    names = {backend_name(impl): impl for impl in implementations}
+
+    stats = {name: new_stats() for name in names}
+    trajectory_stats = {name: TrajectoryStats() for name in names}
+
+    cache = RunCache(cache_dir) if cache_dir is not None else None
+
+    # Execuções pendentes: (índice, implementação, configuração, kwargs, arquivo, checkpoint)
+    pending: list[tuple[int, NSGA3Callable, dict, dict, Path, Path]] = []
+
+    # Modo sequencial: valores por repetição das métricas acompanhadas
+    sequential_rule = SequentialStopping(**sequential) if sequential is not None else None
+    samples = (
+        {name: {metric: [] for metric in sequential_rule.metrics} for name in names}
+        if sequential_rule is not None else None
+    )
+
+    def record(name: str, data: dict) -> None:
+        accumulate(stats[name], data)
+        if data.get("trajectory") is not None:
+            trajectory_stats[name].update(data["trajectory"])
+        if samples is not None:
+            # Mesmas exclusões das estatísticas: tempos de execuções retomadas ou do cache não entram
+            measured = measurements(data)
+            for metric, values in samples[name].items():
+                if metric in measured:
+                    values.append(measured[metric])
+
+    # Parâmetros de cada execução, com as mesmas chaves das varreduras
+    run_params = {
+        "pop_size": pop_size, "num_gen": num_gen, "bounds": bounds, "num_obj": num_obj,
+        "divisions": divisions, "radius_ref": radius_ref,
+        "pb_c": pb_c, "eta_c": eta_c, "pb_m": pb_m, "eta_m": eta_m, "pb_pg_m": pb_pg_m,
+        "max_evals": max_evals, "time_budget": time_budget, "early_stopping": early_stopping,
+        "eval_cache_size": eval_cache_size, "eval_cache_tol": eval_cache_tol,
+        "eliminate_duplicates": eliminate_duplicates, "batch_operators": batch_operators,
+        "dtype": dtype, "n_islands": n_islands,
+        "trajectory": trajectory, "memory_profile": memory_profile, "profile": profile,
+    }
+
+    def queue_loop(exp_index: int) -> None:
         # Loop de execuções das implementações
-        for func in implementations:
-            print(f"[{func.__name__}] running")
-            
-            start_time = time.time() # START TIME
-            pareto_front = func(
-                pop_size,
-                num_gen,
-                bounds,
-                lambda x : dtlz2(x, M=num_obj),
-                lambda p1, p2 : sbx_crossover(p1, p2, bounds, eta=eta_c, cxpb=pb_c),
-                lambda ind, bds : polynomial_mutation(ind, bds, eta=eta_m, mutation_rate=pb_m, per_gene_prob=pb_pg_m),
-                divisions=divisions
+        for name, impl in names.items():
+            file_path = output_dir / f"run_{exp_index:03d}_{name}.json"
+            if resume and file_path.exists():
+                with open(file_path) as f:
+                    record(name, json.load(f))
+                print(f"[{name}] Loaded {file_path}")
+                continue
+
+            run_config = build_run_config(name, run_params, exp_index, seed, benchmark)
+            if cache is not None and cacheable(run_config):
+                cached = cache.get(RunCache.key(run_config))
+                if cached is not None:
+                    cached["cached"] = True
+                    record(name, cached)
+                    save_json(file_path, cached)
+                    print(f"[{name}] Cache hit -> {file_path}")
+                    continue
+
+            run_kwargs = build_run_kwargs(run_params)
+            checkpoint_file = output_dir / "checkpoints" / f"run_{exp_index:03d}_{name}.ckpt"
+            if not resume:
+                # Checkpoint de uma execução anterior interrompida: só é retomado com `resume`
+                checkpoint_file.unlink(missing_ok=True)
+            if checkpoint_every is not None:
+                run_kwargs["checkpoint_path"] = checkpoint_file
+                run_kwargs["checkpoint_every"] = checkpoint_every
+            if run_config["profile"] is not None:
+                run_kwargs["profile_path"] = output_dir / "profiles" / f"run_{exp_index:03d}_{name}"
+
+            pending.append((exp_index, impl, run_config, run_kwargs, file_path, checkpoint_file))
+
+    def finish_run(task_index: int, data: dict) -> None:
+        _, _, run_config, _, file_path, checkpoint_file = pending[task_index]
+        name = run_config["implementation"]
+
+        # Accumulates metrics
+        record(name, data)
+
+        # save JSON
+        save_json(file_path, data)
+        checkpoint_file.unlink(missing_ok=True)
+        if cache is not None and cacheable(run_config):
+            cache.put(RunCache.key(run_config), run_config, data)
+
+        print(f"[{name}] Saved {file_path} (time={data['elapsed_time']:.3f}s)")
+
+    def run_loops(start: int, stop: int, pool) -> None:
+        first = len(pending)
+        for exp_index in range(start, stop):
+            queue_loop(exp_index)
+        tasks = [
+            (i, impl, run_config, run_kwargs, reuse_sessions)
+            for i, (_, impl, run_config, run_kwargs, _, _) in enumerate(pending[first:], start=first)
+        ]
+        execute = _execute_benchmark_task if benchmark is not None else _execute_task
+        results = map(execute, tasks) if pool is None else pool.imap_unordered(execute, tasks)
+        for task_index, data in results:
+            finish_run(task_index, data)
+
+    # Lotes de repetições: todas de uma vez ou, no modo sequencial, até a regra parar
+    loop_batches = [(0, num_loops)] if sequential_rule is None else sequential_rule.batches(num_loops)
+    num_loops_run = 0
+    decision = None
+    pool = None
+    shared: list[SharedArray] = []
+    saved_env = {var: os.environ.get(var) for var in blas_env(1)}
+    isolation = benchmark["isolation"] if benchmark is not None else None
+    available = current_affinity()
+    if benchmark is not None and benchmark.get("cpus") and available is not None:
+        missing = sorted(set(benchmark["cpus"]) - set(available))
+        if missing:
+            raise ValueError(f"CPUs fora da afinidade do processo: {missing} (disponíveis: {available})")
+    if benchmark is not None and isolation is None and n_workers is not None:
+        raise ValueError("O modo benchmark sem isolation roda em série: use isolation='prefork' com n_workers")
+    try:
+        if benchmark is not None and isolation is None:
+            _prepare_benchmark_process(benchmark)
+        elif benchmark is not None:
+            # Processos novos (spawn): as variáveis de BLAS valem desde a importação do NumPy
+            if benchmark.get("blas_threads") is not None:
+                os.environ.update(blas_env(benchmark["blas_threads"]))
+            shared = [SharedArray.from_array(true_front), SharedArray.from_array(ref_pts)]
+            pool = mp.get_context("spawn").Pool(
+                n_workers or 1,
+                initializer=_init_benchmark_worker,
+                initargs=(shared[0].descriptor(), shared[1].descriptor(), benchmark),
+                maxtasksperchild=1 if isolation == "fresh" else None
             )
-            elapsed_time = time.time() - start_time # ELAPSED
-            
-            start_time = time.time() # START TIME
-            delta = 0.1
-            worst_pt = np.max(pareto_front, axis=0) + delta
-            hv = hypervolume(pareto_front, worst_pt.tolist())
-            hv_elapsed_time = time.time() - start_time # ELAPSED
-            
-            start_time = time.time() # START TIME            
-            ptin, ptout = count_points_per_niche_dtlz2(pareto_front, ref_pts, radius_ref)            
-            counter_elapsed_time = time.time() - start_time # ELAPSED
-            
-            start_time = time.time() # START TIME     
-            niche_metrics = analyze_niche_distribution(ptin, ptout)   
-            analyze_elapsed_time = time.time() - start_time # ELAPSED
-            
-            start_time = time.time() # START TIME     
-            gdv = gd(pareto_front, true_front)
-            gd_elapsed_time = time.time() - start_time # ELAPSED
-            
-            start_time = time.time() # START TIME     
-            igdv = igd(pareto_front, true_front)
-            igd_elapsed_time = time.time() - start_time # ELAPSED
-            
-            print_data = {
-                "implementation": func.__name__,
-                "elapsed_time": elapsed_time,
-                "hv_elapsed_time": hv_elapsed_time,
-                "count_elapsed_time": counter_elapsed_time,
-                "analyze_elapsed_time": analyze_elapsed_time,
-                "gd_elapsed_time": gd_elapsed_time,
-                "igd_elapsed_time": igd_elapsed_time,
-                "worst_point": worst_pt.tolist(),
-                "delta": delta,
-                "hypervolume": hv,
-                "gd": gdv,
-                "igd": igdv,
-                "points_out_r": ptout,
-                "niche_metrics": niche_metrics,
-            }
-            print(json.dumps(print_data, indent=2))
-                
-            # Accumulates metrics
-            stats[func.__name__]["elapsed_time"].append(elapsed_time)
-            stats[func.__name__]["hv_elapsed_time"].append(hv_elapsed_time)
-            stats[func.__name__]["count_elapsed_time"].append(counter_elapsed_time)
-            stats[func.__name__]["analyze_elapsed_time"].append(analyze_elapsed_time)
-            stats[func.__name__]["gd_elapsed_time"].append(gd_elapsed_time)
-            stats[func.__name__]["igd_elapsed_time"].append(igd_elapsed_time)
-            stats[func.__name__]["hypervolume"].append(hv)
-            stats[func.__name__]["gd"].append(gdv)
-            stats[func.__name__]["igd"].append(igdv)
-            
-            for key, value in niche_metrics.items():
-                stats[func.__name__][key].append(value)
-            
-            data = {
-                "implementation": func.__name__,
-                "elapsed_time": elapsed_time,
-                "hv_elapsed_time": hv_elapsed_time,
-                "count_elapsed_time": counter_elapsed_time,
-                "analyze_elapsed_time": analyze_elapsed_time,
-                "gd_elapsed_time": gd_elapsed_time,
-                "igd_elapsed_time": igd_elapsed_time,
-                "worst_point": worst_pt.tolist(),
-                "delta": delta,
-                "hypervolume": hv,
-                "gd": gdv,
-                "igd": igdv,
-                "points_per_niche": [float(v) for v in ptin],
-                "points_out_r": ptout,
-                "niche_metrics": niche_metrics,
-                "pareto_front": [list(map(float, sol)) for sol in pareto_front],
-            }
-
-            file_path = output_dir / f"run_{exp_index:03d}_{func.__name__}.json"
-
-            # save JSON
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            print(f"[{func.__name__}] Saved {file_path} (time={elapsed_time:.3f}s)")
+        elif n_workers is not None:
+            shared = [SharedArray.from_array(true_front), SharedArray.from_array(ref_pts)]
+            pool = mp_context().Pool(
+                n_workers,
+                initializer=_init_worker,
+                initargs=(shared[0].descriptor(), shared[1].descriptor())
+            )
+        for start, stop in loop_batches:
+            run_loops(start, stop, pool)
+            num_loops_run = stop
+            if sequential_rule is not None:
+                decision = sequential_rule.decide(samples)
+                print(f"[sequential] {stop} loops: stop={decision['stop']}")
+                if decision["stop"]:
+                    break
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        for array in shared:
+            array.close()
+            array.unlink()
+        if benchmark is not None:
+            # O modo benchmark não deixa threads nem afinidade alteradas no processo de quem chamou
+            for var, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(var, None)
+                else:
+                    os.environ[var] = value
+            if isolation is None:
+                release_blas_threads()
+                if benchmark.get("cpus") and available is not None:
+                    set_affinity(available)
+                _context.pop("benchmark_env", None)
 
     # --- final means calculate ---
     summary = {
@@ -165,42 +724,53 @@ def run_experiemnt_with_dtlz2(
             "divisions": divisions,
             "radius_ref": radius_ref,
             "num_loops": num_loops,
+            "max_evals": max_evals,
+            "time_budget": time_budget,
+            "early_stopping": early_stopping,
+            "checkpoint_every": checkpoint_every,
+            "seed": seed,
+            "eval_cache_size": eval_cache_size,
+            "eval_cache_tol": eval_cache_tol,
+            "eliminate_duplicates": eliminate_duplicates,
+            "n_workers": n_workers,
+            "reuse_sessions": reuse_sessions,
+            "batch_operators": batch_operators,
+            "sequential": sequential,
+            "dtype": dtype,
+            "n_islands": n_islands,
+            "trajectory": trajectory,
+            "memory_profile": memory_profile,
+            "profile": profile,
+            "benchmark": benchmark,
+            "num_loops_run": num_loops_run,
         },
+        "sequential_decision": decision,
         "results": {}
     }
-    for func in implementations:
-        name = func.__name__
-        summary["results"][name] = {
-            "mean_elapsed_time": float(np.mean(stats[name]["elapsed_time"])),
-            "mean_hv_elapsed_time": float(np.mean(stats[name]["hv_elapsed_time"])),
-            "mean_count_elapsed_time": float(np.mean(stats[name]["count_elapsed_time"])),
-            "mean_analyze_elapsed_time": float(np.mean(stats[name]["analyze_elapsed_time"])),
-            "mean_gd_elapsed_time": float(np.mean(stats[name]["gd_elapsed_time"])),
-            "mean_igd_elapsed_time": float(np.mean(stats[name]["igd_elapsed_time"])),
-            "mean_hypervolume": float(np.mean(stats[name]["hypervolume"])),
-            "mean_gd": float(np.mean(stats[name]["gd"])),
-            "mean_igd": float(np.mean(stats[name]["igd"])),
-            "coverage": float(np.mean(stats[name]["coverage"])),
-            "empty_ratio": float(np.mean(stats[name]["empty_ratio"])),
-            "outside_rate": float(np.mean(stats[name]["outside_rate"])),
-            "entropy_norm": float(np.mean(stats[name]["entropy_norm"])),
-            "gini": float(np.mean(stats[name]["gini"])),
-            "chi2": float(np.mean(stats[name]["chi2"])),
-            "avg_active": float(np.mean(stats[name]["avg_active"])),
-            "max_density": float(np.mean(stats[name]["max_density"])),
-            "std_density": float(np.mean(stats[name]["std_density"])),
-            "CUS": float(np.mean(stats[name]["CUS"])),
-        }
+    for name in names:
+        summary["results"][name] = summarize(stats[name])
+    if trajectory is not None:
+        summary["trajectories"] = {name: trajectory_stats[name].summary() for name in names}
 
     print("\n=== Summary of Results ===")
     for name, values in summary["results"].items():
         print(f"\nImplementation: {name}")
         for k, v in values.items():
+            if k in ("stats", "state") or v is None:
+                continue
             print(f"  {k}: {v:.6f}")
 
     # save summary json
     summary_file = output_dir / "summary.json"
-    with open(summary_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    save_json(summary_file, summary)
+
+    print(f"\nSummary saved to {summary_file}")
 
-    print(f"\nSummary saved to {summary_file}")
\ No newline at end of file
+    if profile is not None:
+        profile_hotspots = write_hotspots(output_dir / "profiles", list(names), profile)
+        print("\n=== Profile hot spots (self time, optimizer) ===")
+        for name, by_phase in profile_hotspots["implementations"].items():
+            print(f"\nImplementation: {name}")
+            for entry in by_phase.get("optimizer", {}).get("hotspots", [])[:10]:
+                print(f"  {entry['self_fraction']:6.1%}  {entry['self_time_per_run']:.4f}s/run  {entry['function']}")
+        print(f"\nHot spots saved to {output_dir / 'profiles' / 'hotspots.json'}")
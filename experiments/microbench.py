@@ -0,0 +1,415 @@
+"""
+Microbenchmarks dos componentes do NSGA-III, isolados do restante da execução.
+
+Cada componente (ordenação não-dominada, niching, torneio, SBX, mutação
+polinomial, DTLZ2, hypervolume, GD/IGD, contagem por nicho) é medido sobre
+entradas sintéticas de tamanho `n`, número de objetivos `M` e estrutura de
+dominância controlados, junto com as implementações alternativas que existem no
+repositório (ex.: SBX escalar x em lote). Para cada implementação e `M`, o
+resultado traz o tempo por chamada em cada tamanho e o expoente de escala
+(inclinação do ajuste log-log tempo x n).
+
+Uso:
+    python -m experiments.microbench --sizes 50 100 200 400 --objectives 3 5 --output results/microbench.json
+    python -m experiments.microbench --components nondominated_sort niching --plot results/microbench.png
+
+Os tempos usam `timeit` (relógio `time.perf_counter`, coletor de lixo desligado
+durante a medição): o número de chamadas por repetição é ajustado para que cada
+repetição dure ao menos `min_time` segundos, e são registrados o mínimo, a
+mediana e a média por chamada sobre `repeat` repetições. Os dados de entrada e
+as estruturas reaproveitadas pela implementação real (índice de pontos de
+referência, fronteira verdadeira indexada) são preparados fora da medição.
+"""
+import argparse
+import math
+import random
+import time
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+import numpy as np
+
+from algorithms.pure_nsga3 import (
+    compute_individual_ranks,
+    fast_nondominated_sort,
+    niching_selection,
+    tournament_selection,
+)
+from algorithms.stopping import non_dominated_mask
+from analysis.coverege_per_niche import count_points_per_niche_dtlz2
+from analysis.generational_distance import TrueFrontIndex, gd, igd
+from analysis.indicators import hypervolume
+from genetic_operators.crossover import sbx_crossover, sbx_crossover_batch
+from genetic_operators.mutation import polynomial_mutation, polynomial_mutation_batch
+from problems.dtlz2 import dtlz2, dtlz2_batch, dtlz2_true_front
+from utils.checkpoint import save_json
+from utils.generate_points import generate_reference_points
+from utils.reference_index import ReferenceIndex
+from .regression import environment
+
+FRONT_SHAPES = ("linear", "spherical")
+# Tamanho da fronteira verdadeira usada por GD/IGD e raio de associação por nicho
+TRUE_FRONT_SIZE = 2000
+NICHE_RADIUS = 0.1
+
+
+def synthetic_front(
+    n: int,
+    M: int,
+    n_fronts: int = 1,
+    shape: str = "linear",
+    gap: float = 0.1,
+    seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Conjunto de `n` pontos (minimização) dividido em `n_fronts` frentes de
+    dominância exatas, em ordem embaralhada.
+
+    Os pontos da frente k são as mesmas direções aleatórias (coordenadas
+    positivas) escaladas por 1 + k * gap, sobre o simplex (`shape="linear"`,
+    soma 1) ou sobre a esfera unitária (`shape="spherical"`, como o DTLZ2).
+    Dentro de uma frente nenhum ponto domina outro, e cada ponto da frente k + 1
+    é dominado pela sua cópia na frente k, então a frente de cada ponto é
+    conhecida. Com n não divisível por `n_fronts`, as primeiras frentes ficam com
+    um ponto a mais.
+
+    :param n: Número de pontos
+    :param M: Número de objetivos
+    :param n_fronts: Número de frentes
+    :param shape: "linear" ou "spherical"
+    :param gap: Distância relativa entre frentes consecutivas
+    :param seed: Semente do gerador próprio
+    :return: (F, ranks) -> F de shape (n, M) e a frente (0 = não-dominada) de cada ponto
+    """
+    if shape not in FRONT_SHAPES:
+        raise ValueError(f"shape deve ser um de {FRONT_SHAPES}")
+    if not 1 <= n_fronts <= n:
+        raise ValueError("n_fronts deve estar entre 1 e n")
+    rng = np.random.default_rng(seed)
+    width = math.ceil(n / n_fronts)
+    if shape == "linear":
+        directions = rng.dirichlet(np.ones(M), size=width)
+    else:
+        directions = np.abs(rng.standard_normal((width, M))) + 1e-12
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+    ranks = np.arange(n) % n_fronts
+    columns = np.arange(n) // n_fronts
+    F = directions[columns] * (1 + gap * ranks)[:, None]
+    order = rng.permutation(n)
+    return F[order], ranks[order]
+
+
+def _divisions_for(n: int, M: int) -> int:
+    """Menor número de divisões de Das-Dennis com pelo menos `n` pontos de referência."""
+    p = 1
+    while math.comb(p + M - 1, M - 1) < n:
+        p += 1
+    return p
+
+
+def _population(n: int, M: int, rng: np.random.Generator) -> tuple[np.ndarray, list[tuple[float, float]]]:
+    """População uniforme do DTLZ2 (n_var = M + 9) e seus limites."""
+    n_var = M + 9
+    return rng.random((n, n_var)), [(0.0, 1.0)] * n_var
+
+
+# Cada caso recebe (n, M, n_fronts, shape, seed) e devolve a chamada medida, sem argumentos
+
+def _case_fast_nondominated_sort(n, M, n_fronts, shape, seed):
+    F, _ = synthetic_front(n, M, n_fronts, shape, seed=seed)
+    objectives = [tuple(row) for row in F.tolist()]
+    return lambda: fast_nondominated_sort(objectives)
+
+
+def _case_non_dominated_mask(n, M, n_fronts, shape, seed):
+    # Só a primeira frente: é o que `StagnationStopping` e as trajetórias usam
+    F, _ = synthetic_front(n, M, n_fronts, shape, seed=seed)
+    return lambda: non_dominated_mask(F)
+
+
+def _case_niching_selection(n, M, n_fronts, shape, seed):
+    # Última frente com n pontos, da qual metade é escolhida, e grade com >= n referências
+    F, _ = synthetic_front(n, M, 1, shape, seed=seed)
+    objectives = [tuple(row) for row in F.tolist()]
+    ref_index = ReferenceIndex(generate_reference_points(M, _divisions_for(n, M)))
+    front = list(range(n))
+    random.seed(seed)
+    return lambda: niching_selection(front, objectives, ref_index, n // 2)
+
+
+def _case_tournament_selection(n, M, n_fronts, shape, seed):
+    # Um grupo de cruzamento completo (n torneios), como em cada geração
+    rng = np.random.default_rng(seed)
+    population, _ = _population(n, M, rng)
+    population = list(population)
+    _, ranks = synthetic_front(n, M, n_fronts, shape, seed=seed)
+    fronts = [np.flatnonzero(ranks == k).tolist() for k in range(n_fronts)]
+    individual_ranks = compute_individual_ranks(fronts)
+    random.seed(seed)
+    return lambda: [tournament_selection(population, individual_ranks) for _ in range(n)]
+
+
+def _case_sbx_crossover(n, M, n_fronts, shape, seed):
+    rng = np.random.default_rng(seed)
+    X, bounds = _population(n, M, rng)
+    pairs = list(zip(X[0::2], X[1::2]))
+    random.seed(seed)
+    return lambda: [sbx_crossover(p1, p2, bounds) for p1, p2 in pairs]
+
+
+def _case_sbx_crossover_batch(n, M, n_fronts, shape, seed):
+    rng = np.random.default_rng(seed)
+    X, bounds = _population(n, M, rng)
+    m = n // 2
+    np.random.seed(seed)
+    return lambda: sbx_crossover_batch(X[0:2 * m:2], X[1:2 * m:2], bounds)
+
+
+def _case_polynomial_mutation(n, M, n_fronts, shape, seed):
+    rng = np.random.default_rng(seed)
+    X, bounds = _population(n, M, rng)
+    individuals = list(X)
+    random.seed(seed)
+    return lambda: [polynomial_mutation(x, bounds) for x in individuals]
+
+
+def _case_polynomial_mutation_batch(n, M, n_fronts, shape, seed):
+    rng = np.random.default_rng(seed)
+    X, bounds = _population(n, M, rng)
+    np.random.seed(seed)
+    return lambda: polynomial_mutation_batch(X, bounds)
+
+
+def _case_dtlz2(n, M, n_fronts, shape, seed):
+    rng = np.random.default_rng(seed)
+    X, _ = _population(n, M, rng)
+    individuals = list(X)
+    return lambda: [dtlz2(x, M) for x in individuals]
+
+
+def _case_dtlz2_batch(n, M, n_fronts, shape, seed):
+    rng = np.random.default_rng(seed)
+    X, _ = _population(n, M, rng)
+    return lambda: dtlz2_batch(X, M)
+
+
+def _case_hypervolume(n, M, n_fronts, shape, seed):
+    F, _ = synthetic_front(n, M, 1, shape, seed=seed)
+    reference = np.max(F, axis=0) + 0.1
+    return lambda: hypervolume(F, reference)
+
+
+def _case_gd_igd(n, M, n_fronts, shape, seed):
+    F, _ = synthetic_front(n, M, 1, "spherical", seed=seed)
+    true_front = dtlz2_true_front(TRUE_FRONT_SIZE, M, seed=seed)
+    return lambda: (gd(F, true_front), igd(F, true_front))
+
+
+def _case_true_front_index(n, M, n_fronts, shape, seed):
+    F, _ = synthetic_front(n, M, 1, "spherical", seed=seed)
+    front_index = TrueFrontIndex(dtlz2_true_front(TRUE_FRONT_SIZE, M, seed=seed))
+    return lambda: front_index.gd_igd(F)
+
+
+def _case_count_points_per_niche(n, M, n_fronts, shape, seed):
+    F, _ = synthetic_front(n, M, 1, "spherical", seed=seed)
+    ref_points = generate_reference_points(M, _divisions_for(n, M))
+    return lambda: count_points_per_niche_dtlz2(F, ref_points, NICHE_RADIUS)
+
+
+def _case_count_points_per_niche_indexed(n, M, n_fronts, shape, seed):
+    F, _ = synthetic_front(n, M, 1, "spherical", seed=seed)
+    ref_points = generate_reference_points(M, _divisions_for(n, M))
+    index = ReferenceIndex(ref_points)
+    return lambda: count_points_per_niche_dtlz2(F, ref_points, NICHE_RADIUS, index=index)
+
+
+BENCHMARKS: dict[str, Callable[..., Callable[[], Any]]] = {
+    "fast_nondominated_sort": _case_fast_nondominated_sort,
+    "non_dominated_mask": _case_non_dominated_mask,
+    "niching_selection": _case_niching_selection,
+    "tournament_selection": _case_tournament_selection,
+    "sbx_crossover": _case_sbx_crossover,
+    "sbx_crossover_batch": _case_sbx_crossover_batch,
+    "polynomial_mutation": _case_polynomial_mutation,
+    "polynomial_mutation_batch": _case_polynomial_mutation_batch,
+    "dtlz2": _case_dtlz2,
+    "dtlz2_batch": _case_dtlz2_batch,
+    "hypervolume": _case_hypervolume,
+    "gd_igd": _case_gd_igd,
+    "true_front_index": _case_true_front_index,
+    "count_points_per_niche": _case_count_points_per_niche,
+    "count_points_per_niche_indexed": _case_count_points_per_niche_indexed,
+}
+
+# Componentes e as implementações alternativas de cada um
+COMPONENTS: dict[str, tuple[str, ...]] = {
+    "nondominated_sort": ("fast_nondominated_sort", "non_dominated_mask"),
+    "niching": ("niching_selection",),
+    "tournament": ("tournament_selection",),
+    "crossover": ("sbx_crossover", "sbx_crossover_batch"),
+    "mutation": ("polynomial_mutation", "polynomial_mutation_batch"),
+    "dtlz2": ("dtlz2", "dtlz2_batch"),
+    "hypervolume": ("hypervolume",),
+    "gd_igd": ("gd_igd", "true_front_index"),
+    "niche_count": ("count_points_per_niche", "count_points_per_niche_indexed"),
+}
+
+
+def time_call(func: Callable[[], Any], min_time: float = 0.05, repeat: int = 5) -> dict:
+    """
+    Tempo por chamada de `func`: ajusta o número de chamadas por repetição para
+    durar ao menos `min_time` segundos e mede `repeat` repetições.
+    """
+    timer = timeit.Timer(func, timer=time.perf_counter)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    per_call = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": float(per_call.min()),
+        "median": float(np.median(per_call)),
+        "mean": float(per_call.mean()),
+    }
+
+
+def scaling_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """Inclinação do ajuste log-log tempo x n (1 = linear, 2 = quadrático); None com menos de dois tamanhos."""
+    if len(sizes) < 2:
+        return None
+    slope, _ = np.polyfit(np.log(sizes), np.log(times), 1)
+    return float(slope)
+
+
+def run_microbench(
+    components: list[str] | None = None,
+    sizes: list[int] = (50, 100, 200, 400),
+    objectives: list[int] = (3, 5),
+    n_fronts: int = 4,
+    shape: str = "linear",
+    seed: int = 0,
+    min_time: float = 0.05,
+    repeat: int = 5
+) -> dict:
+    """
+    Mede cada implementação dos `components` em todos os tamanhos e números de
+    objetivos. Retorna os parâmetros, o ambiente, os tempos por caso e os
+    expoentes de escala por implementação e M (ajustados sobre o tempo mínimo).
+    """
+    components = list(COMPONENTS) if components is None else components
+    unknown = set(components) - set(COMPONENTS)
+    if unknown:
+        raise ValueError(f"Componentes desconhecidos: {sorted(unknown)}")
+    sizes = sorted(sizes)
+
+    results: list[dict] = []
+    scaling: list[dict] = []
+    for component in components:
+        for name in COMPONENTS[component]:
+            for M in objectives:
+                times: list[float] = []
+                for n in sizes:
+                    func = BENCHMARKS[name](n, M, min(n_fronts, n), shape, seed)
+                    timing = time_call(func, min_time=min_time, repeat=repeat)
+                    times.append(timing["min"])
+                    results.append({"component": component, "benchmark": name, "M": M, "n": n, **timing})
+                    print(
+                        f"[microbench] {component:18s} {name:32s} M={M:<2d} n={n:<6d} "
+                        f"{timing['min'] * 1e3:10.4f} ms/call (x{timing['number']})"
+                    )
+                scaling.append({
+                    "component": component,
+                    "benchmark": name,
+                    "M": M,
+                    "sizes": sizes,
+                    "min": times,
+                    "exponent": scaling_exponent(sizes, times),
+                })
+    return {
+        "params": {
+            "components": components,
+            "sizes": sizes,
+            "objectives": list(objectives),
+            "n_fronts": n_fronts,
+            "shape": shape,
+            "seed": seed,
+            "min_time": min_time,
+            "repeat": repeat,
+        },
+        "environment": environment(),
+        "results": results,
+        "scaling": scaling,
+    }
+
+
+def plot_scaling(report: dict, path: str | Path) -> None:
+    """Curvas de escala log-log (tempo mínimo por chamada x n), um painel por componente."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    components = report["params"]["components"]
+    cols = min(3, len(components))
+    rows = math.ceil(len(components) / cols)
+    fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 4 * rows), squeeze=False)
+    for ax, component in zip(axes.flat, components):
+        for curve in report["scaling"]:
+            if curve["component"] != component:
+                continue
+            exponent = curve["exponent"]
+            label = f"{curve['benchmark']} M={curve['M']}"
+            if exponent is not None:
+                label += f" (n^{exponent:.2f})"
+            ax.loglog(curve["sizes"], curve["min"], marker="o", label=label)
+        ax.set_title(component)
+        ax.set_xlabel("n")
+        ax.set_ylabel("s / chamada")
+        ax.legend(fontsize="small")
+    for ax in list(axes.flat)[len(components):]:
+        ax.axis("off")
+    fig.tight_layout()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmarks dos componentes do NSGA-III.")
+    parser.add_argument("--components", nargs="+", choices=list(COMPONENTS), default=None, help="Componentes medidos (padrão: todos)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 100, 200, 400], help="Tamanhos n das entradas")
+    parser.add_argument("--objectives", nargs="+", type=int, default=[3, 5], help="Números de objetivos M")
+    parser.add_argument("--fronts", type=int, default=4, help="Frentes de dominância nas entradas da ordenação e do torneio")
+    parser.add_argument("--shape", choices=FRONT_SHAPES, default="linear", help="Forma das frentes sintéticas")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Duração mínima de cada repetição (s)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por caso")
+    parser.add_argument("--output", type=Path, default=Path("results") / "microbench.json")
+    parser.add_argument("--plot", type=Path, default=None, help="Arquivo da figura das curvas de escala")
+    args = parser.parse_args(argv)
+
+    report = run_microbench(
+        components=args.components,
+        sizes=args.sizes,
+        objectives=args.objectives,
+        n_fronts=args.fronts,
+        shape=args.shape,
+        seed=args.seed,
+        min_time=args.min_time,
+        repeat=args.repeat,
+    )
+    save_json(args.output, report)
+    if args.plot is not None:
+        plot_scaling(report, args.plot)
+
+    print("\n=== Scaling (time ~ n^k) ===")
+    for curve in report["scaling"]:
+        exponent = "-" if curve["exponent"] is None else f"{curve['exponent']:.2f}"
+        print(f"  {curve['component']:18s} {curve['benchmark']:32s} M={curve['M']:<2d} k={exponent}")
+    print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Efeito do modo de precisão simples (`dtype="float32"`) sobre HV e IGD.
+
+Para cada semente, a mesma configuração do DTLZ2 é executada em float64 e em
+float32 (mesmas sementes, execuções pareadas). O resultado registra:
+  - o erro dos indicadores calculados em float32 sobre as fronteiras obtidas em
+    float64 (efeito isolado da precisão nos indicadores);
+  - a comparação das métricas finais das execuções completas em cada precisão
+    (efeito acumulado na otimização), com teste de Mann–Whitney;
+  - a memória dos arrays comuns (fronteira verdadeira e pontos de referência).
+
+Uso:
+    python -m experiments.precision_study --num-obj 3 --num-var 12 --runs 30 --output results/precision.json
+"""
+import argparse
+from pathlib import Path
+import numpy as np
+
+from analysis.precision import compare_precision, indicator_precision_error
+from utils.checkpoint import save_json
+from .experiment_runner import build_run_config, build_run_kwargs
+from .sweep import expand_sweep, problem_data, run_job
+
+METRICS = ("hypervolume", "igd", "gd", "elapsed_time")
+
+
+def run_precision_study(
+    params: dict,
+    runs: int = 30,
+    seed: int = 0,
+    implementation: str = "nsga3_func"
+) -> dict:
+    """
+    :param params: Parâmetros da configuração (os de `experiments.sweep`; `num_obj` e `num_var` obrigatórios)
+    :param runs: Execuções pareadas
+    :param seed: Execução i usa seed + i
+    :param implementation: Backend executado (só os que aceitam `dtype` mudam a precisão da otimização)
+    """
+    samples: dict[str, dict[str, list[float]]] = {}
+    indicator_errors: dict[str, list[float]] = {}
+    for dtype in ("float64", "float32"):
+        config_params = expand_sweep({"params": {**params, "dtype": dtype}})[0]
+        samples[dtype] = {metric: [] for metric in METRICS}
+        true_front = problem_data(config_params["num_obj"], config_params["divisions"], seed, "float64")[0]
+        for i in range(runs):
+            run_config = build_run_config(implementation, config_params, i, seed)
+            _, data = run_job((i, run_config, build_run_kwargs(config_params), False))
+            for metric in METRICS:
+                samples[dtype][metric].append(data[metric])
+            if dtype == "float64":
+                errors = indicator_precision_error(np.array(data["pareto_front"]), true_front)
+                for key, error in errors.items():
+                    indicator_errors.setdefault(key, []).append(error["rel_error"])
+
+    memory = {}
+    for dtype in ("float64", "float32"):
+        true_front, ref_pts = problem_data(params["num_obj"], params.get("divisions", 10), seed, dtype)
+        memory[dtype] = {"true_front_bytes": true_front.nbytes, "ref_points_bytes": ref_pts.nbytes}
+
+    return {
+        "parameters": {**params, "runs": runs, "seed": seed, "implementation": implementation},
+        "indicator_rel_error": {
+            key: {"mean": float(np.mean(values)), "max": float(np.max(values))}
+            for key, values in indicator_errors.items()
+        },
+        "runs": compare_precision(samples["float64"], samples["float32"]),
+        "memory": memory,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Mede o efeito de float32 sobre HV/IGD no DTLZ2.")
+    parser.add_argument("--num-obj", type=int, default=3)
+    parser.add_argument("--num-var", type=int, default=12)
+    parser.add_argument("--pop-size", type=int, default=92)
+    parser.add_argument("--num-gen", type=int, default=100)
+    parser.add_argument("--divisions", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--implementation", default="nsga3_func")
+    parser.add_argument("--output", type=Path, default=Path("results/precision_study.json"))
+    args = parser.parse_args(argv)
+
+    params = {
+        "num_obj": args.num_obj,
+        "num_var": args.num_var,
+        "pop_size": args.pop_size,
+        "num_gen": args.num_gen,
+        "divisions": args.divisions,
+    }
+    report = run_precision_study(params, args.runs, args.seed, args.implementation)
+    save_json(args.output, report)
+    for metric, values in report["runs"].items():
+        print(f"{metric}: float64={values['mean_float64']:.6g} float32={values['mean_float32']:.6g} "
+              f"rel_diff={values['rel_diff_mean']:+.2e} p={values['pvalue']:.3f}")
+    print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
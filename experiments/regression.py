@@ -0,0 +1,242 @@
+"""
+Acompanhamento de regressões de desempenho contra um baseline salvo.
+
+Um conjunto fixo de configurações pequenas (uma especificação de varredura, ver
+`experiments.sweep`) é executado e os valores por execução de cada métrica são
+comparados com os de um baseline gravado antes, por configuração e
+implementação, com o teste de Mann–Whitney (robusto a caudas e valores
+atípicos, comuns em tempos) e ajuste de Holm sobre todas as comparações. Uma
+métrica regrediu se a diferença for significativa e a mediana piorar mais que
+`min_effect` (fração). Com alguma regressão, ou com execuções ausentes no
+baseline ou na verificação (baseline incompleto), o comando termina com código 1.
+
+Uso:
+    python -m experiments.regression record experiments/sweeps/regression_canonical.json --baseline benchmarks/baseline
+    python -m experiments.regression check experiments/sweeps/regression_canonical.json --baseline benchmarks/baseline
+
+O baseline é a pasta de saída de uma varredura (uma pasta por configuração, com
+os JSON por execução) e um `environment.json` com a máquina e o commit em que
+foi gravado. Além das chaves da varredura, a especificação aceita:
+    "metrics": {"elapsed_time": "lower", "hypervolume": "higher", ...},  # sentido da melhora
+    "alpha": 0.05,        # nível das comparações (após o ajuste de Holm)
+    "min_effect": 0.05    # piora relativa mínima da mediana para acusar regressão
+As execuções são seriais por padrão, para que os tempos não incluam a disputa
+entre processos; o cache de execuções nunca é usado.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+import numpy as np
+
+from algorithms.registry import backend_name
+from analysis.stat_tests import holm_adjust, mann_whitney_u
+from utils.checkpoint import save_json
+from .experiment_runner import metric_value
+from .sweep import config_dir_name, expand_sweep, run_sweep
+
+# Métricas comparadas por padrão e o sentido da melhora
+DEFAULT_METRICS: dict[str, str] = {
+    "elapsed_time": "lower",
+    "hv_elapsed_time": "lower",
+    "count_elapsed_time": "lower",
+    "gd_elapsed_time": "lower",
+    "igd_elapsed_time": "lower",
+    "hypervolume": "higher",
+    "igd": "lower",
+}
+
+
+def environment() -> dict:
+    """Descrição da máquina e do código em que os resultados foram obtidos."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def load_runs(config_dir: Path, name: str) -> list[dict]:
+    """JSON por execução (`run_NNN_<name>.json`) da implementação `name` em `config_dir`."""
+    runs = []
+    for path in sorted(config_dir.glob(f"run_*_{name}.json")):
+        # O nome exato evita misturar implementações cujo nome contém o de outra
+        if path.name[len("run_000_"):] == f"{name}.json":
+            with open(path) as f:
+                runs.append(json.load(f))
+    return runs
+
+
+def compare_metric(baseline: np.ndarray, current: np.ndarray, direction: str) -> dict:
+    """
+    Compara os valores de uma métrica: medianas, variação relativa da mediana
+    (positiva = piora, no sentido `direction`) e p-valor de Mann–Whitney.
+    """
+    baseline = np.asarray(baseline, dtype=float)
+    current = np.asarray(current, dtype=float)
+    base_median = float(np.median(baseline))
+    current_median = float(np.median(current))
+    change = (current_median - base_median) / abs(base_median) if base_median != 0 else current_median - base_median
+    _, pvalue = mann_whitney_u(current, baseline)
+    return {
+        "baseline_median": base_median,
+        "current_median": current_median,
+        "n_baseline": len(baseline),
+        "n_current": len(current),
+        "worsening": change if direction == "lower" else -change,
+        "pvalue": pvalue,
+    }
+
+
+def compare_dirs(
+    spec: dict,
+    baseline_dir: Path,
+    current_dir: Path,
+    metrics: dict[str, str] | None = None,
+    alpha: float = 0.05,
+    min_effect: float = 0.05
+) -> dict:
+    """
+    Compara as execuções de `current_dir` com as de `baseline_dir` para cada
+    configuração e implementação de `spec`. Retorna o relatório, com o status de
+    cada comparação ("regression", "improvement" ou "ok") e a lista de regressões.
+    """
+    metrics = DEFAULT_METRICS if metrics is None else metrics
+    names = [backend_name(name) for name in spec["implementations"]]
+    comparisons: list[dict] = []
+    missing: list[str] = []
+    for params in expand_sweep(spec):
+        config = config_dir_name(params)
+        for name in names:
+            base_runs = load_runs(baseline_dir / config, name)
+            current_runs = load_runs(current_dir / config, name)
+            if not base_runs or not current_runs:
+                missing.append(f"{config}/{name}")
+                continue
+            for metric, direction in metrics.items():
+                base_values = [metric_value(data, metric) for data in base_runs]
+                current_values = [metric_value(data, metric) for data in current_runs]
+                base_values = [v for v in base_values if v is not None]
+                current_values = [v for v in current_values if v is not None]
+                if not base_values or not current_values:
+                    continue
+                comparisons.append({
+                    "config": config,
+                    "implementation": name,
+                    "metric": metric,
+                    **compare_metric(base_values, current_values, direction),
+                })
+
+    adjusted = holm_adjust([c["pvalue"] for c in comparisons]) if comparisons else []
+    for comparison, padj in zip(comparisons, adjusted):
+        comparison["pvalue_adjusted"] = float(padj)
+        significant = padj < alpha
+        if significant and comparison["worsening"] > min_effect:
+            comparison["status"] = "regression"
+        elif significant and comparison["worsening"] < -min_effect:
+            comparison["status"] = "improvement"
+        else:
+            comparison["status"] = "ok"
+    return {
+        "alpha": alpha,
+        "min_effect": min_effect,
+        "comparisons": comparisons,
+        "missing": missing,
+        "regressions": [c for c in comparisons if c["status"] == "regression"],
+        "improvements": [c for c in comparisons if c["status"] == "improvement"],
+    }
+
+
+def record(spec: dict, baseline_dir: Path, n_workers: int = 1) -> None:
+    """Executa as configurações canônicas e grava o baseline em `baseline_dir`."""
+    if baseline_dir.exists() and any(baseline_dir.iterdir()):
+        raise FileExistsError(f"{baseline_dir} já existe; use outra pasta ou apague o baseline antigo")
+    run_sweep(spec, n_workers=n_workers, output_dir=baseline_dir)
+    save_json(baseline_dir / "environment.json", environment())
+    print(f"[regression] Baseline saved to {baseline_dir}")
+
+
+def check(spec: dict, baseline_dir: Path, output_dir: Path | None = None, n_workers: int = 1) -> dict:
+    """
+    Executa as configurações canônicas em uma pasta nova e as compara com o
+    baseline. O relatório é salvo em `output_dir/regression_report.json`.
+    """
+    if output_dir is None:
+        output_dir = Path("results") / f"regression_{time.strftime('%Y%m%d_%H%M%S')}"
+    if output_dir.exists() and any(output_dir.iterdir()):
+        raise FileExistsError(f"{output_dir} já existe; as execuções precisam ser novas")
+    run_sweep(spec, n_workers=n_workers, output_dir=output_dir)
+    current_env = environment()
+    save_json(output_dir / "environment.json", current_env)
+
+    baseline_env: dict = {}
+    if (baseline_dir / "environment.json").exists():
+        with open(baseline_dir / "environment.json") as f:
+            baseline_env = json.load(f)
+    for key in ("platform", "processor", "cpu_count", "python", "numpy"):
+        if baseline_env.get(key) != current_env[key]:
+            print(f"[regression] Warning: {key} differs from the baseline ({baseline_env.get(key)} -> {current_env[key]})")
+
+    report = compare_dirs(
+        spec, baseline_dir, output_dir,
+        metrics=spec.get("metrics"),
+        alpha=float(spec.get("alpha", 0.05)),
+        min_effect=float(spec.get("min_effect", 0.05)),
+    )
+    report["baseline"] = {"dir": str(baseline_dir), "environment": baseline_env}
+    report["current"] = {"dir": str(output_dir), "environment": current_env}
+    save_json(output_dir / "regression_report.json", report)
+
+    print("\n=== Regression check ===")
+    for c in report["comparisons"]:
+        if c["status"] != "ok":
+            print(
+                f"  {c['status'].upper():11s} {c['config']} {c['implementation']} {c['metric']}: "
+                f"{c['baseline_median']:.6g} -> {c['current_median']:.6g} "
+                f"({c['worsening']:+.1%} worse, p_adj={c['pvalue_adjusted']:.3g})"
+            )
+    for entry in report["missing"]:
+        print(f"  MISSING     {entry}")
+    print(
+        f"\n{len(report['comparisons'])} comparisons: {len(report['regressions'])} regressions, "
+        f"{len(report['improvements'])} improvements, {len(report['missing'])} missing. "
+        f"Report saved to {output_dir / 'regression_report.json'}"
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compara o desempenho atual com um baseline salvo.")
+    parser.add_argument("command", choices=["record", "check"], help="Grava o baseline ou compara com ele")
+    parser.add_argument("spec", type=Path, help="Especificação das configurações canônicas (formato de experiments.sweep)")
+    parser.add_argument("--baseline", type=Path, required=True, help="Pasta do baseline")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Pasta das execuções atuais (check)")
+    parser.add_argument("--workers", type=int, default=1, help="Processos (padrão: 1, tempos sem disputa)")
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    if args.command == "record":
+        record(spec, args.baseline, args.workers)
+        return
+    report = check(spec, args.baseline, args.output_dir, args.workers)
+    if report["regressions"] or report["missing"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
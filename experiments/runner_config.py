@@ -0,0 +1,102 @@
+"""
+Grupos de opções de `run_experiemnt_with_dtlz2`. Cada grupo é opcional: None (ou o
+objeto com os valores padrão) mantém o comportamento original do runner.
+"""
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Modos de isolamento do modo benchmark (None = no processo corrente)
+BENCHMARK_ISOLATION = (None, "fresh", "prefork")
+
+
+@dataclass
+class BudgetConfig:
+    """
+    Critérios de parada de cada execução e do número de repetições.
+
+    :param max_evals: Avaliações máximas por execução
+    :param time_budget: Tempo de parede máximo por execução, em segundos
+    :param early_stopping: Parâmetros de `StagnationStopping` (parada por estagnação)
+    :param sequential: Parâmetros de `SequentialStopping`; `num_loops` passa a ser o
+        máximo e as repetições param quando as comparações estiverem resolvidas
+    """
+    max_evals: int | None = None
+    time_budget: float | None = None
+    early_stopping: dict | None = None
+    sequential: dict | None = None
+
+
+@dataclass
+class CacheConfig:
+    """
+    Reaproveitamento de trabalho já feito.
+
+    :param cache_dir: Cache de execuções (`utils.run_cache`); só execuções semeadas e
+        sem `time_budget` entram nele, e as vindas dele ficam fora das estatísticas de tempo
+    :param eval_cache_size: Memoização de avaliações por genótipo (`cache_size` das implementações)
+    :param eval_cache_tol: Tolerância da memoização (`cache_tol`)
+    :param resume: Carrega as execuções já salvas em `output_dir` e retoma as interrompidas
+        do checkpoint; sem `resume`, checkpoints antigos são descartados
+    :param checkpoint_every: Gerações entre checkpoints (implementações com `checkpoint_path`)
+    """
+    cache_dir: Path | None = None
+    eval_cache_size: int | None = None
+    eval_cache_tol: float | None = None
+    resume: bool = False
+    checkpoint_every: int | None = None
+
+
+@dataclass
+class AlgorithmConfig:
+    """
+    Variantes das implementações, repassadas às que as aceitam.
+
+    :param eliminate_duplicates: Eliminação de duplicatas (None = padrão de cada implementação)
+    :param batch_operators: SBX/mutação com versão em lote (sorteios de `np.random`)
+    :param dtype: "float64" ou "float32" (fronteira verdadeira, referências, indicadores e fronteiras salvas)
+    :param n_islands: Ilhas do modo arquipélago (PyGMO)
+    """
+    eliminate_duplicates: bool | float | None = None
+    batch_operators: bool = False
+    dtype: str = "float64"
+    n_islands: int | None = None
+
+
+@dataclass
+class ProfilingConfig:
+    """
+    Instrumentação das execuções; os tempos medidos incluem o seu custo.
+
+    :param trajectory: Parâmetros de `TrajectoryRecorder` (curvas de HV/IGD por geração)
+    :param memory_profile: Parâmetros de `MemoryProfiler` (pico de RSS e alocações)
+    :param profile: Perfil das repetições `runs` (ex.: `{"kind": "sample", "runs": [0]}`,
+        ver `utils.profiling`); os pontos quentes vão para `profiles/hotspots.json`
+    """
+    trajectory: dict | None = None
+    memory_profile: dict | None = None
+    profile: dict | None = None
+
+
+@dataclass
+class BenchmarkConfig:
+    """
+    Modo benchmark: medições em ambiente controlado, registrado no JSON de cada execução.
+
+    :param blas_threads: Threads de BLAS/OpenMP
+    :param cpus: Afinidade de CPU (Linux); cada processo trabalhador fica em uma CPU da lista
+    :param warmup: Execuções descartadas por implementação e processo antes das medidas
+    :param isolation: None (em série no processo corrente, sem `n_workers`; threads,
+        variáveis de ambiente e afinidade são restauradas ao final), "prefork" (`n_workers` processos
+        spawn reaproveitados) ou "fresh" (um processo novo por repetição)
+    """
+    blas_threads: int | None = None
+    cpus: list[int] | None = None
+    warmup: int = 1
+    isolation: str | None = None
+
+    def __post_init__(self):
+        if self.isolation not in BENCHMARK_ISOLATION:
+            raise ValueError(f"isolation deve ser um de {BENCHMARK_ISOLATION}")
+
+    def to_dict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,259 @@
+"""
+Varredura declarativa de experimentos no DTLZ2.
+
+Uma especificação JSON descreve a grade de parâmetros; a varredura é expandida
+em configurações (uma pasta por configuração, com o mesmo formato de saída de
+`run_experiemnt_with_dtlz2`) e em execuções individuais, distribuídas em um Pool
+de processos local. Cada execução é salva assim que termina e o `summary.json`
+da configuração é escrito quando a última execução dela termina; execuções já
+salvas são reaproveitadas ao relançar a varredura.
+
+Uso:
+    python -m experiments.sweep experiments/sweeps/dtlz2_scaling.json --workers 8
+
+Formato da especificação:
+    {
+      "output_dir": "results/sweep",        # pasta de saída
+      "repetitions": 100,                   # repetições por configuração e implementação
+      "seed": 0,                            # repetição i usa seed + i
+      "implementations": ["nsga3_func", "nsga3_deap_func"],
+      "params": {"num_gen": 16},            # valores fixos
+      "cases": [{"num_obj": 2, "num_var": 1}, ...],   # combinações explícitas
+      "grid": {"pop_size": [52, 100]}       # produto cartesiano (aplicado a cada caso)
+    }
+Os parâmetros são os de `run_experiemnt_with_dtlz2`, com `num_var` no lugar de
+`bounds` (limites [0, 1]); `num_obj` e `num_var` são obrigatórios.
+"""
+import argparse
+import itertools
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+
+from algorithms.parallel_eval import mp_context
+from algorithms.registry import backend_name
+from problems.dtlz2 import dtlz2_true_front
+from utils.checkpoint import save_json
+from utils.generate_points import generate_reference_points
+from utils.run_cache import RunCache
+from analysis.trajectory import TrajectoryStats
+from .experiment_runner import accumulate, build_run_config, build_run_kwargs, cacheable, execute_run, new_stats, summarize, write_hotspots
+
+# Valores padrão dos parâmetros (os mesmos de `run_experiemnt_with_dtlz2`)
+DEFAULT_PARAMS: dict = {
+    "pop_size": 100,
+    "num_gen": 16,
+    "divisions": 10,
+    "radius_ref": 0.15,
+    "pb_c": 0.9,
+    "eta_c": 20.0,
+    "pb_m": 0.1,
+    "eta_m": 20.0,
+    "pb_pg_m": None,
+    "max_evals": None,
+    "time_budget": None,
+    "early_stopping": None,
+    "eval_cache_size": None,
+    "eval_cache_tol": None,
+    "eliminate_duplicates": None,
+    "batch_operators": False,
+    "reuse_sessions": False,
+    "dtype": "float64",
+    "n_islands": None,
+    "trajectory": None,
+    "memory_profile": None,
+    "profile": None,
+}
+_REQUIRED_PARAMS = ("num_obj", "num_var")
+
+
+def expand_sweep(spec: dict) -> list[dict]:
+    """Expande a especificação em uma lista de configurações (parâmetros completos)."""
+    grid: dict = spec.get("grid", {})
+    axes = list(grid)
+    configs = []
+    for case in spec.get("cases") or [{}]:
+        for values in itertools.product(*(grid[axis] for axis in axes)):
+            params = {**DEFAULT_PARAMS, **spec.get("params", {}), **case, **dict(zip(axes, values))}
+            unknown = set(params) - set(DEFAULT_PARAMS) - set(_REQUIRED_PARAMS)
+            if unknown:
+                raise ValueError(f"Parâmetros desconhecidos na varredura: {sorted(unknown)}")
+            missing = [key for key in _REQUIRED_PARAMS if key not in params]
+            if missing:
+                raise ValueError(f"Parâmetros obrigatórios ausentes na varredura: {missing}")
+            configs.append(params)
+    return configs
+
+
+def config_dir_name(params: dict) -> str:
+    """Nome legível e único da pasta de uma configuração."""
+    digest = RunCache.key(params)[:8]
+    return (
+        f"M{params['num_obj']}_V{params['num_var']}_P{params['pop_size']}"
+        f"_D{params['divisions']}_G{params['num_gen']}_{digest}"
+    )
+
+
+def prepare_configs(spec: dict, output_dir: Path) -> tuple[list[dict], list[Path]]:
+    """
+    Expande a especificação e prepara a pasta de cada configuração (`config.json`
+    e `true_front.npy`). Retorna as configurações e suas pastas.
+    """
+    repetitions = int(spec["repetitions"])
+    seed = int(spec.get("seed", 0))
+    configs = expand_sweep(spec)
+    config_dirs = [output_dir / config_dir_name(params) for params in configs]
+    for params, config_dir in zip(configs, config_dirs):
+        config_dir.mkdir(parents=True, exist_ok=True)
+        save_json(config_dir / "config.json", {**params, "repetitions": repetitions, "seed": seed})
+        true_front_file = config_dir / "true_front.npy"
+        if not true_front_file.exists():
+            np.save(true_front_file, problem_data(params["num_obj"], params["divisions"], seed, params["dtype"])[0])
+    return configs, config_dirs
+
+
+@lru_cache(maxsize=None)
+def problem_data(num_obj: int, divisions: int, seed: int, dtype: str = "float64") -> tuple[np.ndarray, np.ndarray]:
+    """Fronteira verdadeira e pontos de referência de uma configuração (uma vez por processo)."""
+    return (
+        dtlz2_true_front(600, num_obj, seed=seed, dtype=dtype),
+        generate_reference_points(num_obj, divisions, dtype=dtype),
+    )
+
+
+def run_job(job: tuple[int, dict, dict, bool]) -> tuple[int, dict]:
+    index, config, run_kwargs, reuse_session = job
+    true_front, ref_pts = problem_data(
+        config["num_obj"], config["divisions"], config["true_front"]["seed"], config["dtype"]
+    )
+    data = execute_run(config["implementation"], config, run_kwargs, reuse_session, true_front, ref_pts)
+    return index, data
+
+
+def run_sweep(
+    spec: dict,
+    n_workers: int | None = None,
+    output_dir: Path | None = None,
+    cache_dir: Path | None = None
+) -> dict:
+    """
+    Executa a varredura descrita por `spec` e retorna o resumo geral, também salvo
+    em `output_dir/sweep_summary.json`.
+
+    :param spec: Especificação da varredura (ver o docstring do módulo)
+    :param n_workers: Processos do Pool (padrão: número de CPUs; 1 = execução serial)
+    :param output_dir: Pasta de saída (padrão: `spec["output_dir"]`)
+    :param cache_dir: Cache de execuções compartilhado (ver `utils.run_cache`)
+    """
+    output_dir = Path(output_dir if output_dir is not None else spec["output_dir"])
+    repetitions = int(spec["repetitions"])
+    seed = int(spec.get("seed", 0))
+    names = [backend_name(name) for name in spec["implementations"]]
+    configs, config_dirs = prepare_configs(spec, output_dir)
+    cache = RunCache(cache_dir) if cache_dir is not None else None
+
+    stats = [{name: new_stats() for name in names} for _ in configs]
+    trajectory_stats = [{name: TrajectoryStats() for name in names} for _ in configs]
+    remaining = [0] * len(configs)
+
+    def record(c: int, name: str, data: dict) -> None:
+        accumulate(stats[c][name], data)
+        if data.get("trajectory") is not None:
+            trajectory_stats[c][name].update(data["trajectory"])
+
+    # Execuções pendentes: (configuração, repetição, configuração da execução, arquivo)
+    pending: list[tuple[int, int, dict, Path]] = []
+
+    # Ordem por repetição: configurações diferentes avançam em paralelo
+    for repetition in range(repetitions):
+        for c, params in enumerate(configs):
+            for name in names:
+                file_path = config_dirs[c] / f"run_{repetition:03d}_{name}.json"
+                run_config = build_run_config(name, params, repetition, seed)
+                if file_path.exists():
+                    with open(file_path) as f:
+                        record(c, name, json.load(f))
+                    continue
+                if cache is not None and cacheable(run_config):
+                    cached = cache.get(RunCache.key(run_config))
+                    if cached is not None:
+                        cached["cached"] = True
+                        record(c, name, cached)
+                        save_json(file_path, cached)
+                        continue
+                pending.append((c, repetition, run_config, file_path))
+                remaining[c] += 1
+
+    def write_summary(c: int) -> dict:
+        summary = {
+            "parameters": {**configs[c], "num_loops": repetitions, "seed": seed},
+            "results": {name: summarize(stats[c][name]) for name in names},
+        }
+        if configs[c]["trajectory"] is not None:
+            summary["trajectories"] = {name: trajectory_stats[c][name].summary() for name in names}
+        save_json(config_dirs[c] / "summary.json", summary)
+        if configs[c]["profile"] is not None:
+            write_hotspots(config_dirs[c] / "profiles", names, configs[c]["profile"])
+        return summary
+
+    def finish_job(index: int, data: dict) -> None:
+        c, _, run_config, file_path = pending[index]
+        record(c, run_config["implementation"], data)
+        save_json(file_path, data)
+        if cache is not None and cacheable(run_config):
+            cache.put(RunCache.key(run_config), run_config, data)
+        remaining[c] -= 1
+        if remaining[c] == 0:
+            write_summary(c)
+            print(f"[sweep] {config_dirs[c].name} done")
+
+    def job_kwargs(c: int, repetition: int, run_config: dict) -> dict:
+        run_kwargs = build_run_kwargs(configs[c])
+        if run_config["profile"] is not None:
+            run_kwargs["profile_path"] = config_dirs[c] / "profiles" / f"run_{repetition:03d}_{run_config['implementation']}"
+        return run_kwargs
+
+    jobs = [
+        (i, run_config, job_kwargs(c, repetition, run_config), configs[c]["reuse_sessions"])
+        for i, (c, repetition, run_config, _) in enumerate(pending)
+    ]
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+    print(f"[sweep] {len(configs)} configurations, {len(jobs)} pending runs, {n_workers} workers")
+
+    if n_workers <= 1:
+        for job in jobs:
+            finish_job(*run_job(job))
+    else:
+        with mp_context().Pool(n_workers) as pool:
+            for index, data in pool.imap_unordered(run_job, jobs):
+                finish_job(index, data)
+
+    sweep_summary = {
+        "spec": spec,
+        "configurations": [
+            {"dir": config_dir.name, **write_summary(c)}
+            for c, config_dir in enumerate(config_dirs)
+        ],
+    }
+    save_json(output_dir / "sweep_summary.json", sweep_summary)
+    print(f"[sweep] Summary saved to {output_dir / 'sweep_summary.json'}")
+    return sweep_summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Executa uma varredura de experimentos NSGA-III no DTLZ2.")
+    parser.add_argument("spec", type=Path, help="Arquivo JSON com a especificação da varredura")
+    parser.add_argument("--workers", type=int, default=None, help="Processos do Pool (padrão: número de CPUs)")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Sobrescreve `output_dir` da especificação")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Cache de execuções (utils.run_cache)")
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    run_sweep(spec, n_workers=args.workers, output_dir=args.output_dir, cache_dir=args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
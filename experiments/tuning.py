@@ -0,0 +1,245 @@
+"""
+Ajuste de parâmetros dos operadores por corrida (racing, estilo F-race/irace).
+
+Configurações candidatas de SBX/PM (`pb_c`, `eta_c`, `pb_m`, `eta_m`,
+`pb_pg_m`, ...) são avaliadas em blocos: cada bloco é uma instância do DTLZ2
+com uma semente, executada por todas as candidatas sobreviventes (números
+aleatórios comuns). Após `first_test` blocos, a cada `each_test` blocos um teste
+de Friedman compara as sobreviventes; se ele for significativo, as candidatas
+inferiores à melhor segundo o post-hoc de Conover são descartadas e as execuções
+restantes do orçamento vão para as sobreviventes. Os blocos de cada etapa são
+executados em paralelo em um Pool de processos local.
+
+Uso:
+    python -m experiments.tuning experiments/sweeps/dtlz2_operators_race.json --workers 8
+
+Formato da especificação:
+    {
+      "output_dir": "results/race",         # pasta de saída
+      "implementation": "nsga3_func",        # backend ajustado
+      "seed": 0,                             # bloco b usa seed + b
+      "metric": "igd",                       # métrica do JSON por execução
+      "maximize": false,                     # true para métricas como o hypervolume
+      "budget": 600,                         # total de execuções
+      "first_test": 5,                       # blocos antes do primeiro teste
+      "each_test": 1,                        # blocos entre testes seguintes
+      "alpha": 0.05,                         # nível dos testes
+      "min_survivors": 1,                    # para quando restarem estas candidatas
+      "params": {"num_gen": 100},            # valores fixos
+      "instances": [{"num_obj": 3, "num_var": 12}, ...],   # instâncias, usadas em rodízio
+      "candidates": [{"eta_c": 15, "pb_m": 0.5}, ...],    # candidatas explícitas
+      "grid": {"eta_c": [10, 20, 30]}        # produto cartesiano (aplicado a cada candidata)
+    }
+Os parâmetros são os de `experiments.sweep`.
+"""
+import argparse
+import itertools
+import json
+import os
+from pathlib import Path
+import numpy as np
+
+from algorithms.parallel_eval import mp_context
+from algorithms.registry import backend_name
+from analysis.stat_tests import friedman_posthoc, friedman_test
+from utils.checkpoint import save_json
+from utils.run_cache import RunCache
+from .experiment_runner import accumulate, build_run_config, build_run_kwargs, cacheable, metric_value, new_stats, summarize
+from .sweep import config_dir_name, expand_sweep, run_job
+
+
+def expand_candidates(spec: dict) -> list[dict]:
+    """Candidatas da especificação: `candidates` combinadas com o produto de `grid`."""
+    grid: dict = spec.get("grid", {})
+    axes = list(grid)
+    return [
+        {**candidate, **dict(zip(axes, values))}
+        for candidate in spec.get("candidates") or [{}]
+        for values in itertools.product(*(grid[axis] for axis in axes))
+    ]
+
+
+def race_step(
+    costs: np.ndarray,
+    alive: list[int],
+    alpha: float = 0.05
+) -> tuple[list[int], dict]:
+    """
+    Uma etapa da corrida sobre `costs` (blocos × candidatas, menor é melhor):
+    teste de Friedman entre as candidatas `alive` e, se significativo, descarte
+    das inferiores à de menor soma de postos (post-hoc de Conover).
+
+    :return: (candidatas sobreviventes, relatório da etapa)
+    """
+    sub = costs[:, alive]
+    statistic, pvalue, rank_sums = friedman_test(sub)
+    report: dict = {"blocks": len(costs), "alive": list(alive), "friedman": statistic, "pvalue": pvalue}
+    if pvalue >= alpha:
+        return list(alive), report
+    best = int(np.argmin(rank_sums))
+    posthoc = friedman_posthoc(sub, best)
+    survivors = [c for c, p in zip(alive, posthoc) if p >= alpha]
+    report["best"] = alive[best]
+    report["eliminated"] = [c for c in alive if c not in survivors]
+    return survivors, report
+
+
+def run_race(
+    spec: dict,
+    n_workers: int | None = None,
+    output_dir: Path | None = None,
+    cache_dir: Path | None = None
+) -> dict:
+    """
+    Executa a corrida descrita por `spec` e retorna o resultado, também salvo em
+    `output_dir/race.json` (candidatas, histórico de descartes e sobreviventes,
+    com o resumo das métricas de cada candidata).
+
+    :param spec: Especificação da corrida (ver o docstring do módulo)
+    :param n_workers: Processos do Pool (padrão: número de CPUs; 1 = execução serial)
+    :param output_dir: Pasta de saída (padrão: `spec["output_dir"]`)
+    :param cache_dir: Cache de execuções compartilhado (ver `utils.run_cache`)
+    """
+    output_dir = Path(output_dir if output_dir is not None else spec["output_dir"])
+    name = backend_name(spec["implementation"])
+    seed = int(spec.get("seed", 0))
+    metric = spec.get("metric", "igd")
+    sign = -1.0 if spec.get("maximize", False) else 1.0
+    budget = int(spec["budget"])
+    first_test = int(spec.get("first_test", 5))
+    each_test = int(spec.get("each_test", 1))
+    alpha = float(spec.get("alpha", 0.05))
+    min_survivors = int(spec.get("min_survivors", 1))
+    instances: list[dict] = spec.get("instances") or [{}]
+    candidates = expand_candidates(spec)
+    if len(candidates) < 2:
+        raise ValueError("A corrida precisa de pelo menos duas candidatas")
+
+    # Parâmetros completos de cada (instância, candidata), validados como na varredura
+    params = [
+        [expand_sweep({"params": {**spec.get("params", {}), **instance, **candidate}})[0] for candidate in candidates]
+        for instance in instances
+    ]
+    runs_dir = output_dir / "runs"
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    cache = RunCache(cache_dir) if cache_dir is not None else None
+
+    stats = [new_stats() for _ in candidates]
+    cost_rows: list[np.ndarray] = []
+    alive = list(range(len(candidates)))
+    history: list[dict] = []
+    used = 0
+    results: dict[int, dict[int, dict]] = {}  # bloco -> candidata -> dados da execução
+
+    def block_jobs(block: int) -> list[tuple[int, dict, Path]]:
+        """Execuções pendentes do bloco; as já salvas (ou em cache) são lidas."""
+        instance = block % len(instances)
+        pending = []
+        for c in alive:
+            run_config = build_run_config(name, params[instance][c], block, seed)
+            file_path = runs_dir / f"{config_dir_name(params[instance][c])}_run_{block:03d}.json"
+            data = None
+            if file_path.exists():
+                with open(file_path) as f:
+                    data = json.load(f)
+            elif cache is not None and cacheable(run_config):
+                data = cache.get(RunCache.key(run_config))
+                if data is not None:
+                    data["cached"] = True
+                    save_json(file_path, data)
+            if data is None:
+                pending.append((c, run_config, file_path))
+            else:
+                results[block][c] = data
+        return pending
+
+    def finish(block: int, c: int, run_config: dict, file_path: Path, data: dict) -> None:
+        save_json(file_path, data)
+        if cache is not None and cacheable(run_config):
+            cache.put(RunCache.key(run_config), run_config, data)
+        results[block][c] = data
+
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+    pool = mp_context().Pool(n_workers) if n_workers > 1 else None
+    print(f"[race] {len(candidates)} candidates, budget {budget} runs, {n_workers} workers")
+    try:
+        block = 0
+        step = first_test
+        while len(alive) > min_survivors and used + len(alive) <= budget:
+            # Blocos desta etapa que cabem no orçamento
+            n_blocks = min(step, (budget - used) // len(alive))
+            blocks = list(range(block, block + n_blocks))
+            jobs: list[tuple[int, int, dict, Path]] = []
+            for b in blocks:
+                results[b] = {}
+                jobs += [(b, c, run_config, file_path) for c, run_config, file_path in block_jobs(b)]
+            tasks = [
+                (i, run_config, build_run_kwargs(params[b % len(instances)][c]), params[b % len(instances)][c]["reuse_sessions"])
+                for i, (b, c, run_config, _) in enumerate(jobs)
+            ]
+            outputs = pool.imap_unordered(run_job, tasks) if pool is not None else map(run_job, tasks)
+            for i, data in outputs:
+                b, c, run_config, file_path = jobs[i]
+                finish(b, c, run_config, file_path, data)
+
+            for b in blocks:
+                row = np.full(len(candidates), np.nan)
+                for c, data in results[b].items():
+                    row[c] = sign * metric_value(data, metric)
+                    accumulate(stats[c], data)
+                cost_rows.append(row)
+            used += n_blocks * len(alive)
+            block += n_blocks
+            step = each_test
+
+            if block >= first_test:
+                alive, report = race_step(np.vstack(cost_rows), alive, alpha)
+                history.append(report)
+                if report.get("eliminated"):
+                    print(f"[race] block {block}: eliminated {report['eliminated']}, {len(alive)} alive")
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    costs = np.vstack(cost_rows) if cost_rows else np.empty((0, len(candidates)))
+    ranking = sorted(alive, key=lambda c: float(np.mean(costs[:, c])) if len(costs) else 0.0)
+    race = {
+        "spec": spec,
+        "implementation": name,
+        "blocks": len(costs),
+        "runs": used,
+        "candidates": [
+            {
+                "index": c,
+                "params": candidate,
+                "alive": c in alive,
+                "n_blocks": int(np.sum(~np.isnan(costs[:, c]))) if len(costs) else 0,
+                "results": summarize(stats[c]),
+            }
+            for c, candidate in enumerate(candidates)
+        ],
+        "history": history,
+        "survivors": ranking,
+        "best": candidates[ranking[0]] if ranking else None,
+    }
+    save_json(output_dir / "race.json", race)
+    print(f"[race] Best candidate: {race['best']} ({len(alive)} alive after {used} runs)")
+    return race
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Ajusta os operadores do NSGA-III no DTLZ2 por corrida (F-race).")
+    parser.add_argument("spec", type=Path, help="Arquivo JSON com a especificação da corrida")
+    parser.add_argument("--workers", type=int, default=None, help="Processos do Pool (padrão: número de CPUs)")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Sobrescreve `output_dir` da especificação")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Cache de execuções (utils.run_cache)")
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    run_race(spec, n_workers=args.workers, output_dir=args.output_dir, cache_dir=args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""
+Execução distribuída de varreduras por meio de uma fila de trabalho em arquivos.
+
+A fila vive em uma pasta compartilhada entre os nós (NFS, Lustre, ...), sem
+nenhum serviço adicional:
+
+    queue_dir/
+      meta.json            especificação da varredura e pasta de saída
+      jobs/<id>.json       execuções pendentes
+      claimed/<id>@<worker>.json   execuções em andamento
+      done/<id>.json       execuções concluídas
+      shards/<worker>.json estatísticas acumuladas por cada trabalhador
+
+Um trabalhador reivindica uma execução renomeando o arquivo de `jobs/` para
+`claimed/` (`os.rename` é atômico: só um trabalhador consegue). Ao concluir,
+salva o JSON da execução na pasta da configuração e move o arquivo para `done/`:
+essa renomeação é o ponto de confirmação, e só quem a consegue soma a execução ao
+seu shard. Uma execução devolvida à fila por `requeue_stale` enquanto o
+trabalhador lento ainda a executava pode ser concluída por dois trabalhadores,
+mas é contada uma única vez. `merge` combina os shards (acumuladores mescláveis,
+ver `analysis.streaming_stats`) e escreve o `summary.json` de cada configuração
+sem reler os JSON das execuções.
+
+Uso:
+    python -m experiments.work_queue enqueue experiments/sweeps/dtlz2_scaling.json --queue /shared/q
+    python -m experiments.work_queue worker --queue /shared/q --processes 8   # em cada nó
+    python -m experiments.work_queue merge --queue /shared/q
+"""
+import argparse
+import json
+import os
+import socket
+import time
+from pathlib import Path
+
+from algorithms.parallel_eval import mp_context
+from algorithms.registry import backend_name
+from utils.checkpoint import save_json
+from utils.run_cache import RunCache
+from .experiment_runner import (
+    METRICS,
+    accumulate,
+    build_run_config,
+    build_run_kwargs,
+    cacheable,
+    new_stats,
+    stats_from_state,
+    stats_state,
+    summarize,
+)
+from .sweep import prepare_configs, run_job
+
+# Shard com as execuções já existentes (ou vindas do cache) no momento do enqueue
+_ENQUEUE_SHARD = "_enqueue"
+
+
+def _dirs(queue_dir: Path) -> dict[str, Path]:
+    return {name: queue_dir / name for name in ("jobs", "claimed", "done", "shards")}
+
+
+def _load_shard(shard_file: Path) -> dict:
+    """Shard: número de execuções e estatísticas por configuração/implementação/métrica."""
+    if not shard_file.exists():
+        return {"n_runs": {}, "stats": {}}
+    with open(shard_file) as f:
+        shard = json.load(f)
+    shard["stats"] = {
+        config: {name: stats_from_state(state) for name, state in by_name.items()}
+        for config, by_name in shard["stats"].items()
+    }
+    return shard
+
+
+def _save_shard(shard_file: Path, shard: dict) -> None:
+    save_json(shard_file, {
+        "n_runs": shard["n_runs"],
+        "stats": {
+            config: {name: stats_state(func_stats) for name, func_stats in by_name.items()}
+            for config, by_name in shard["stats"].items()
+        },
+    })
+
+
+def _shard_add(shard: dict, config_dir: str, name: str, data: dict) -> None:
+    """Soma uma execução confirmada (movida para `done/`) ao shard."""
+    accumulate(shard["stats"].setdefault(config_dir, {}).setdefault(name, new_stats()), data)
+    by_name = shard["n_runs"].setdefault(config_dir, {})
+    by_name[name] = by_name.get(name, 0) + 1
+
+
+def enqueue(spec: dict, queue_dir: Path, output_dir: Path | None = None, cache_dir: Path | None = None) -> int:
+    """
+    Cria (ou completa) a fila com as execuções da varredura `spec`. Execuções já
+    salvas na pasta de saída, enfileiradas ou em andamento não são duplicadas.
+    Retorna o número de execuções enfileiradas.
+    """
+    output_dir = Path(output_dir if output_dir is not None else spec["output_dir"])
+    dirs = _dirs(queue_dir)
+    for path in dirs.values():
+        path.mkdir(parents=True, exist_ok=True)
+    save_json(queue_dir / "meta.json", {"spec": spec, "output_dir": str(output_dir)})
+
+    repetitions = int(spec["repetitions"])
+    seed = int(spec.get("seed", 0))
+    names = [backend_name(name) for name in spec["implementations"]]
+    configs, config_dirs = prepare_configs(spec, output_dir)
+    cache = RunCache(cache_dir) if cache_dir is not None else None
+
+    known = {path.stem for path in dirs["jobs"].glob("*.json")}
+    known |= {path.stem.split("@")[0] for path in dirs["claimed"].glob("*.json")}
+    known |= {path.stem for path in dirs["done"].glob("*.json")}
+    enqueue_shard_file = dirs["shards"] / f"{_ENQUEUE_SHARD}.json"
+    enqueue_shard = _load_shard(enqueue_shard_file)
+
+    n_jobs = 0
+    for repetition in range(repetitions):
+        for params, config_dir in zip(configs, config_dirs):
+            for name in names:
+                # Prefixo da repetição: a ordem alfabética intercala as configurações
+                job_id = f"{repetition:05d}_{config_dir.name}_{name}"
+                if job_id in known:
+                    continue
+                run_config = build_run_config(name, params, repetition, seed)
+                file_path = config_dir / f"run_{repetition:03d}_{name}.json"
+                data = None
+                if file_path.exists():
+                    with open(file_path) as f:
+                        data = json.load(f)
+                elif cache is not None and cacheable(run_config):
+                    data = cache.get(RunCache.key(run_config))
+                    if data is not None:
+                        data["cached"] = True
+                        save_json(file_path, data)
+                if data is not None:
+                    # Já concluída: entra direto em `done/`, para não ser contada de novo
+                    save_json(dirs["done"] / f"{job_id}.json", {"id": job_id, "config_dir": config_dir.name})
+                    _shard_add(enqueue_shard, config_dir.name, name, data)
+                    continue
+                save_json(dirs["jobs"] / f"{job_id}.json", {
+                    "id": job_id,
+                    "config_dir": config_dir.name,
+                    "file": file_path.name,
+                    "run_config": run_config,
+                    "run_kwargs": build_run_kwargs(params),
+                    "reuse_session": params["reuse_sessions"],
+                })
+                n_jobs += 1
+
+    _save_shard(enqueue_shard_file, enqueue_shard)
+    return n_jobs
+
+
+def claim_job(queue_dir: Path, worker_id: str) -> tuple[Path, dict] | None:
+    """Reivindica atomicamente a próxima execução pendente; None se a fila estiver vazia."""
+    dirs = _dirs(queue_dir)
+    for path in sorted(dirs["jobs"].glob("*.json")):
+        target = dirs["claimed"] / f"{path.stem}@{worker_id}.json"
+        try:
+            # Marca o início antes de renomear (`os.rename` preserva o mtime, usado por
+            # `requeue_stale`), para a reivindicação não nascer abandonada
+            os.utime(path)
+            os.rename(path, target)
+            with open(target) as f:
+                return target, json.load(f)
+        except FileNotFoundError:
+            continue  # reivindicada por outro trabalhador (ou devolvida e reivindicada de novo)
+    return None
+
+
+def requeue_stale(queue_dir: Path, max_age: float) -> int:
+    """
+    Devolve à fila execuções reivindicadas há mais de `max_age` segundos
+    (trabalhador interrompido). `max_age` deve exceder a execução mais longa.
+    """
+    dirs = _dirs(queue_dir)
+    now = time.time()
+    n_requeued = 0
+    for path in dirs["claimed"].glob("*.json"):
+        try:
+            if now - path.stat().st_mtime <= max_age:
+                continue
+            os.rename(path, dirs["jobs"] / f"{path.stem.split('@')[0]}.json")
+        except FileNotFoundError:
+            continue  # concluída ou devolvida por outro processo
+        n_requeued += 1
+    return n_requeued
+
+
+def run_worker(
+    queue_dir: Path,
+    worker_id: str | None = None,
+    wait: bool = False,
+    poll_interval: float = 5.0,
+    stale_after: float | None = None
+) -> int:
+    """
+    Executa execuções da fila até esvaziá-la e retorna quantas concluiu.
+
+    :param queue_dir: Pasta da fila
+    :param worker_id: Identificador único do trabalhador (padrão: host-pid)
+    :param wait: Continua aguardando enquanto houver execuções em andamento em outros
+                 trabalhadores (que podem voltar à fila via `stale_after`)
+    :param poll_interval: Intervalo entre consultas com `wait`, em segundos
+    :param stale_after: Devolve à fila execuções reivindicadas há mais que isso (segundos)
+    """
+    dirs = _dirs(queue_dir)
+    with open(queue_dir / "meta.json") as f:
+        output_dir = Path(json.load(f)["output_dir"])
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    shard_file = dirs["shards"] / f"{worker_id}.json"
+    shard = _load_shard(shard_file)
+
+    n_done = 0
+    while True:
+        if stale_after is not None:
+            requeue_stale(queue_dir, stale_after)
+        claimed = claim_job(queue_dir, worker_id)
+        if claimed is None:
+            if wait and any(dirs["claimed"].glob("*.json")):
+                time.sleep(poll_interval)
+                continue
+            break
+
+        claim_path, job = claimed
+        _, data = run_job((0, job["run_config"], job["run_kwargs"], job["reuse_session"]))
+        save_json(output_dir / job["config_dir"] / job["file"], data)
+        done = dirs["done"] / f"{job['id']}.json"
+        try:
+            os.replace(claim_path, done)
+            committed = True
+        except FileNotFoundError:
+            # Devolvida à fila por `requeue_stale` durante a execução: confirma retirando-a
+            # da fila; se outro trabalhador já a reivindicou, é ele quem a contabiliza
+            try:
+                os.replace(dirs["jobs"] / f"{job['id']}.json", done)
+                committed = True
+            except FileNotFoundError:
+                committed = False
+        if committed:
+            _shard_add(shard, job["config_dir"], job["run_config"]["implementation"], data)
+            _save_shard(shard_file, shard)
+        n_done += 1
+
+    print(f"[worker {worker_id}] {n_done} runs done")
+    return n_done
+
+
+def run_local_workers(queue_dir: Path, n_processes: int, **kwargs) -> None:
+    """Lança `n_processes` trabalhadores neste nó e aguarda o término."""
+    base = f"{socket.gethostname()}-{os.getpid()}"
+    ctx = mp_context()
+    processes = [
+        ctx.Process(target=run_worker, args=(queue_dir, f"{base}-{i}"), kwargs=kwargs)
+        for i in range(n_processes)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def merge(queue_dir: Path) -> dict:
+    """
+    Combina os shards e escreve o `summary.json` de cada configuração e o
+    `sweep_summary.json` na pasta de saída. Retorna o resumo geral.
+    """
+    with open(queue_dir / "meta.json") as f:
+        meta = json.load(f)
+    spec = meta["spec"]
+    output_dir = Path(meta["output_dir"])
+    names = [backend_name(name) for name in spec["implementations"]]
+    configs, config_dirs = prepare_configs(spec, output_dir)
+
+    merged: dict[str, dict] = {}
+    n_runs: dict[tuple[str, str], int] = {}
+    for shard_file in sorted(_dirs(queue_dir)["shards"].glob("*.json")):
+        shard = _load_shard(shard_file)
+        for config, by_name in shard["stats"].items():
+            for name, func_stats in by_name.items():
+                target = merged.setdefault(config, {}).setdefault(name, new_stats())
+                for key in METRICS:
+                    target[key].merge(func_stats[key])
+        for config, by_name in shard["n_runs"].items():
+            for name, count in by_name.items():
+                n_runs[config, name] = n_runs.get((config, name), 0) + count
+
+    repetitions = int(spec["repetitions"])
+    seed = int(spec.get("seed", 0))
+    configurations = []
+    for params, config_dir in zip(configs, config_dirs):
+        by_name = merged.get(config_dir.name, {})
+        summary = {
+            "parameters": {**params, "num_loops": repetitions, "seed": seed},
+            "n_runs": {name: n_runs.get((config_dir.name, name), 0) for name in names},
+            "results": {name: summarize(by_name[name]) for name in names if name in by_name},
+        }
+        save_json(config_dir / "summary.json", summary)
+        configurations.append({"dir": config_dir.name, **summary})
+
+    sweep_summary = {"spec": spec, "configurations": configurations}
+    save_json(output_dir / "sweep_summary.json", sweep_summary)
+    print(f"[merge] Summary saved to {output_dir / 'sweep_summary.json'}")
+    return sweep_summary
+
+
+def status(queue_dir: Path) -> dict[str, int]:
+    """Número de execuções pendentes, em andamento e concluídas."""
+    dirs = _dirs(queue_dir)
+    return {name: sum(1 for _ in dirs[name].glob("*.json")) for name in ("jobs", "claimed", "done")}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Fila de trabalho em arquivos para varreduras NSGA-III.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_enqueue = sub.add_parser("enqueue", help="Enfileira as execuções de uma varredura")
+    p_enqueue.add_argument("spec", type=Path)
+    p_enqueue.add_argument("--queue", type=Path, required=True)
+    p_enqueue.add_argument("--output-dir", type=Path, default=None)
+    p_enqueue.add_argument("--cache-dir", type=Path, default=None)
+
+    p_worker = sub.add_parser("worker", help="Executa execuções da fila até esvaziá-la")
+    p_worker.add_argument("--queue", type=Path, required=True)
+    p_worker.add_argument("--processes", type=int, default=1)
+    p_worker.add_argument("--wait", action="store_true")
+    p_worker.add_argument("--stale-after", type=float, default=None)
+
+    for command in ("merge", "status"):
+        sub.add_parser(command).add_argument("--queue", type=Path, required=True)
+
+    p_requeue = sub.add_parser("requeue", help="Devolve à fila execuções abandonadas")
+    p_requeue.add_argument("--queue", type=Path, required=True)
+    p_requeue.add_argument("--max-age", type=float, required=True)
+
+    args = parser.parse_args(argv)
+    if args.command == "enqueue":
+        with open(args.spec) as f:
+            spec = json.load(f)
+        print(f"[enqueue] {enqueue(spec, args.queue, args.output_dir, args.cache_dir)} runs enqueued")
+    elif args.command == "worker":
+        options = {"wait": args.wait, "stale_after": args.stale_after}
+        if args.processes > 1:
+            run_local_workers(args.queue, args.processes, **options)
+        else:
+            run_worker(args.queue, **options)
+    elif args.command == "merge":
+        merge(args.queue)
+    elif args.command == "status":
+        print(json.dumps(status(args.queue)))
+    elif args.command == "requeue":
+        print(f"[requeue] {requeue_stale(args.queue, args.max_age)} runs requeued")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,3 +36,54 @@ def sbx_crossover(
             c2[i] = min(max(c2[i], bounds[i][0]), bounds[i][1])
 
     return c1, c2
+
+def sbx_crossover_batch(
+    parents1: np.ndarray,
+    parents2: np.ndarray,
+    bounds: Bounds,
+    eta: float = 20.0,
+    cxpb: float = 0.5,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    SBX vetorizado sobre matrizes de pais (n_pares, n_var).
+    Mesma regra de `sbx_crossover` (cada par cruza com probabilidade `cxpb`),
+    mas sorteada com `np.random` em lote.
+    """
+    parents1 = np.asarray(parents1, dtype=float)
+    parents2 = np.asarray(parents2, dtype=float)
+    n_pairs, n_var = parents1.shape
+    xl, xu = np.asarray(bounds, dtype=float).T
+
+    u = np.random.random((n_pairs, n_var))
+    beta_q = np.where(
+        u <= 0.5,
+        (2 * u) ** (1 / (eta + 1)),
+        (1 / (2 * (1 - u))) ** (1 / (eta + 1)),
+    )
+    mean = 0.5 * (parents1 + parents2)
+    spread = 0.5 * beta_q * (parents2 - parents1)
+    c1 = np.clip(mean - spread, xl, xu)
+    c2 = np.clip(mean + spread, xl, xu)
+
+    keep = np.random.random(n_pairs) >= cxpb
+    c1[keep] = parents1[keep]
+    c2[keep] = parents2[keep]
+    return c1, c2
+
+class SBXCrossover:
+    """
+    SBX com parâmetros fixos. Chamável como o operador escalar
+    (`crossover(p1, p2)`) e com `batch(P1, P2)` para matrizes de pais,
+    usado pelas implementações que sabem cruzar a população em lote.
+    """
+
+    def __init__(self, bounds: Bounds, eta: float = 20.0, cxpb: float = 0.5):
+        self.bounds = bounds
+        self.eta = eta
+        self.cxpb = cxpb
+
+    def __call__(self, parent1: Vector, parent2: Vector) -> tuple[Vector, Vector]:
+        return sbx_crossover(parent1, parent2, self.bounds, eta=self.eta, cxpb=self.cxpb)
+
+    def batch(self, parents1: np.ndarray, parents2: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return sbx_crossover_batch(parents1, parents2, self.bounds, eta=self.eta, cxpb=self.cxpb)
@@ -49,3 +49,72 @@ def polynomial_mutation(
         return x
 
     return individual
+
+def polynomial_mutation_batch(
+    population: np.ndarray,
+    bounds: Bounds,
+    eta: float = 25.0,
+    mutation_rate: float = 0.9,
+    per_gene_prob: float | None = None
+    ) -> np.ndarray:
+    """
+    Mutação polinomial vetorizada sobre uma matriz (n_ind, n_var).
+    Mesma regra de `polynomial_mutation` (indivíduo com prob `mutation_rate`,
+    gene com prob `per_gene_prob`), sorteada com `np.random` em lote.
+    Retorna uma nova matriz.
+    """
+    x = np.array(population, dtype=float)
+    n_ind, n = x.shape
+
+    if per_gene_prob is None:
+        per_gene_prob = 1 / n
+
+    lower, upper = np.asarray(bounds, dtype=float).T
+    span = upper - lower
+    mask = (
+        (np.random.random(n_ind) < mutation_rate)[:, None]
+        & (np.random.random((n_ind, n)) < per_gene_prob)
+        & (span > 0)  # proteção
+    )
+    u = np.random.random((n_ind, n))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta1 = (x - lower) / span
+        delta2 = (upper - x) / span
+        mut_pow = 1.0 / (eta + 1.0)
+
+        xy = np.clip(1.0 - delta1, 0, 1)
+        val = 2.0 * u + (1.0 - 2.0 * u) * (xy ** (eta + 1.0))
+        delta_q_low = (val ** mut_pow) - 1.0
+
+        xy = np.clip(1.0 - delta2, 0, 1)
+        val = 2.0 * (1.0 - u) + 2.0 * (u - 0.5) * (xy ** (eta + 1.0))
+        delta_q_high = 1.0 - (val ** mut_pow)
+
+        delta_q = np.where(u < 0.5, delta_q_low, delta_q_high)
+        mutated = np.clip(x + delta_q * span, lower, upper)
+
+    x[mask] = mutated[mask]
+    return x
+
+class PolynomialMutation:
+    """
+    Mutação polinomial com parâmetros fixos. Chamável como o operador escalar
+    (`mutation(ind, bounds)`) e com `batch(X, bounds)` para a população inteira,
+    usado pelas implementações que sabem mutar em lote.
+    """
+
+    def __init__(self, eta: float = 25.0, mutation_rate: float = 0.9, per_gene_prob: float | None = None):
+        self.eta = eta
+        self.mutation_rate = mutation_rate
+        self.per_gene_prob = per_gene_prob
+
+    def __call__(self, individual: Vector, bounds: Bounds) -> Vector:
+        return polynomial_mutation(
+            individual, bounds, eta=self.eta, mutation_rate=self.mutation_rate, per_gene_prob=self.per_gene_prob
+        )
+
+    def batch(self, population: np.ndarray, bounds: Bounds) -> np.ndarray:
+        return polynomial_mutation_batch(
+            population, bounds, eta=self.eta, mutation_rate=self.mutation_rate, per_gene_prob=self.per_gene_prob
+        )
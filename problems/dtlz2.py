@@ -25,12 +25,63 @@ def dtlz2(x: Vector, M: int = 6) -> Vector:
         f[m] = val
     return f  # todos minimização
 
-def dtlz2_true_front(n_points: int, n_obj: int) -> np.ndarray:
+def dtlz2_batch(X: Vector, M: int = 6) -> Vector:
+    """
+    DTLZ2 vetorizado: avalia as linhas de X (N, n) de uma vez e retorna (N, M).
+    Os produtos seguem a mesma ordem de `dtlz2`, então os valores são idênticos.
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    n = X.shape[1]
+    assert n >= M - 1, "DTLZ2: n deve ser >= M-1"
+
+    k = n - (M - 1)
+    g = np.sum((X[:, n - k:] - 0.5) ** 2, axis=1)
+    cos = np.cos(0.5 * np.pi * X[:, :M - 1])
+    sin = np.sin(0.5 * np.pi * X[:, :M - 1])
+
+    F = np.empty((len(X), M), dtype=float)
+    for m in range(M):
+        val = 1.0 + g
+        for i in range(M - m - 1):
+            val = val * cos[:, i]
+        if m > 0:
+            val = val * sin[:, M - m - 1]
+        F[:, m] = val
+    return F
+
+
+class DTLZ2:
+    """
+    DTLZ2 com M objetivos como objeto chamável: `problem(x)` avalia um vetor e
+    `problem.batch(X)` avalia uma matriz de uma vez. Ao contrário de uma lambda,
+    é serializável (pickle), podendo ser enviado a outros processos.
+    """
+
+    def __init__(self, M: int = 6):
+        self.M = M
+
+    def __call__(self, x: Vector) -> Vector:
+        return dtlz2(x, M=self.M)
+
+    def batch(self, X: Vector) -> Vector:
+        return dtlz2_batch(X, M=self.M)
+
+def dtlz2_true_front(
+    n_points: int,
+    n_obj: int,
+    seed: int | None = None,
+    dtype: str | np.dtype = "float64"
+) -> np.ndarray:
     """
     Gera amostras da fronteira verdadeira do DTLZ2.
     Cada ponto está na hiperesfera unitária (norma 1, coordenadas >= 0).
+    Com `seed`, usa um gerador próprio e a amostra é reprodutível.
+    A amostra é gerada em float64 e convertida para `dtype`.
     """
-    X = np.random.randn(n_points, n_obj)
+    if seed is None:
+        X = np.random.randn(n_points, n_obj)
+    else:
+        X = np.random.default_rng(seed).standard_normal((n_points, n_obj))
     X = np.abs(X)  # primeiro quadrante
     X = X / np.linalg.norm(X, axis=1, keepdims=True)
-    return X
+    return X.astype(dtype, copy=False)
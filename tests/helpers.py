@@ -0,0 +1,31 @@
+import importlib.util
+import pytest
+
+from algorithms.registry import get_backend
+from genetic_operators.crossover import SBXCrossover
+from genetic_operators.mutation import PolynomialMutation
+from problems.dtlz2 import DTLZ2
+
+# Implementações testadas: as que têm a biblioteca instalada
+BACKENDS = [
+    pytest.param(name, marks=pytest.mark.skipif(
+        lib is not None and importlib.util.find_spec(lib) is None, reason=f"{lib} não instalado"
+    ))
+    for name, lib in [
+        ("nsga3_func", None),
+        ("nsga3_deap_func", "deap"),
+        ("nsga3_pymoo_func", "pymoo"),
+        ("nsga3_pygmo_func", "pygmo"),
+    ]
+]
+
+
+def run_backend(name: str, pop_size: int = 20, generations: int = 5, num_obj: int = 3, num_var: int = 8, **kwargs):
+    """Executa a implementação `name` no DTLZ2 com operadores padrão; retorna (fronteira, info)."""
+    bounds = [(0.0, 1.0)] * num_var
+    info: dict = {}
+    front = get_backend(name)(
+        pop_size, generations, bounds, DTLZ2(num_obj), SBXCrossover(bounds), PolynomialMutation(),
+        divisions=4, info=info, **kwargs
+    )
+    return front, info
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from algorithms.archive import NDTreeArchive
+from utils.reference_index import ReferenceIndex
+from utils.generate_points import generate_reference_points
+from helpers import run_backend
+
+
+def _nondominated(F):
+    """Filtro de não dominância por força bruta (referência)."""
+    dominated = ((F[None, :, :] <= F[:, None, :]).all(axis=2) & (F[None, :, :] < F[:, None, :]).any(axis=2)).any(axis=1)
+    return F[~dominated]
+
+
+def _rows(F):
+    return sorted(map(tuple, np.round(F, 12)))
+
+
+def _front_points(n, num_obj, seed):
+    # Pontos perto de uma frente côncava: muitos não dominados entre si
+    rng = np.random.default_rng(seed)
+    directions = np.abs(rng.normal(size=(n, num_obj)))
+    return directions / np.linalg.norm(directions, axis=1, keepdims=True) * rng.uniform(1.0, 1.3, size=(n, 1))
+
+
+@pytest.mark.parametrize("num_obj", [2, 3, 5])
+def test_unbounded_archive_matches_brute_force(num_obj):
+    F = _front_points(1500, num_obj, seed=num_obj)
+    archive = NDTreeArchive(max_leaf=8)
+    archive.update_batch(F)
+    assert len(archive) == len(archive.objectives())
+    assert _rows(archive.objectives()) == _rows(_nondominated(F))
+    assert archive.stats()["inserted"] >= len(archive)
+
+
+def test_repeated_and_dominated_points_are_rejected():
+    archive = NDTreeArchive()
+    assert archive.update([1.0, 2.0])
+    assert not archive.update([1.0, 2.0])
+    assert not archive.update([1.5, 2.5])
+    assert archive.update([0.5, 0.5])  # domina o único ponto arquivado
+    assert len(archive) == 1 and archive.objectives().tolist() == [[0.5, 0.5]]
+
+
+def test_solutions_follow_their_objectives():
+    F = _front_points(300, 3, seed=0)
+    archive = NDTreeArchive(max_leaf=5)
+    archive.update_batch(F, 2 * F)
+    np.testing.assert_array_equal(archive.solutions(), 2 * archive.objectives())
+
+
+def test_bounded_archive_truncates_by_niche():
+    F = _front_points(2000, 3, seed=1)
+    archive = NDTreeArchive(50, ReferenceIndex(generate_reference_points(3, 6)))
+    archive.update_batch(F)
+    kept = archive.objectives()
+    assert len(archive) == len(kept) == 50
+    assert set(_rows(kept)) <= set(_rows(_nondominated(F)))
+    assert archive.stats()["truncated"] == len(_nondominated(F)) - 50
+    with pytest.raises(ValueError):
+        NDTreeArchive(50)
+
+
+def test_engine_returns_the_archive_and_resumes_it(tmp_path):
+    front, info = run_backend("nsga3_func", generations=8, seed=3, archive_size=30)
+    assert len(front) == info["archive"]["size"] <= 30
+    F = np.array(front)
+    assert _rows(_nondominated(F)) == _rows(F)
+
+    path = tmp_path / "run.ckpt"
+    run_backend("nsga3_func", generations=4, seed=3, archive_size=30, checkpoint_path=path)
+    resumed, _ = run_backend("nsga3_func", generations=8, archive_size=30, checkpoint_path=path)
+    assert resumed == front
@@ -0,0 +1,72 @@
+import json
+import os
+import pytest
+
+from experiments.runner_config import BenchmarkConfig
+from utils.benchmark_env import BLAS_THREAD_VARS, blas_env, current_affinity
+from test_experiment_runner import _run
+
+
+@pytest.fixture
+def blas_vars(monkeypatch):
+    for var in BLAS_THREAD_VARS:
+        monkeypatch.setenv(var, "4")
+
+
+def _run_file(output_dir, index=0):
+    with open(output_dir / f"run_{index:03d}_nsga3_func.json") as f:
+        return json.load(f)
+
+
+def test_config_validation():
+    assert blas_env(2) == {var: "2" for var in BLAS_THREAD_VARS}
+    with pytest.raises(ValueError):
+        BenchmarkConfig(isolation="thread")
+
+
+def test_serial_benchmark_records_the_environment(tmp_path, blas_vars):
+    summary = _run(tmp_path, seed=0, benchmark=BenchmarkConfig(blas_threads=1, warmup=1))
+    report = _run_file(tmp_path)["benchmark"]
+    assert report["pid"] == os.getpid()
+    assert report["blas_threads"] == 1
+    assert os.environ["OMP_NUM_THREADS"] == "4"
+    assert summary["parameters"]["benchmark"] == BenchmarkConfig(blas_threads=1).to_dict()
+    assert summary["results"]["nsga3_func"]["stats"]["cpu_time"]["n"] == 2
+
+
+def test_serial_benchmark_restores_the_affinity(tmp_path, blas_vars):
+    available = current_affinity()
+    if available is None:
+        pytest.skip("afinidade de CPU indisponível")
+    _run(tmp_path, seed=0, benchmark=BenchmarkConfig(cpus=available[:1], warmup=0))
+    assert _run_file(tmp_path)["benchmark"]["affinity"] == available[:1]
+    assert current_affinity() == available
+
+
+def test_serial_benchmark_rejects_workers(tmp_path):
+    with pytest.raises(ValueError, match="isolation"):
+        _run(tmp_path, seed=0, n_workers=2, benchmark=BenchmarkConfig())
+
+
+def test_prefork_runs_in_other_processes_and_restores_the_environment(tmp_path, blas_vars):
+    _run(tmp_path, seed=0, n_workers=1, benchmark=BenchmarkConfig(blas_threads=1, isolation="prefork"))
+    pids = {_run_file(tmp_path, i)["benchmark"]["pid"] for i in range(2)}
+    assert len(pids) == 1 and os.getpid() not in pids
+    assert os.environ["OMP_NUM_THREADS"] == "4"
+
+    # Mesmas sementes, mesmos resultados que fora do modo benchmark
+    _run(tmp_path / "plain", seed=0)
+    assert _run_file(tmp_path)["hypervolume"] == _run_file(tmp_path / "plain")["hypervolume"]
+
+
+def test_fresh_isolation_uses_a_process_per_run(tmp_path, blas_vars):
+    _run(tmp_path, seed=0, benchmark=BenchmarkConfig(isolation="fresh", warmup=0))
+    assert len({_run_file(tmp_path, i)["benchmark"]["pid"] for i in range(2)}) == 2
+
+
+def test_cpus_outside_the_affinity_are_rejected(tmp_path):
+    available = current_affinity()
+    if available is None:
+        pytest.skip("afinidade de CPU indisponível")
+    with pytest.raises(ValueError, match="CPUs"):
+        _run(tmp_path, seed=0, benchmark=BenchmarkConfig(cpus=[max(available) + 1]))
@@ -0,0 +1,36 @@
+import pytest
+
+from helpers import BACKENDS, run_backend
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_evaluations_per_generation(name):
+    # População inicial + uma população de filhos por geração, em todas as implementações
+    _, info = run_backend(name, pop_size=20, generations=5, seed=1)
+    assert info["n_gen"] == 5
+    assert info["n_evals"] == 20 * 6
+    assert info["stop_reason"] == "generations"
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_max_evals_gives_equal_cost(name):
+    _, info = run_backend(name, pop_size=20, generations=100, max_evals=200, seed=1)
+    assert info["stop_reason"] == "max_evals"
+    assert info["n_evals"] == 200
+    assert info["n_gen"] == 9
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_time_budget(name):
+    _, info = run_backend(name, pop_size=20, generations=10_000, time_budget=0.2, seed=1)
+    assert info["stop_reason"] == "time_budget"
+    assert info["n_gen"] < 10_000
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_callback_stops_run(name):
+    gens = []
+    _, info = run_backend(name, generations=10, seed=1, callback=lambda gen, F: gens.append(gen) or gen == 3)
+    assert gens == [1, 2, 3]
+    assert info["n_gen"] == 3
+    assert info["stop_reason"] == "callback"
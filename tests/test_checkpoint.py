@@ -0,0 +1,66 @@
+import json
+import numpy as np
+
+from algorithms.stopping import StagnationStopping
+from analysis.generational_distance import TrueFrontIndex
+from analysis.trajectory import TrajectoryRecorder
+from experiments.runner_config import CacheConfig
+from problems.dtlz2 import dtlz2_true_front
+from utils.checkpoint import load_checkpoint
+from helpers import run_backend
+from test_experiment_runner import _run
+
+
+def _callback():
+    stopping = StagnationStopping("ideal_nadir", tol=0.01, window=3)
+    return TrajectoryRecorder(TrueFrontIndex(dtlz2_true_front(200, 3, seed=0)), every=1, callback=stopping)
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    reference_cb = _callback()
+    front, info = run_backend("nsga3_func", generations=60, seed=5, callback=reference_cb)
+    assert info["stop_reason"] == "callback" and info["n_gen"] > 10
+
+    # "Interrompe" na geração 10 e retoma em um processo novo (callback novo)
+    path = tmp_path / "run.ckpt"
+    run_backend("nsga3_func", generations=10, seed=5, callback=_callback(), checkpoint_path=path)
+    assert load_checkpoint(path)["generation"] == 10
+    resumed_cb = _callback()
+    resumed_front, resumed_info = run_backend("nsga3_func", generations=60, callback=resumed_cb, checkpoint_path=path)
+
+    assert resumed_front == front
+    assert (resumed_info["n_gen"], resumed_info["n_evals"], resumed_info["stop_reason"]) == (
+        info["n_gen"], info["n_evals"], info["stop_reason"]
+    )
+    assert resumed_cb.columns["gen"] == reference_cb.columns["gen"]
+    np.testing.assert_allclose(resumed_cb.columns["igd"], reference_cb.columns["igd"])
+    assert resumed_cb.callback.history == reference_cb.callback.history
+
+
+def test_runner_ignores_stale_checkpoint_without_resume(tmp_path):
+    # Checkpoint deixado por outra execução (outra semente) no lugar do da repetição 0
+    stale = tmp_path / "out" / "checkpoints" / "run_000_nsga3_func.ckpt"
+    run_backend("nsga3_func", pop_size=12, generations=2, num_obj=2, num_var=6, seed=99, checkpoint_path=stale)
+
+    _run(tmp_path / "out", num_loops=1, seed=0, caching=CacheConfig(checkpoint_every=1))
+    _run(tmp_path / "clean", num_loops=1, seed=0)
+    with open(tmp_path / "out" / "run_000_nsga3_func.json") as f:
+        run = json.load(f)
+    with open(tmp_path / "clean" / "run_000_nsga3_func.json") as f:
+        clean = json.load(f)
+    assert not run["resumed_from_checkpoint"]
+    assert run["pareto_front"] == clean["pareto_front"]
+    assert not stale.exists()
+
+
+def test_resumed_runs_are_excluded_from_timing_stats(tmp_path):
+    checkpoint = tmp_path / "checkpoints" / "run_000_nsga3_func.ckpt"
+    run_backend("nsga3_func", pop_size=12, generations=2, num_obj=2, num_var=6, seed=0, checkpoint_path=checkpoint)
+
+    summary = _run(tmp_path, num_loops=2, seed=0, caching=CacheConfig(resume=True, checkpoint_every=1))
+    with open(tmp_path / "run_000_nsga3_func.json") as f:
+        assert json.load(f)["resumed_from_checkpoint"]
+    stats = summary["results"]["nsga3_func"]["stats"]
+    assert stats["hypervolume"]["n"] == 2
+    assert stats["elapsed_time"]["n"] == 1
+    assert stats["hv_elapsed_time"]["n"] == 2
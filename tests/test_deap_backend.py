@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("deap")
+
+from algorithms.deap_nsga3 import DeapNSGA3Session
+from problems.dtlz2 import DTLZ2
+from helpers import run_backend
+
+
+def test_objective_counts_in_one_process():
+    # Os tipos do `creator` são globais: M diferentes no mesmo processo precisam de tipos próprios
+    for num_obj in (2, 3, 2, 5):
+        front, info = run_backend("nsga3_deap_func", pop_size=12, generations=3, num_obj=num_obj, seed=0)
+        assert info["n_gen"] == 3
+        assert all(len(f) == num_obj for f in front)
+
+
+def test_sessions_keep_their_types():
+    bounds = [(0.0, 1.0)] * 6
+    s2 = DeapNSGA3Session(DTLZ2(2), bounds, divisions=4)
+    s3 = DeapNSGA3Session(DTLZ2(3), bounds, divisions=4)
+    assert len(s2.individual_type.fitness.weights) == 2
+    assert len(s3.individual_type.fitness.weights) == 3
@@ -0,0 +1,25 @@
+import pickle
+import numpy as np
+import pytest
+
+from problems.dtlz2 import DTLZ2, dtlz2, dtlz2_batch, dtlz2_true_front
+
+
+@pytest.mark.parametrize("num_obj,num_var", [(2, 6), (3, 12), (6, 15)])
+def test_batch_is_identical_to_the_scalar_function(num_obj, num_var):
+    X = np.random.default_rng(num_obj).random((50, num_var))
+    np.testing.assert_array_equal(dtlz2_batch(X, num_obj), np.array([dtlz2(x, num_obj) for x in X]))
+
+
+def test_problem_object_is_picklable():
+    problem = pickle.loads(pickle.dumps(DTLZ2(3)))
+    x = np.full(7, 0.5)
+    np.testing.assert_array_equal(problem(x), dtlz2(x, 3))
+    np.testing.assert_array_equal(problem.batch(x[None, :])[0], dtlz2(x, 3))
+
+
+def test_true_front_is_on_the_unit_sphere():
+    front = dtlz2_true_front(200, 4, seed=0)
+    np.testing.assert_allclose(np.linalg.norm(front, axis=1), 1.0)
+    assert (front >= 0).all()
+    np.testing.assert_array_equal(front, dtlz2_true_front(200, 4, seed=0))
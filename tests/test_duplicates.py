@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from algorithms.duplicates import genotype_key, row_keys, unique_mask
+from helpers import run_backend
+
+
+def test_unique_mask_keeps_first_occurrence():
+    X = np.array([[0.1, 0.2], [0.3, 0.4], [0.1, 0.2], [0.5, 0.6], [0.3, 0.4]])
+    assert unique_mask(X).tolist() == [True, True, False, True, False]
+    assert unique_mask(X, exclude=row_keys(X[3:4])).tolist() == [True, True, False, False, False]
+
+
+def test_tolerance_quantizes_keys():
+    a, b = np.array([0.1, 0.2]), np.array([0.1 + 1e-9, 0.2])
+    assert genotype_key(a) != genotype_key(b)
+    assert genotype_key(a, 1e-6) == genotype_key(b, 1e-6)
+    assert row_keys(np.vstack([a, b]), 1e-6) == [genotype_key(a, 1e-6), genotype_key(b, 1e-6)]
+    assert unique_mask(np.vstack([a, b]), 1e-6).tolist() == [True, False]
+
+
+@pytest.mark.parametrize("tol", [0.0, -1e-6])
+def test_tolerance_must_be_positive(tol):
+    X = np.random.default_rng(0).random((5, 3))
+    with pytest.raises(ValueError):
+        unique_mask(X, tol)
+    with pytest.raises(ValueError):
+        genotype_key(X[0], tol)
+    with pytest.raises(ValueError):
+        run_backend("nsga3_func", eliminate_duplicates=tol)
+
+
+@pytest.mark.parametrize("space", ["decision", "objective"])
+def test_pure_engine_front_has_no_duplicates(space):
+    front, info = run_backend(
+        "nsga3_func", pop_size=20, generations=15, num_obj=2, num_var=6, seed=3,
+        eliminate_duplicates=True, duplicates_space=space
+    )
+    assert len(front) > 0
+    assert unique_mask(np.array(front)).all()
+    assert info["n_evals"] == 20 * 16
+
+
+def test_pure_engine_rejects_unknown_space():
+    with pytest.raises(ValueError):
+        run_backend("nsga3_func", eliminate_duplicates=True, duplicates_space="genotype")
+
+
+def test_pymoo_hash_elimination_matches_default():
+    pytest.importorskip("pymoo")
+    from pymoo.core.duplicate import DefaultDuplicateElimination
+    from pymoo.core.population import Population
+    from algorithms.pymoo_nsga3 import HashDuplicateElimination
+
+    rng = np.random.default_rng(0)
+    X = rng.random((30, 5))
+    pop = Population.new(X=np.vstack([X, X[:7]])[rng.permutation(37)])
+    other = Population.new(X=X[10:15])
+    expected = DefaultDuplicateElimination().do(pop, other, return_indices=True)[1]
+    got = HashDuplicateElimination().do(pop, other, return_indices=True)[1]
+    assert sorted(got) == sorted(expected)
+
+
+@pytest.mark.parametrize("value,expected", [(None, "DefaultDuplicateElimination"), (True, "HashDuplicateElimination"), (False, "NoDuplicateElimination")])
+def test_pymoo_keeps_its_default_elimination_unless_asked(monkeypatch, value, expected):
+    pytest.importorskip("pymoo")
+    import algorithms.pymoo_nsga3 as pymoo_nsga3
+
+    algorithms = []
+    original = pymoo_nsga3.NSGA3
+    monkeypatch.setattr(pymoo_nsga3, "NSGA3", lambda **kwargs: algorithms.append(original(**kwargs)) or algorithms[-1])
+    kwargs = {} if value is None else {"eliminate_duplicates": value}
+    run_backend("nsga3_pymoo_func", pop_size=12, generations=2, num_obj=2, num_var=6, seed=1, **kwargs)
+    assert type(algorithms[0].eliminate_duplicates).__name__ == expected
@@ -0,0 +1,49 @@
+import numpy as np
+
+from algorithms.eval_cache import EvaluationCache
+from helpers import run_backend
+
+
+def _counting(calls):
+    def f(x):
+        calls.append(x)
+        return np.array([x.sum(), -x.sum()])
+    return f
+
+
+def test_lru_eviction():
+    calls = []
+    cache = EvaluationCache(_counting(calls), maxsize=2)
+    a, b, c = np.zeros(2), np.ones(2), np.full(2, 2.0)
+    cache(a), cache(b), cache(a), cache(c)  # c descarta b (menos recente)
+    assert len(cache) == 2
+    cache(a)
+    cache(b)
+    assert len(calls) == 4
+    assert cache.stats()["hits"] == 2
+
+
+def test_tolerance_shares_evaluations():
+    calls = []
+    cache = EvaluationCache(_counting(calls), tol=1e-3)
+    cache(np.array([0.5, 0.5]))
+    cache(np.array([0.5 + 1e-5, 0.5]))
+    assert len(calls) == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_cache_returns_copies():
+    cache = EvaluationCache(_counting([]))
+    x = np.zeros(2)
+    cache(x)[0] = 99.0
+    assert cache(x)[0] == 0.0
+
+
+def test_pure_engine_counts_only_real_evaluations():
+    front, info = run_backend("nsga3_func", pop_size=20, generations=10, seed=3)
+    cached_front, cached_info = run_backend("nsga3_func", pop_size=20, generations=10, seed=3, cache_size=1000)
+    assert cached_front == front
+    stats = cached_info["cache"]
+    # Toda consulta é a população inicial ou um filho: sem reavaliação dos pais
+    assert stats["hits"] + stats["misses"] == info["n_evals"] == 20 * 11
+    assert cached_info["n_evals"] == stats["misses"]
@@ -0,0 +1,66 @@
+import json
+
+from experiments.experiment_runner import run_experiemnt_with_dtlz2
+from experiments.runner_config import BudgetConfig, CacheConfig, ProfilingConfig
+
+
+def _strict_load(path):
+    def reject(token):
+        raise ValueError(f"JSON inválido: {token}")
+    with open(path) as f:
+        return json.loads(f.read(), parse_constant=reject)
+
+
+def _run(output_dir, implementations=("nsga3_func",), num_loops=2, **kwargs):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    run_experiemnt_with_dtlz2(
+        pop_size=12,
+        num_gen=3,
+        bounds=[(0.0, 1.0)] * 6,
+        num_obj=2,
+        divisions=4,
+        radius_ref=0.15,
+        implementations=list(implementations),
+        num_loops=num_loops,
+        output_dir=output_dir,
+        **kwargs
+    )
+    return _strict_load(output_dir / "summary.json")
+
+
+def test_summary_is_valid_json_without_memory_profile(tmp_path):
+    summary = _run(tmp_path, seed=0)
+    results = summary["results"]["nsga3_func"]
+    assert results["stats"]["hypervolume"]["n"] == 2
+    assert results["peak_rss_mb"] is None
+    assert results["stats"]["peak_rss_mb"] == {**results["stats"]["peak_rss_mb"], "n": 0, "mean": None}
+
+
+def test_memory_profile(tmp_path):
+    summary = _run(tmp_path, num_loops=1, seed=0, profiling=ProfilingConfig(memory_profile={"interval": 0.005}))
+    results = summary["results"]["nsga3_func"]
+    assert results["stats"]["peak_rss_mb"]["n"] == 1
+    assert results["peak_rss_mb"] > 0
+    run = _strict_load(tmp_path / "run_000_nsga3_func.json")
+    assert run["memory"]["n_samples"] >= 2
+
+
+def test_cached_runs_are_marked_and_left_out_of_timing_stats(tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = _run(tmp_path / "first", seed=0, caching=CacheConfig(cache_dir))
+    second = _run(tmp_path / "second", seed=0, caching=CacheConfig(cache_dir))
+
+    assert _strict_load(tmp_path / "second" / "run_000_nsga3_func.json")["cached"]
+    stats = second["results"]["nsga3_func"]["stats"]
+    assert stats["hypervolume"] == first["results"]["nsga3_func"]["stats"]["hypervolume"]
+    assert stats["elapsed_time"]["n"] == 0 and stats["hv_elapsed_time"]["n"] == 0
+    assert stats["cpu_time"]["n"] == 0
+
+
+def test_runs_with_time_budget_are_not_cached(tmp_path):
+    cache_dir = tmp_path / "cache"
+    _run(tmp_path / "first", seed=0, caching=CacheConfig(cache_dir), budget=BudgetConfig(time_budget=60.0))
+    assert not list(cache_dir.rglob("*.json"))
+    second = _run(tmp_path / "second", seed=0, caching=CacheConfig(cache_dir), budget=BudgetConfig(time_budget=60.0))
+    assert "cached" not in _strict_load(tmp_path / "second" / "run_000_nsga3_func.json")
+    assert second["results"]["nsga3_func"]["stats"]["elapsed_time"]["n"] == 2
@@ -0,0 +1,96 @@
+import math
+import numpy as np
+import pytest
+
+from algorithms.pure_nsga3 import fast_nondominated_sort
+from experiments.microbench import (
+    BENCHMARKS,
+    COMPONENTS,
+    FRONT_SHAPES,
+    _divisions_for,
+    run_microbench,
+    scaling_exponent,
+    synthetic_front,
+    time_call,
+)
+
+
+@pytest.mark.parametrize("shape", FRONT_SHAPES)
+def test_synthetic_front_has_the_requested_fronts(shape):
+    F, ranks = synthetic_front(23, 3, n_fronts=4, shape=shape, seed=1)
+    assert F.shape == (23, 3)
+    assert np.bincount(ranks).tolist() == [6, 6, 6, 5]
+    first = F[ranks == 0]
+    if shape == "linear":
+        np.testing.assert_allclose(first.sum(axis=1), 1.0)
+    else:
+        np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0)
+
+    fronts = fast_nondominated_sort([tuple(row) for row in F.tolist()])
+    found = np.empty(len(F), dtype=int)
+    for k, front in enumerate(fronts):
+        found[front] = k
+    assert found.tolist() == ranks.tolist()
+
+
+def test_synthetic_front_is_reproducible_and_validated():
+    F1, r1 = synthetic_front(10, 2, n_fronts=2, seed=3)
+    F2, r2 = synthetic_front(10, 2, n_fronts=2, seed=3)
+    assert np.array_equal(F1, F2) and np.array_equal(r1, r2)
+    with pytest.raises(ValueError):
+        synthetic_front(10, 2, shape="concave")
+    with pytest.raises(ValueError):
+        synthetic_front(3, 2, n_fronts=4)
+
+
+@pytest.mark.parametrize("n,M", [(1, 3), (10, 3), (50, 5), (91, 3)])
+def test_divisions_for_is_the_smallest_with_enough_references(n, M):
+    p = _divisions_for(n, M)
+    assert math.comb(p + M - 1, M - 1) >= n
+    assert p == 1 or math.comb(p + M - 2, M - 1) < n
+
+
+def test_time_call_reports_per_call_times():
+    calls = []
+    timing = time_call(lambda: calls.append(None), min_time=0.001, repeat=3)
+    assert set(timing) == {"number", "repeat", "min", "median", "mean"}
+    assert timing["repeat"] == 3
+    assert len(calls) >= timing["number"] * 3
+    assert 0 < timing["min"] <= timing["median"]
+    assert timing["min"] <= timing["mean"]
+
+
+def test_scaling_exponent():
+    sizes = [10, 20, 40]
+    assert scaling_exponent(sizes, [n ** 2 * 1e-6 for n in sizes]) == pytest.approx(2.0)
+    assert scaling_exponent([10], [1.0]) is None
+
+
+def test_every_component_maps_to_registered_benchmarks():
+    names = [name for group in COMPONENTS.values() for name in group]
+    assert set(names) == set(BENCHMARKS)
+
+
+def test_run_microbench_reports_results_and_scaling():
+    report = run_microbench(
+        components=["nondominated_sort", "crossover"],
+        sizes=[16, 8],
+        objectives=[3],
+        min_time=0.001,
+        repeat=2,
+    )
+    assert report["params"]["sizes"] == [8, 16]
+    benchmarks = COMPONENTS["nondominated_sort"] + COMPONENTS["crossover"]
+    assert len(report["results"]) == len(benchmarks) * 2
+    assert {entry["benchmark"] for entry in report["results"]} == set(benchmarks)
+    assert all(entry["M"] == 3 and entry["min"] > 0 for entry in report["results"])
+    assert [curve["benchmark"] for curve in report["scaling"]] == list(benchmarks)
+    for curve in report["scaling"]:
+        assert curve["sizes"] == [8, 16]
+        assert len(curve["min"]) == 2
+        assert isinstance(curve["exponent"], float)
+
+
+def test_run_microbench_rejects_unknown_components():
+    with pytest.raises(ValueError):
+        run_microbench(components=["sorting"], sizes=[8], objectives=[3])
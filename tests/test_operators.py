@@ -0,0 +1,81 @@
+import random
+import numpy as np
+import pytest
+
+from algorithms.registry import get_backend
+from genetic_operators.crossover import SBXCrossover, sbx_crossover, sbx_crossover_batch
+from genetic_operators.mutation import PolynomialMutation, polynomial_mutation, polynomial_mutation_batch
+from problems.dtlz2 import DTLZ2
+from helpers import BACKENDS
+
+BOUNDS = [(0.0, 1.0)] * 6
+
+
+def test_sbx_batch_keeps_bounds_and_midpoint():
+    np.random.seed(0)
+    P1, P2 = np.random.random((50, 6)), np.random.random((50, 6))
+    C1, C2 = sbx_crossover_batch(P1, P2, [(-10.0, 10.0)] * 6, cxpb=1.0)
+    np.testing.assert_allclose(C1 + C2, P1 + P2)  # sem recorte, SBX preserva o ponto médio
+    C1, C2 = sbx_crossover_batch(P1, P2, BOUNDS, cxpb=1.0)
+    assert C1.min() >= 0.0 and C1.max() <= 1.0 and C2.min() >= 0.0 and C2.max() <= 1.0
+    C1, C2 = sbx_crossover_batch(P1, P2, BOUNDS, cxpb=0.0)
+    np.testing.assert_array_equal(C1, P1)
+    np.testing.assert_array_equal(C2, P2)
+
+
+def test_mutation_batch_rates():
+    np.random.seed(1)
+    X = np.random.random((200, 6))
+    original = X.copy()
+    np.testing.assert_array_equal(polynomial_mutation_batch(X, BOUNDS, mutation_rate=0.0), X)
+    Y = polynomial_mutation_batch(X, BOUNDS, mutation_rate=1.0, per_gene_prob=1.0)
+    assert Y.min() >= 0.0 and Y.max() <= 1.0
+    assert np.mean(Y != X) > 0.99
+    np.testing.assert_array_equal(X, original)  # retorna uma nova matriz
+
+
+def test_batch_operators_follow_the_scalar_distribution():
+    # Mesma regra sorteada de outro modo: compara o deslocamento médio dos filhos
+    random.seed(2)
+    np.random.seed(2)
+    P1, P2 = np.random.random((4000, 6)), np.random.random((4000, 6))
+    scalar = np.array([sbx_crossover(a, b, BOUNDS)[0] for a, b in zip(P1, P2)])
+    batch = sbx_crossover_batch(P1, P2, BOUNDS)[0]
+    assert np.mean(np.abs(batch - P1)) == pytest.approx(np.mean(np.abs(scalar - P1)), rel=0.05)
+
+    scalar = np.array([polynomial_mutation(x, BOUNDS) for x in P1])
+    batch = polynomial_mutation_batch(P1, BOUNDS)
+    assert np.mean(np.abs(batch - P1)) == pytest.approx(np.mean(np.abs(scalar - P1)), rel=0.1)
+
+
+class _BatchOnlyCrossover(SBXCrossover):
+    calls = 0
+
+    def __call__(self, parent1, parent2):
+        raise AssertionError("operador escalar chamado com versão em lote disponível")
+
+    def batch(self, parents1, parents2):
+        type(self).calls += 1
+        return super().batch(parents1, parents2)
+
+
+class _BatchOnlyMutation(PolynomialMutation):
+    calls = 0
+
+    def __call__(self, individual, bounds):
+        raise AssertionError("operador escalar chamado com versão em lote disponível")
+
+    def batch(self, population, bounds):
+        type(self).calls += 1
+        return super().batch(population, bounds)
+
+
+@pytest.mark.parametrize("name", [p for p in BACKENDS if p.values[0] in ("nsga3_deap_func", "nsga3_pymoo_func")])
+def test_adapters_use_the_batch_path(name):
+    _BatchOnlyCrossover.calls = _BatchOnlyMutation.calls = 0
+    info: dict = {}
+    front = get_backend(name)(
+        20, 4, BOUNDS, DTLZ2(3), _BatchOnlyCrossover(BOUNDS), _BatchOnlyMutation(), divisions=4, info=info, seed=0
+    )
+    assert len(front) > 0 and info["n_gen"] == 4
+    assert _BatchOnlyCrossover.calls >= 4 and _BatchOnlyMutation.calls >= 4
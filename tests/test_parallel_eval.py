@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+import algorithms.pure_nsga3 as pure_nsga3
+from algorithms.parallel_eval import ParallelEvaluator
+from problems.dtlz2 import DTLZ2
+from utils.shared_population import SharedArray, SharedPopulation
+from helpers import run_backend
+from test_experiment_runner import _run
+
+
+def test_shared_array_attach_sees_the_same_memory():
+    owner = SharedArray.from_array(np.arange(6.0).reshape(2, 3))
+    try:
+        view = SharedArray.attach(owner.descriptor())
+        view.array[1, 2] = -1.0
+        assert owner.array[1, 2] == -1.0
+        view.close()
+    finally:
+        owner.close()
+        owner.unlink()
+
+
+def test_shared_population_buffers():
+    buffer = SharedPopulation.create(4, 3, 2)
+    try:
+        attached = SharedPopulation.attach(buffer.descriptor())
+        attached.F[0] = [1.0, 2.0]
+        assert buffer.F[0].tolist() == [1.0, 2.0]
+        assert buffer.capacity == 4 and buffer.X.shape == (4, 3)
+        attached.close()
+    finally:
+        buffer.close()
+        buffer.unlink()
+
+
+def test_parallel_evaluator_matches_serial_evaluation():
+    problem = DTLZ2(3)
+    X = np.random.default_rng(0).random((23, 7))
+    evaluator = ParallelEvaluator(problem, n_workers=2, capacity=10, n_var=7, n_obj=3)
+    try:
+        F = evaluator.evaluate(list(X))  # capacidade menor que a população: avaliada em lotes
+    finally:
+        evaluator.close()
+    np.testing.assert_array_equal(F, np.array([problem(x) for x in X]))
+
+
+def test_pure_engine_with_workers_matches_serial_run():
+    serial, serial_info = run_backend("nsga3_func", seed=4)
+    parallel, parallel_info = run_backend("nsga3_func", seed=4, n_workers=2)
+    np.testing.assert_array_equal(np.array(parallel), np.array(serial))
+    assert parallel_info["n_evals"] == serial_info["n_evals"]
+
+
+def test_pure_engine_closes_the_workers_on_errors(monkeypatch):
+    evaluators = []
+
+    class RecordingEvaluator(ParallelEvaluator):
+        def __init__(self, *args):
+            super().__init__(*args)
+            evaluators.append(self)
+
+    def failing_callback(gen, F):
+        raise RuntimeError("callback")
+
+    monkeypatch.setattr(pure_nsga3, "ParallelEvaluator", RecordingEvaluator)
+    with pytest.raises(RuntimeError):
+        run_backend("nsga3_func", seed=4, n_workers=2, callback=failing_callback)
+    assert len(evaluators) == 1 and not evaluators[0]._finalizer.alive
+
+
+def test_runner_pool_matches_serial_runner(tmp_path):
+    serial = _run(tmp_path / "serial", seed=0)
+    pooled = _run(tmp_path / "pooled", seed=0, n_workers=2)
+    for key in ("hypervolume", "igd", "n_evals"):
+        assert pooled["results"]["nsga3_func"]["stats"][key] == serial["results"]["nsga3_func"]["stats"][key]
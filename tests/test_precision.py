@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from analysis.precision import indicator_precision_error
+from experiments.precision_study import run_precision_study
+from problems.dtlz2 import dtlz2_true_front
+from helpers import run_backend
+
+# Tolerância relativa de HV/IGD entre float32 e float64 (epsilon de float32 ~ 1.2e-7)
+REL_TOL = 1e-5
+
+
+@pytest.mark.parametrize("num_obj", [2, 3, 5])
+def test_indicator_error_of_single_precision(num_obj):
+    true_front = dtlz2_true_front(300, num_obj, seed=0)
+    front, _ = run_backend("nsga3_func", num_obj=num_obj, num_var=num_obj + 4, seed=1)
+    errors = indicator_precision_error(np.array(front), true_front)
+    for key in ("hypervolume", "gd", "igd"):
+        assert errors[key]["rel_error"] < REL_TOL, (key, errors[key])
+
+
+def test_float32_runs_match_float64_runs(capsys):
+    params = {"num_obj": 3, "num_var": 7, "pop_size": 20, "num_gen": 10, "divisions": 4}
+    report = run_precision_study(params, runs=3)
+    capsys.readouterr()
+    for key in ("hypervolume", "igd"):
+        assert report["indicator_rel_error"][key]["max"] < REL_TOL
+        assert abs(report["runs"][key]["rel_diff_mean"]) < REL_TOL
+        scale = abs(report["runs"][key]["mean_float64"])
+        assert report["runs"][key]["max_abs_paired_diff"] < REL_TOL * scale
+    memory = report["memory"]
+    assert memory["float32"]["true_front_bytes"] * 2 == memory["float64"]["true_front_bytes"]
+
+
+def test_float32_engine_follows_the_float64_run():
+    front32, info32 = run_backend("nsga3_func", seed=2, dtype="float32")
+    front64, info64 = run_backend("nsga3_func", seed=2)
+    assert info32["n_evals"] == info64["n_evals"]
+    np.testing.assert_allclose(np.array(front32), np.array(front64), rtol=1e-4, atol=1e-5)
@@ -0,0 +1,52 @@
+import time
+import pytest
+
+from experiments.runner_config import ProfilingConfig
+from utils.profiling import RunProfiler, hotspots, load_profile
+from helpers import run_backend
+from test_experiment_runner import _run
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _work():
+    for _ in range(3):
+        _busy(0.02)
+
+
+@pytest.mark.parametrize("suffix,kind", [(".prof", "cprofile"), (".json", "sample")])
+def test_profiler_finds_the_hot_function(tmp_path, suffix, kind):
+    path = tmp_path / f"run{suffix}"
+    with RunProfiler(path, interval=0.002) as profiler:
+        _work()
+    assert profiler.kind == kind
+    profile = load_profile(path)
+    busy = next(label for label in profile if label.endswith("(_busy)"))
+    assert profile[busy]["self_time"] > 0.02
+    if kind == "cprofile":
+        assert profile[busy]["calls"] == 3
+
+    ranked = hotspots([path, path], top=5)
+    assert ranked[0]["function"] == busy
+    assert ranked[0]["self_time_per_run"] == pytest.approx(profile[busy]["self_time"])
+
+
+def test_unknown_profiler():
+    with pytest.raises(ValueError):
+        RunProfiler("run.prof", kind="perf")
+
+
+def test_backend_profile_file(tmp_path):
+    run_backend("nsga3_func", seed=0, profile=tmp_path / "pure.prof")
+    assert any("pure_nsga3.py" in label for label in load_profile(tmp_path / "pure.prof"))
+
+
+def test_runner_profiles_selected_runs(tmp_path):
+    _run(tmp_path, seed=0, profiling=ProfilingConfig(profile={"kind": "sample", "runs": [1], "interval": 0.001}))
+    profiles = sorted(path.name for path in (tmp_path / "profiles").glob("run_*"))
+    assert profiles == ["run_001_nsga3_func_indicators.json", "run_001_nsga3_func_optimizer.json"]
+    assert (tmp_path / "profiles" / "hotspots.json").exists()
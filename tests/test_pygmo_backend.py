@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+pg = pytest.importorskip("pygmo")
+
+from algorithms.pygmo_nsga3 import PygmoNSGA3Session, PygmoProblem
+from problems.dtlz2 import DTLZ2
+from utils.generate_points import generate_reference_points
+from helpers import run_backend
+
+BOUNDS = [(0.0, 1.0)] * 8
+
+
+def test_batch_fitness_matches_fitness():
+    problem = PygmoProblem(DTLZ2(3), BOUNDS, 3)
+    X = np.random.default_rng(0).random((10, 8))
+    expected = np.concatenate([problem.fitness(x) for x in X])
+    np.testing.assert_array_equal(problem.batch_fitness(X.ravel()), expected)
+
+
+def test_reference_points_must_be_a_das_dennis_grid():
+    session = PygmoNSGA3Session(DTLZ2(3), BOUNDS, ref_points=generate_reference_points(3, 6))
+    assert session.divisions == 6
+    with pytest.raises(ValueError):
+        PygmoNSGA3Session(DTLZ2(3), BOUNDS, ref_points=np.random.default_rng(0).random((10, 3)))
+
+
+def test_budget_and_seed():
+    front, info = run_backend("nsga3_pygmo_func", pop_size=20, generations=10, seed=0, max_evals=100)
+    assert info["n_evals"] <= 100 + 20 and info["stop_reason"] == "max_evals"
+    assert run_backend("nsga3_pygmo_func", pop_size=20, generations=10, seed=0, max_evals=100)[0] == front
+
+
+def test_archipelago():
+    front, info = run_backend("nsga3_pygmo_func", pop_size=20, generations=4, seed=0, n_islands=2, migration_interval=2)
+    assert len(front) > 0 and all(len(f) == 3 for f in front)
+    assert info["n_gen"] == 4
+    assert info["n_evals"] == 2 * 20 * (4 + 1)
+    with pytest.raises(ValueError):
+        run_backend("nsga3_pygmo_func", n_islands=2, topology="star")
+
+
+def test_archipelago_respects_generations_budget_and_front_size():
+    # 5 gerações com migração a cada 2: rodadas de 2, 2 e 1
+    front, info = run_backend("nsga3_pygmo_func", pop_size=20, generations=5, seed=0, n_islands=3, migration_interval=2)
+    assert info["n_gen"] == 5
+    assert info["n_evals"] == 3 * 20 * (5 + 1)
+    assert len(front) <= 20
+
+    front, info = run_backend(
+        "nsga3_pygmo_func", pop_size=20, generations=10, seed=0, n_islands=2, migration_interval=4, max_evals=100
+    )
+    assert info["stop_reason"] == "max_evals"
+    assert 100 <= info["n_evals"] < 100 + 2 * 20
+
+
+def test_archipelago_rejects_initial_population():
+    with pytest.raises(ValueError):
+        run_backend("nsga3_pygmo_func", n_islands=2, initial_pop=list(np.random.default_rng(0).random((20, 8))))
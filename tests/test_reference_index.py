@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from utils.generate_points import generate_reference_points
+from utils.reference_index import ReferenceIndex, das_dennis_divisions
+
+
+def _queries(M, n=3000, seed=0):
+    X = np.abs(np.random.default_rng(seed).standard_normal((n, M)))
+    return X / np.linalg.norm(X, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("M,p", [(3, 12), (4, 20), (6, 10), (8, 6)])
+def test_lattice_matches_brute_force(M, p):
+    points = generate_reference_points(M, p)
+    lattice, brute = ReferenceIndex(points, "lattice"), ReferenceIndex(points, "brute")
+    X = _queries(M)
+
+    # Empates podem escolher pontos diferentes: compara as distâncias
+    _, dist_lattice = lattice.nearest(X)
+    _, dist_brute = brute.nearest(X)
+    np.testing.assert_allclose(dist_lattice, dist_brute, rtol=0, atol=1e-12)
+
+    index_lattice, dist_lattice = lattice.nearest_direction(X)
+    index_brute, dist_brute = brute.nearest_direction(X)
+    np.testing.assert_allclose(dist_lattice, dist_brute, rtol=0, atol=1e-12)
+    cos = lambda index: np.einsum("ij,ij->i", X, lattice.directions[index])
+    np.testing.assert_allclose(cos(index_lattice), cos(index_brute), rtol=0, atol=1e-12)
+
+
+def test_auto_method():
+    assert ReferenceIndex(generate_reference_points(3, 12)).method == "brute"
+    assert ReferenceIndex(generate_reference_points(6, 10)).method == "lattice"
+    points = generate_reference_points(6, 10)[::-1]  # outra ordem: não é a grade gerada
+    assert ReferenceIndex(points).method == "brute"
+    with pytest.raises(ValueError):
+        ReferenceIndex(points, "lattice")
+
+
+def test_das_dennis_divisions():
+    assert das_dennis_divisions(generate_reference_points(5, 7)) == 7
+    assert das_dennis_divisions(np.random.default_rng(0).random((10, 3))) is None
+
+
+def test_nearest_on_grid_points_is_identity():
+    points = generate_reference_points(4, 20)
+    index, dist = ReferenceIndex(points, "lattice").nearest(points)
+    assert np.array_equal(index, np.arange(len(points)))
+    assert np.all(dist < 1e-12)
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+import pytest
+
+from algorithms import registry
+from algorithms.registry import available_backends, backend_name, get_backend, register_backend, resolve_backend
+
+
+def test_importing_the_runner_loads_no_backend_library():
+    code = (
+        "import sys, experiments.experiment_runner, algorithms.registry\n"
+        "print(sorted(m for m in ('deap', 'pymoo', 'pygmo', 'algorithms.deap_nsga3') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_aliases_and_names():
+    assert get_backend("pure") is get_backend("nsga3_func")
+    assert resolve_backend(get_backend("pure")) is get_backend("nsga3_func")
+    assert backend_name("deap") == "nsga3_deap_func"
+    assert backend_name(get_backend("pure")) == "nsga3_func"
+    assert "nsga3_func" in available_backends()
+
+
+def test_unknown_and_unavailable_backends(monkeypatch):
+    monkeypatch.setattr(registry, "_BACKENDS", dict(registry._BACKENDS))
+    with pytest.raises(ValueError):
+        get_backend("nsga2_func")
+    register_backend("missing_func", "no_such_module_xyz:run", requires=("no_such_module_xyz",))
+    assert "missing_func" not in available_backends()
+    with pytest.raises(ImportError, match="no_such_module_xyz"):
+        get_backend("missing_func")
@@ -0,0 +1,64 @@
+import json
+import pytest
+
+from experiments.regression import compare_dirs, main
+from experiments.sweep import config_dir_name, expand_sweep
+
+
+@pytest.fixture
+def spec_file(tmp_path):
+    spec = {
+        "repetitions": 2,
+        "seed": 0,
+        "implementations": ["nsga3_func", "nsga3_deap_func"],
+        "params": {"pop_size": 12, "num_gen": 3, "divisions": 4},
+        "cases": [{"num_obj": 2, "num_var": 6}, {"num_obj": 3, "num_var": 7}],
+        "metrics": {"hypervolume": "higher", "igd": "lower"},
+    }
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec))
+    return path
+
+
+def test_record_and_check(tmp_path, spec_file):
+    baseline = tmp_path / "baseline"
+    main(["record", str(spec_file), "--baseline", str(baseline)])
+    assert (baseline / "environment.json").exists()
+
+    # Mesmas sementes: nenhuma diferença nos indicadores
+    main(["check", str(spec_file), "--baseline", str(baseline), "--output-dir", str(tmp_path / "current")])
+    with open(tmp_path / "current" / "regression_report.json") as f:
+        report = json.load(f)
+    assert report["comparisons"] and not report["regressions"] and not report["missing"]
+
+
+def test_record_refuses_existing_baseline(tmp_path, spec_file):
+    baseline = tmp_path / "baseline"
+    baseline.mkdir()
+    (baseline / "old.json").write_text("{}")
+    with pytest.raises(FileExistsError):
+        main(["record", str(spec_file), "--baseline", str(baseline)])
+
+
+def test_check_fails_on_missing_baseline(tmp_path, spec_file):
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(SystemExit) as exc:
+        main(["check", str(spec_file), "--baseline", str(tmp_path / "empty"), "--output-dir", str(tmp_path / "current")])
+    assert exc.value.code == 1
+
+
+def _write_runs(config_dir, name, values):
+    config_dir.mkdir(parents=True, exist_ok=True)
+    for i, value in enumerate(values):
+        (config_dir / f"run_{i:03d}_{name}.json").write_text(json.dumps({"elapsed_time": value, "niche_metrics": {}}))
+
+
+def test_compare_dirs_flags_slowdown(tmp_path):
+    spec = {"implementations": ["nsga3_func"], "cases": [{"num_obj": 2, "num_var": 6}]}
+    config = config_dir_name(expand_sweep(spec)[0])
+    _write_runs(tmp_path / "base" / config, "nsga3_func", [1.0 + 0.01 * i for i in range(10)])
+    _write_runs(tmp_path / "slow" / config, "nsga3_func", [1.3 + 0.01 * i for i in range(10)])
+    report = compare_dirs(spec, tmp_path / "base", tmp_path / "slow", metrics={"elapsed_time": "lower"})
+    assert [c["metric"] for c in report["regressions"]] == ["elapsed_time"]
+    report = compare_dirs(spec, tmp_path / "slow", tmp_path / "base", metrics={"elapsed_time": "lower"})
+    assert not report["regressions"] and len(report["improvements"]) == 1
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from analysis.sequential import SequentialStopping
+from analysis.stat_tests import bootstrap_mean_ci, mann_whitney_u, rankdata
+from experiments.runner_config import BudgetConfig, CacheConfig
+from test_experiment_runner import _run
+
+
+def test_rank_and_mann_whitney_match_scipy():
+    stats = pytest.importorskip("scipy.stats")
+    rng = np.random.default_rng(0)
+    x = np.round(rng.normal(size=15), 1)
+    y = np.round(rng.normal(0.5, size=12), 1)  # arredondados: com empates
+    np.testing.assert_allclose(rankdata(np.concatenate([x, y]))[0], stats.rankdata(np.concatenate([x, y])))
+    expected = stats.mannwhitneyu(x, y, use_continuity=True, alternative="two-sided", method="asymptotic")
+    u, p = mann_whitney_u(x, y)
+    assert u == pytest.approx(expected.statistic)
+    assert p == pytest.approx(expected.pvalue)
+
+
+def test_bootstrap_interval_contains_the_mean():
+    values = np.random.default_rng(1).normal(10.0, 1.0, size=50)
+    low, high = bootstrap_mean_ci(values)
+    assert low < values.mean() < high
+    assert bootstrap_mean_ci(values[:1]) == (-np.inf, np.inf)
+
+
+def test_batches_and_validation():
+    rule = SequentialStopping(min_loops=10, batch_size=5)
+    assert rule.batches(23) == [(0, 10), (10, 15), (15, 20), (20, 23)]
+    assert rule.batches(4) == [(0, 4)]
+    with pytest.raises(ValueError):
+        SequentialStopping(min_loops=1)
+
+
+def test_decision():
+    rule = SequentialStopping(metrics=["hypervolume"], min_loops=5, rel_width=1e-6)
+    rng = np.random.default_rng(2)
+    separated = {"a": {"hypervolume": list(rng.normal(1.0, 0.01, 8))}, "b": {"hypervolume": list(rng.normal(2.0, 0.01, 8))}}
+    assert rule.decide(separated)["stop"]
+    mixed = {"a": {"hypervolume": list(rng.normal(1.0, 0.5, 8))}, "b": {"hypervolume": list(rng.normal(1.0, 0.5, 8))}}
+    assert not rule.decide(mixed)["stop"]
+    short = {name: {"hypervolume": values["hypervolume"][:4]} for name, values in separated.items()}
+    assert rule.decide(short) == {"n": 4, "stop": False, "metrics": {}}
+
+
+def test_runner_stops_once_settled(tmp_path):
+    sequential = {"metrics": ["hypervolume"], "min_loops": 3, "batch_size": 2, "rel_width": 10.0}
+    summary = _run(tmp_path, num_loops=20, seed=0, budget=BudgetConfig(sequential=sequential))
+    assert summary["parameters"]["num_loops_run"] == 3
+    assert summary["sequential_decision"]["stop"]
+    assert summary["results"]["nsga3_func"]["stats"]["hypervolume"]["n"] == 3
+    assert len(list(tmp_path.glob("run_*.json"))) == 3
+
+
+def test_cached_timings_are_not_sampled(tmp_path):
+    cache_dir = tmp_path / "cache"
+    _run(tmp_path / "first", num_loops=4, seed=0, caching=CacheConfig(cache_dir))
+    sequential = {"metrics": ["elapsed_time"], "min_loops": 3, "batch_size": 1, "rel_width": 10.0}
+    summary = _run(
+        tmp_path / "second", num_loops=4, seed=0,
+        caching=CacheConfig(cache_dir), budget=BudgetConfig(sequential=sequential)
+    )
+    # Todas as execuções vieram do cache: nenhum tempo medido, a regra não decide
+    assert summary["parameters"]["num_loops_run"] == 4
+    assert summary["sequential_decision"] == {"n": 0, "stop": False, "metrics": {}}
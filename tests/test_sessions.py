@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from algorithms.registry import get_backend
+from genetic_operators.crossover import SBXCrossover
+from genetic_operators.mutation import PolynomialMutation
+from problems.dtlz2 import DTLZ2
+from helpers import BACKENDS, run_backend
+from test_experiment_runner import _run
+
+SESSION_BACKENDS = [param for param in BACKENDS if param.values[0] != "nsga3_func"]
+
+
+@pytest.mark.parametrize("name", SESSION_BACKENDS)
+def test_session_runs_match_the_adapter(name):
+    bounds = [(0.0, 1.0)] * 8
+    session = get_backend(name).session_factory(DTLZ2(3), bounds, 4)
+    front, _ = run_backend(name, seed=7)
+    for _ in range(2):  # a sessão é reaproveitada sem carregar estado entre execuções
+        info: dict = {}
+        session_front = session.run(20, 5, SBXCrossover(bounds), PolynomialMutation(), seed=7, info=info)
+        np.testing.assert_array_equal(np.array(session_front), np.array(front))
+        assert info["n_gen"] == 5
+
+
+def test_runner_reuse_sessions_keeps_results(tmp_path):
+    pytest.importorskip("deap")
+    fresh = _run(tmp_path / "fresh", implementations=("nsga3_deap_func",), seed=0)
+    reused = _run(tmp_path / "reused", implementations=("nsga3_deap_func",), seed=0, reuse_sessions=True)
+    for key in ("hypervolume", "igd", "n_evals"):
+        assert reused["results"]["nsga3_deap_func"]["stats"][key] == fresh["results"]["nsga3_deap_func"]["stats"][key]
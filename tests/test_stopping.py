@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from algorithms.stopping import StagnationStopping, non_dominated_mask
+from helpers import BACKENDS, run_backend
+
+
+def test_non_dominated_mask():
+    F = np.array([[0.0, 1.0], [1.0, 0.0], [1.0, 1.0], [0.5, 0.5]])
+    assert non_dominated_mask(F).tolist() == [True, True, False, True]
+
+
+@pytest.mark.parametrize("indicator", StagnationStopping.INDICATORS)
+def test_stops_after_window_on_constant_population(indicator):
+    F = np.array([[0.0, 1.0], [1.0, 0.0], [0.6, 0.6]])
+    stopping = StagnationStopping(indicator, tol=1e-9, window=3, ref_front=F)
+    # A primeira geração só fixa o estado anterior; depois, `window` gerações estagnadas
+    assert [stopping(gen, F) for gen in range(1, 5)] == [False, False, False, True]
+
+
+def test_does_not_stop_while_improving():
+    stopping = StagnationStopping("ideal_nadir", tol=1e-3, window=2)
+    F = np.array([[0.0, 1.0], [1.0, 0.0]])
+    assert not any(stopping(gen, F * (1 + 1 / gen)) for gen in range(1, 20))
+
+
+def test_min_gen():
+    F = np.array([[0.0, 1.0], [1.0, 0.0]])
+    stopping = StagnationStopping("ideal_nadir", tol=1.0, window=1, min_gen=5)
+    assert [stopping(gen, F) for gen in range(1, 7)] == [False, False, False, False, True, True]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_callback_sees_generations_only(name):
+    # A população inicial não passa pelo callback: a paciência conta gerações
+    # efetivas, igual em todas as implementações
+    calls = []
+    stopping = StagnationStopping("ideal_nadir", tol=np.inf, window=3)
+    _, info = run_backend(
+        name, pop_size=20, generations=50, seed=1,
+        callback=lambda gen, F: calls.append((gen, len(F))) or stopping(gen, F)
+    )
+    assert info["stop_reason"] == "callback"
+    assert info["n_gen"] == 4
+    assert [gen for gen, _ in calls] == [1, 2, 3, 4]
+    assert info["n_evals"] == 20 * 5
@@ -0,0 +1,94 @@
+import json
+import math
+import numpy as np
+
+from analysis.streaming_stats import QuantileSketch, RunningStats, StreamingMetric
+from experiments.experiment_runner import merge_summaries
+from test_experiment_runner import _run
+
+
+def _strict_json(data):
+    def reject(token):
+        raise ValueError(f"JSON inválido: {token}")
+    return json.loads(json.dumps(data, allow_nan=False), parse_constant=reject)
+
+
+def test_running_stats_merge_matches_batch():
+    values = np.random.default_rng(0).normal(size=101)
+    left, right = RunningStats(), RunningStats()
+    for v in values[:40]:
+        left.update(v)
+    for v in values[40:]:
+        right.update(v)
+    merged = left.merge(right)
+    assert merged.n == 101
+    assert math.isclose(merged.mean, values.mean())
+    assert math.isclose(merged.variance, values.var(ddof=1))
+    assert (merged.min, merged.max) == (values.min(), values.max())
+
+
+def test_quantiles_exact_for_small_samples():
+    metric = StreamingMetric()
+    for v in range(1, 102):
+        metric.update(v)
+    summary = metric.summary()
+    assert summary["p50"] == 51
+    assert summary["min"] == 1 and summary["max"] == 101
+
+
+def test_empty_metric_is_valid_json():
+    metric = StreamingMetric()
+    summary = _strict_json(metric.summary())
+    assert summary["n"] == 0
+    assert summary["mean"] is None and summary["p50"] is None
+    state = _strict_json(metric.to_dict())
+    restored = StreamingMetric.from_dict(state)
+    assert restored.n == 0
+    restored.update(2.0)
+    assert restored.summary()["min"] == 2.0
+
+
+def test_single_value_has_no_std():
+    metric = StreamingMetric()
+    metric.update(1.5)
+    summary = _strict_json(metric.summary())
+    assert summary["std"] is None and summary["mean"] == 1.5
+
+
+def test_state_round_trip_and_merge():
+    a, b = StreamingMetric(), StreamingMetric()
+    for v in range(50):
+        a.update(v)
+    for v in range(50, 100):
+        b.update(v)
+    merged = StreamingMetric.from_dict(_strict_json(a.to_dict())).merge(StreamingMetric.from_dict(b.to_dict()))
+    assert merged.n == 100
+    assert math.isclose(merged.mean, 49.5)
+
+
+def test_sketch_quantiles_on_large_merged_samples():
+    values = np.random.default_rng(3).lognormal(size=40000)
+    parts = [QuantileSketch() for _ in range(4)]
+    for part, chunk in zip(parts, np.array_split(values, 4)):
+        for v in chunk:
+            part.update(v)
+    sketch = parts[0]
+    for part in parts[1:]:
+        sketch.merge(part)
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        # Erro medido em posto: o quantil estimado cai perto do posto q
+        rank = np.mean(values <= sketch.quantile(q))
+        assert abs(rank - q) < 0.01, q
+
+
+def test_merge_summaries_of_disjoint_runs(tmp_path):
+    first = _run(tmp_path / "a", num_loops=2, seed=0)
+    second = _run(tmp_path / "b", num_loops=3, seed=10)
+    merged = merge_summaries([first, second])
+    assert merged["parameters"]["num_loops"] == 5
+    stats = merged["results"]["nsga3_func"]["stats"]["hypervolume"]
+    assert stats["n"] == 5
+    expected = (2 * first["results"]["nsga3_func"]["stats"]["hypervolume"]["mean"]
+                + 3 * second["results"]["nsga3_func"]["stats"]["hypervolume"]["mean"]) / 5
+    assert math.isclose(stats["mean"], expected)
+    _strict_json(merged)
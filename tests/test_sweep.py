@@ -0,0 +1,59 @@
+import json
+import pytest
+
+from experiments.runner_config import CacheConfig
+from experiments.sweep import config_dir_name, expand_sweep, run_sweep
+from test_experiment_runner import _run
+
+
+def _spec(output_dir, implementations=("nsga3_func", "nsga3_deap_func")):
+    return {
+        "output_dir": str(output_dir),
+        "repetitions": 2,
+        "seed": 0,
+        "implementations": list(implementations),
+        "params": {"pop_size": 12, "num_gen": 3, "divisions": 4},
+        "cases": [{"num_obj": 2, "num_var": 6}, {"num_obj": 3, "num_var": 7}],
+    }
+
+
+def test_expand_sweep_grid():
+    spec = {"cases": [{"num_obj": 2, "num_var": 6}], "grid": {"pop_size": [12, 20], "num_gen": [3, 4]}}
+    configs = expand_sweep(spec)
+    assert [(c["pop_size"], c["num_gen"]) for c in configs] == [(12, 3), (12, 4), (20, 3), (20, 4)]
+    assert len({config_dir_name(c) for c in configs}) == 4
+
+
+def test_expand_sweep_rejects_unknown_params():
+    with pytest.raises(ValueError):
+        expand_sweep({"cases": [{"num_obj": 2, "num_var": 6, "popsize": 10}]})
+
+
+def test_serial_sweep_with_several_objective_counts(tmp_path):
+    spec = _spec(tmp_path / "out")
+    summary = run_sweep(spec, n_workers=1)
+    assert len(summary["configurations"]) == 2
+    for config in summary["configurations"]:
+        for name in spec["implementations"]:
+            assert config["results"][name]["stats"]["hypervolume"]["n"] == 2
+
+    # Relançar reaproveita as execuções salvas
+    files = sorted((tmp_path / "out").glob("*/run_*.json"))
+    assert len(files) == 8
+    mtimes = [f.stat().st_mtime_ns for f in files]
+    run_sweep(spec, n_workers=1)
+    assert [f.stat().st_mtime_ns for f in files] == mtimes
+    with open(files[0]) as f:
+        assert json.load(f)["n_gen"] == 3
+
+
+def test_sweep_shares_the_run_cache_with_the_runner(tmp_path):
+    cache_dir = tmp_path / "cache"
+    _run(tmp_path / "runner", seed=0, caching=CacheConfig(cache_dir))
+    spec = {**_spec(tmp_path / "sweep", ["nsga3_func"]), "cases": [{"num_obj": 2, "num_var": 6}]}
+    run_sweep(spec, n_workers=1, cache_dir=cache_dir)
+    files = sorted((tmp_path / "sweep").glob("*/run_*.json"))
+    assert len(files) == 2
+    for file in files:
+        with open(file) as f:
+            assert json.load(f)["cached"]
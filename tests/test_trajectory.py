@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from analysis.generational_distance import TrueFrontIndex, gd, igd
+from analysis.trajectory import TrajectoryRecorder, TrajectoryStats
+from experiments.runner_config import ProfilingConfig
+from problems.dtlz2 import dtlz2_true_front
+from helpers import BACKENDS, run_backend
+from test_experiment_runner import _run
+
+
+def test_front_index_matches_gd_igd():
+    true_front = dtlz2_true_front(300, 3, seed=0)
+    front = np.abs(np.random.default_rng(1).normal(size=(40, 3))) + 0.2
+    g, i = TrueFrontIndex(true_front).gd_igd(front)
+    assert g == pytest.approx(gd(front, true_front), rel=1e-9)
+    assert i == pytest.approx(igd(front, true_front), rel=1e-9)
+
+
+def test_front_index_is_accurate_in_float32_near_convergence():
+    true_front = dtlz2_true_front(5000, 3, seed=0)
+    # Pontos a 1e-4 da fronteira, ao longo da normal da esfera
+    front = true_front[::54] * (1 + 1e-4)
+    expected = gd(front, true_front)
+    g, i = TrueFrontIndex(true_front, "float32").gd_igd(front)
+    assert g == pytest.approx(expected, rel=0.02)
+    assert g == pytest.approx(gd(front, true_front, "float32"), rel=0.02)
+    assert i == pytest.approx(igd(front, true_front, "float32"), rel=1e-4)
+
+
+def test_recorder_schedule_and_validation():
+    front_index = TrueFrontIndex(dtlz2_true_front(100, 2, seed=0))
+    reference = front_index.true_front.max(axis=0) + 0.1
+    recorder = TrajectoryRecorder(front_index, every=3, metrics=["hypervolume", "igd", "gd"])
+    F = np.array([[0.2, 1.0], [1.0, 0.2], [1.1, 1.1]])
+    for gen in range(1, 10):
+        assert recorder(gen, F) is False
+    assert recorder.columns["gen"] == [1, 3, 6, 9]
+    assert len(set(recorder.columns["igd"])) == 1 and recorder.columns["hypervolume"][0] > 0
+    assert recorder.to_dict()["hv_reference"] == reference.tolist()
+
+    with pytest.raises(ValueError):
+        TrajectoryRecorder(front_index, every=None)
+    with pytest.raises(ValueError):
+        TrajectoryRecorder(front_index, metrics=["spread"])
+
+
+def test_recorder_chains_the_callback():
+    front_index = TrueFrontIndex(dtlz2_true_front(100, 2, seed=0))
+    recorder = TrajectoryRecorder(front_index, callback=lambda gen, F: gen == 2)
+    F = np.array([[0.5, 0.5]])
+    assert [recorder(gen, F) for gen in (1, 2)] == [False, True]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_report_every_generation(name):
+    recorder = TrajectoryRecorder(TrueFrontIndex(dtlz2_true_front(200, 3, seed=0)))
+    run_backend(name, generations=5, seed=0, callback=recorder)
+    assert recorder.columns["gen"] == [1, 2, 3, 4, 5]
+    assert all(np.diff(recorder.columns["time"]) >= 0)
+
+
+def test_stats_merge_and_summary():
+    a, b = TrajectoryStats(), TrajectoryStats()
+    a.update({"gen": [1, 2], "time": [0.1, 0.2], "igd": [0.5, 0.4]})
+    b.update({"gen": [1], "time": [0.1], "igd": [0.7]})  # parou antes
+    merged = TrajectoryStats.from_dict(a.to_dict()).merge(b)
+    summary = merged.summary()
+    assert summary["gen"] == [1, 2]
+    assert summary["igd"]["n"] == [2, 1]
+    assert summary["igd"]["mean"] == pytest.approx([0.6, 0.4])
+
+
+def test_runner_stores_trajectories(tmp_path):
+    summary = _run(tmp_path, seed=0, profiling=ProfilingConfig(trajectory={"every": 1}))
+    curves = summary["trajectories"]["nsga3_func"]
+    assert curves["gen"] == [1, 2, 3]
+    assert curves["hypervolume"]["n"] == [2, 2, 2]
@@ -0,0 +1,84 @@
+import json
+import numpy as np
+import pytest
+
+from analysis.stat_tests import chi2_sf, friedman_posthoc, friedman_test, holm_adjust, student_t_sf
+from experiments.tuning import expand_candidates, race_step, run_race
+
+
+def test_distributions_match_scipy():
+    stats = pytest.importorskip("scipy.stats")
+    for x, df in [(0.5, 1), (3.0, 2), (12.0, 7), (40.0, 20)]:
+        assert chi2_sf(x, df) == pytest.approx(stats.chi2.sf(x, df), rel=1e-8)
+    for t, df in [(0.3, 3), (2.1, 10), (-1.5, 25)]:
+        assert student_t_sf(t, df) == pytest.approx(stats.t.sf(t, df), rel=1e-8)
+
+
+def test_friedman_matches_scipy():
+    stats = pytest.importorskip("scipy.stats")
+    costs = np.round(np.random.default_rng(0).normal(size=(12, 4)) + [0.0, 0.3, 0.6, 1.2], 1)
+    statistic, pvalue, rank_sums = friedman_test(costs)
+    expected = stats.friedmanchisquare(*costs.T)
+    assert statistic == pytest.approx(expected.statistic)
+    assert pvalue == pytest.approx(expected.pvalue)
+    assert rank_sums.sum() == 12 * 4 * 5 / 2
+
+
+def test_holm_adjust():
+    np.testing.assert_allclose(holm_adjust([0.01, 0.04, 0.03]), [0.03, 0.06, 0.06])
+
+
+def test_race_step_eliminates_inferior_candidates():
+    # Candidatas 0 e 1 alternam a liderança; a 2 é sempre a pior
+    costs = np.array([[0.1, 0.2, 1.0], [0.2, 0.1, 1.0]] * 5)
+    survivors, report = race_step(costs, [0, 1, 2])
+    assert report["pvalue"] < 0.05
+    assert 2 not in survivors and report["eliminated"] == [2]
+    assert friedman_posthoc(costs, report["best"])[report["best"]] == 1.0
+    # Sem diferença significativa, ninguém sai
+    assert race_step(np.random.default_rng(1).normal(size=(10, 3)), [0, 1, 2])[0] == [0, 1, 2]
+
+
+def test_race_step_eliminates_consistently_worse_candidates():
+    # Todos os blocos ordenam as candidatas da mesma forma: variância nula dos postos
+    costs = np.tile([0.0, 1.0, 2.0], (5, 1))
+    assert friedman_test(costs)[1] < 0.05
+    assert friedman_posthoc(costs, 0).tolist() == [1.0, 0.0, 0.0]
+    survivors, report = race_step(costs, [0, 1, 2])
+    assert survivors == [0] and report["eliminated"] == [1, 2]
+    # Empates em todos os blocos continuam sem diferença
+    assert friedman_posthoc(np.ones((5, 3)), 0).tolist() == [1.0, 1.0, 1.0]
+
+
+def test_expand_candidates():
+    spec = {"candidates": [{"pb_m": 0.1}, {"pb_m": 1.0}], "grid": {"eta_c": [10, 20]}}
+    assert expand_candidates(spec) == [
+        {"pb_m": 0.1, "eta_c": 10}, {"pb_m": 0.1, "eta_c": 20},
+        {"pb_m": 1.0, "eta_c": 10}, {"pb_m": 1.0, "eta_c": 20},
+    ]
+
+
+def test_race_drops_a_bad_candidate_and_is_reproducible(tmp_path):
+    spec = {
+        "output_dir": str(tmp_path / "race"),
+        "implementation": "nsga3_func",
+        "metric": "igd",
+        "budget": 24,
+        "first_test": 4,
+        "params": {"pop_size": 12, "num_gen": 6, "divisions": 4},
+        "instances": [{"num_obj": 2, "num_var": 6}],
+        # Sem cruzamento nem mutação a população não evolui
+        "candidates": [{"pb_c": 0.9, "pb_m": 0.9}, {"pb_c": 0.0, "pb_m": 0.0}],
+    }
+    race = run_race(spec, n_workers=1)
+    assert race["runs"] <= spec["budget"]
+    assert race["best"] == spec["candidates"][0]
+    assert race["candidates"][0]["results"]["stats"]["igd"]["n"] == race["candidates"][0]["n_blocks"]
+
+    # Relançar reaproveita as execuções salvas
+    saved = {path: path.stat().st_mtime_ns for path in (tmp_path / "race" / "runs").glob("*.json")}
+    again = run_race(spec, n_workers=1)
+    assert {path: path.stat().st_mtime_ns for path in saved} == saved
+    assert again["history"] == race["history"]
+    with open(tmp_path / "race" / "race.json") as f:
+        assert json.load(f)["survivors"] == race["survivors"]
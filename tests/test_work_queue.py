@@ -0,0 +1,118 @@
+import json
+import os
+
+import experiments.work_queue as work_queue
+from experiments.work_queue import claim_job, enqueue, merge, requeue_stale, run_worker, status
+
+
+def _spec(output_dir, repetitions=2):
+    return {
+        "output_dir": str(output_dir),
+        "repetitions": repetitions,
+        "seed": 0,
+        "implementations": ["nsga3_func"],
+        "params": {"pop_size": 12, "num_gen": 3, "divisions": 4},
+        "cases": [{"num_obj": 2, "num_var": 6}],
+    }
+
+
+def test_queue_runs_and_merges(tmp_path):
+    queue = tmp_path / "queue"
+    assert enqueue(_spec(tmp_path / "out"), queue) == 2
+    assert run_worker(queue, "w0") == 2
+    assert status(queue) == {"jobs": 0, "claimed": 0, "done": 2}
+
+    config = merge(queue)["configurations"][0]
+    assert config["n_runs"] == {"nsga3_func": 2}
+    assert config["results"]["nsga3_func"]["stats"]["hypervolume"]["n"] == 2
+    # Reenfileirar não duplica execuções concluídas
+    assert enqueue(_spec(tmp_path / "out"), queue) == 0
+
+
+def test_requeued_job_finished_by_two_workers_is_counted_once(tmp_path, monkeypatch):
+    queue = tmp_path / "queue"
+    enqueue(_spec(tmp_path / "out", repetitions=1), queue)
+    original = work_queue.run_job
+    calls = []
+
+    def slow_run_job(args):
+        calls.append(args)
+        if len(calls) == 1:
+            # O trabalhador lento é dado como interrompido e outro conclui a execução
+            requeue_stale(queue, max_age=-1)
+            assert run_worker(queue, "fast") == 1
+        return original(args)
+
+    monkeypatch.setattr(work_queue, "run_job", slow_run_job)
+    assert run_worker(queue, "slow") == 1
+    assert status(queue) == {"jobs": 0, "claimed": 0, "done": 1}
+
+    config = merge(queue)["configurations"][0]
+    assert config["n_runs"] == {"nsga3_func": 1}
+    assert config["results"]["nsga3_func"]["stats"]["hypervolume"]["n"] == 1
+
+
+def test_requeued_job_is_withdrawn_when_the_slow_worker_finishes_first(tmp_path, monkeypatch):
+    queue = tmp_path / "queue"
+    enqueue(_spec(tmp_path / "out", repetitions=1), queue)
+    original = work_queue.run_job
+
+    def slow_run_job(args):
+        requeue_stale(queue, max_age=-1)
+        return original(args)
+
+    monkeypatch.setattr(work_queue, "run_job", slow_run_job)
+    assert run_worker(queue, "slow") == 1
+    assert status(queue) == {"jobs": 0, "claimed": 0, "done": 1}
+    assert merge(queue)["configurations"][0]["n_runs"] == {"nsga3_func": 1}
+
+
+def test_existing_runs_are_counted_once_across_enqueues(tmp_path):
+    first = tmp_path / "first"
+    enqueue(_spec(tmp_path / "out"), first)
+    run_worker(first, "w0")
+
+    # Nova fila sobre a mesma pasta de saída: as execuções salvas entram direto em `done/`
+    queue = tmp_path / "queue"
+    assert enqueue(_spec(tmp_path / "out"), queue) == 0
+    assert enqueue(_spec(tmp_path / "out"), queue) == 0
+    assert status(queue) == {"jobs": 0, "claimed": 0, "done": 2}
+    assert merge(queue)["configurations"][0]["n_runs"] == {"nsga3_func": 2}
+
+
+def test_shards_keep_accumulators_not_runs(tmp_path):
+    queue = tmp_path / "queue"
+    enqueue(_spec(tmp_path / "out", repetitions=3), queue)
+    run_worker(queue, "w0")
+    with open(queue / "shards" / "w0.json") as f:
+        shard = json.load(f)
+    assert set(shard) == {"n_runs", "stats"}
+    (config,) = shard["n_runs"]
+    assert shard["n_runs"][config] == {"nsga3_func": 3}
+    assert shard["stats"][config]["nsga3_func"]["hypervolume"]["n"] == 3
+
+
+def test_fresh_claims_are_not_stale(tmp_path):
+    queue = tmp_path / "queue"
+    enqueue(_spec(tmp_path / "out", repetitions=1), queue)
+    (job,) = (queue / "jobs").glob("*.json")
+    os.utime(job, (0, 0))  # enfileirada há muito tempo
+    claim_path, _ = claim_job(queue, "w0")
+    assert requeue_stale(queue, max_age=60) == 0
+    assert claim_path.exists()
+
+
+def test_claim_skips_a_job_requeued_during_the_rename(tmp_path, monkeypatch):
+    queue = tmp_path / "queue"
+    enqueue(_spec(tmp_path / "out", repetitions=1), queue)
+    rename = os.rename
+
+    def rename_then_requeue(src, dst):
+        # Outro trabalhador devolve a reivindicação à fila logo após a renomeação
+        rename(src, dst)
+        monkeypatch.setattr(work_queue.os, "rename", rename)
+        requeue_stale(queue, max_age=-1)
+
+    monkeypatch.setattr(work_queue.os, "rename", rename_then_requeue)
+    assert claim_job(queue, "w0") is None
+    assert status(queue) == {"jobs": 1, "claimed": 0, "done": 0}
@@ -0,0 +1,65 @@
+"""
+Controle do ambiente de medição: threads das bibliotecas BLAS/OpenMP e afinidade
+de CPU do processo.
+"""
+import os
+
+# Variáveis lidas pelas bibliotecas de álgebra linear (e OpenMP) ao serem carregadas
+BLAS_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Limites do threadpoolctl mantidos vivos enquanto o processo existir
+_limits: list = []
+
+
+def blas_env(threads: int) -> dict[str, str]:
+    """Variáveis de ambiente que fixam `threads` threads em BLAS/OpenMP."""
+    return {var: str(threads) for var in BLAS_THREAD_VARS}
+
+
+def pin_blas_threads(threads: int) -> dict:
+    """
+    Fixa o número de threads de BLAS/OpenMP no processo corrente. As variáveis de
+    ambiente só valem para bibliotecas ainda não carregadas (e para processos
+    filhos); nas já carregadas, o limite é aplicado com o threadpoolctl, se
+    instalado. Retorna o que foi aplicado.
+    """
+    os.environ.update(blas_env(threads))
+    try:
+        from threadpoolctl import threadpool_info, threadpool_limits
+    except ImportError:
+        return {"blas_threads": threads, "threadpoolctl": False}
+    _limits.append(threadpool_limits(limits=threads))
+    return {
+        "blas_threads": threads,
+        "threadpoolctl": True,
+        "libraries": [(lib["internal_api"], lib["num_threads"]) for lib in threadpool_info()],
+    }
+
+
+def release_blas_threads() -> None:
+    """Desfaz os limites do threadpoolctl aplicados por `pin_blas_threads` no processo corrente."""
+    while _limits:
+        _limits.pop().restore_original_limits()
+
+
+def set_affinity(cpus: list[int]) -> list[int] | None:
+    """
+    Restringe o processo corrente às CPUs `cpus` (Linux). Retorna a afinidade
+    efetiva, ou None se o sistema não permitir defini-la.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    os.sched_setaffinity(0, set(cpus))
+    return sorted(os.sched_getaffinity(0))
+
+
+def current_affinity() -> list[int] | None:
+    """CPUs em que o processo corrente pode executar (None se não disponível)."""
+    return sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
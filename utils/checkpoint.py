@@ -0,0 +1,45 @@
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+
+def save_checkpoint(path: str | Path, state: dict[str, Any]) -> None:
+    """
+    Salva o estado em formato binário (pickle) de forma atômica: o arquivo é
+    escrito em um temporário e renomeado, de modo que uma interrupção durante a
+    escrita nunca deixa um checkpoint corrompido no lugar do anterior.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str | Path) -> dict[str, Any] | None:
+    """
+    Carrega um checkpoint salvo por `save_checkpoint`.
+    Retorna None se o arquivo não existir.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def save_json(path: str | Path, data: Any) -> None:
+    """
+    Escreve um JSON de forma atômica (temporário + renomeação), para que
+    arquivos parciais nunca sejam lidos como resultados completos. NaN e
+    infinitos são recusados (ValueError): não são JSON válido.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2, allow_nan=False)
+    os.replace(tmp_path, path)
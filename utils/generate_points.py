@@ -1,6 +1,6 @@
 import numpy as np
 
-def generate_reference_points(M: int, p: int) -> np.ndarray:
+def generate_reference_points(M: int, p: int, dtype: str | np.dtype = "float64") -> np.ndarray:
     def generate_recursive(
         points: list[list[float]],
         num_objs: int,
@@ -21,4 +21,4 @@ def generate_reference_points(M: int, p: int) -> np.ndarray:
 
     points: list[list[float]] = []
     generate_recursive(points, M, p, p, 0, [])
-    return np.array(points, dtype=float)
\ No newline at end of file
+    return np.array(points, dtype=dtype)
\ No newline at end of file
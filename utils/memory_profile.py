@@ -0,0 +1,133 @@
+"""
+Medição de memória de um trecho de código: pico de RSS amostrado por um processo
+externo e, opcionalmente, os principais pontos de alocação segundo `tracemalloc`.
+
+Este arquivo também é o programa do amostrador (executado como script, sem
+importar o restante do repositório): `python memory_profile.py <pid> <intervalo>`.
+"""
+import os
+import subprocess
+import sys
+import threading
+import tracemalloc
+
+_MB = 1024 * 1024
+
+
+def current_rss(pid: int | None = None) -> int | None:
+    """
+    Memória residente (RSS) do processo `pid` em bytes, lida de /proc (Linux) ou
+    com psutil, se instalado; None se nenhum dos dois estiver disponível.
+    """
+    pid = os.getpid() if pid is None else pid
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return int(psutil.Process(pid).memory_info().rss)
+    except psutil.Error:
+        return None
+
+
+class MemoryProfiler:
+    """
+    Gerenciador de contexto que mede a memória do processo corrente no bloco.
+
+    O pico de RSS é amostrado a cada `interval` segundos por um processo separado
+    (um subprocess, que funciona também dentro de trabalhadores de um Pool), de
+    modo que a amostragem não disputa o GIL com o código medido. Só o processo
+    corrente é medido: processos trabalhadores que ele criar não entram na conta.
+    Picos mais curtos que `interval` podem não ser vistos.
+
+    Com `tracemalloc_top`, o bloco também é rastreado com `tracemalloc` e o
+    relatório traz o pico de memória alocada pelo Python (inclui os arrays do
+    NumPy) e os `tracemalloc_top` pontos (arquivo:linha) com mais memória ainda
+    alocada ao fim do bloco. O rastreamento deixa o código bem mais lento, então
+    os tempos medidos no mesmo bloco deixam de ser comparáveis.
+
+    :param interval: Intervalo de amostragem do RSS em segundos
+    :param tracemalloc_top: Número de pontos de alocação no relatório (None = sem tracemalloc)
+    """
+
+    def __init__(self, interval: float = 0.01, tracemalloc_top: int | None = None):
+        if interval <= 0:
+            raise ValueError("interval deve ser positivo")
+        self.interval = interval
+        self.tracemalloc_top = tracemalloc_top
+        self.baseline: int | None = None
+        self.peak: int | None = None
+        self.n_samples: int = 0
+        self.traced_peak: int | None = None
+        self.top_allocations: list[dict] | None = None
+        self._sampler: subprocess.Popen | None = None
+
+    def __enter__(self) -> "MemoryProfiler":
+        self.baseline = current_rss()
+        if self.baseline is not None:
+            self._sampler = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), str(os.getpid()), str(self.interval)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            self._sampler.stdout.readline()  # primeira amostra feita
+        if self.tracemalloc_top is not None:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.tracemalloc_top is not None:
+            snapshot = tracemalloc.take_snapshot()
+            _, self.traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.top_allocations = [
+                {
+                    "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_mb": stat.size / _MB,
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[:self.tracemalloc_top]
+            ]
+        if self._sampler is not None:
+            output, _ = self._sampler.communicate("stop\n")
+            peak, n_samples = output.split()
+            self.peak = max(int(peak), current_rss() or 0)
+            self.n_samples = int(n_samples)
+            self._sampler = None
+
+    def report(self) -> dict:
+        """Relatório em MB: RSS inicial, pico e acréscimo no bloco, e os dados do tracemalloc."""
+        measured = self.baseline is not None and self.peak is not None
+        return {
+            "rss_baseline_mb": self.baseline / _MB if measured else None,
+            "peak_rss_mb": self.peak / _MB if measured else None,
+            "peak_rss_delta_mb": (self.peak - self.baseline) / _MB if measured else None,
+            "n_samples": self.n_samples,
+            "interval": self.interval,
+            "traced_peak_mb": self.traced_peak / _MB if self.traced_peak is not None else None,
+            "top_allocations": self.top_allocations,
+        }
+
+
+def _sample(pid: int, interval: float) -> None:
+    """Laço do amostrador: acompanha o pico de RSS de `pid` até receber uma linha (ou EOF) na entrada."""
+    stop = threading.Event()
+    threading.Thread(target=lambda: (sys.stdin.readline(), stop.set()), daemon=True).start()
+    peak = current_rss(pid) or 0
+    n_samples = 1
+    print("ready", flush=True)
+    while not stop.wait(interval):
+        peak = max(peak, current_rss(pid) or 0)
+        n_samples += 1
+    peak = max(peak, current_rss(pid) or 0)
+    print(peak, n_samples + 1, flush=True)
+
+
+if __name__ == "__main__":
+    _sample(int(sys.argv[1]), float(sys.argv[2]))
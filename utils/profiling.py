@@ -0,0 +1,150 @@
+"""
+Perfis de execução por trecho (cProfile ou amostragem) e resumo dos pontos
+quentes por função, combinando os perfis de várias execuções.
+"""
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROFILERS = ("cprofile", "sample")
+# Extensão dos arquivos de cada perfilador
+PROFILE_SUFFIXES = {"cprofile": ".prof", "sample": ".json"}
+
+
+def _label(filename: str, lineno: int, name: str) -> str:
+    """Nome de uma função no formato do pstats: arquivo:linha(nome)."""
+    return f"{filename}:{lineno}({name})"
+
+
+class RunProfiler:
+    """
+    Gerenciador de contexto que perfila o bloco e salva o perfil em `path`.
+
+    - "cprofile": perfil determinístico (`cProfile`), salvo no formato do
+      `pstats` (`.prof`, legível também por snakeviz/gprof2dot). Mede todas as
+      chamadas, com custo proporcional ao número delas: em código com muitas
+      chamadas pequenas (ex.: o motor puro), os tempos ficam inflados.
+    - "sample": uma thread anota a pilha da thread perfilada a cada `interval`
+      segundos; salva em JSON o número de amostras em que cada função estava no
+      topo da pilha (tempo próprio) e em qualquer nível (tempo total). O custo é
+      pequeno e independe do número de chamadas, mas como a thread precisa do GIL,
+      o intervalo efetivo não fica abaixo de `sys.getswitchinterval()`; por isso os
+      tempos são estimados pelo intervalo medido (duração do bloco / amostras). O
+      tempo em código nativo é atribuído à função Python que o chamou.
+
+    :param path: Arquivo do perfil
+    :param kind: "cprofile", "sample" ou None (pela extensão de `path`: .json = "sample")
+    :param interval: Intervalo de amostragem em segundos (modo "sample")
+    """
+
+    def __init__(self, path: str | Path, kind: str | None = None, interval: float = 0.005):
+        self.path = Path(path)
+        self.kind = kind if kind is not None else ("sample" if self.path.suffix == ".json" else "cprofile")
+        if self.kind not in PROFILERS:
+            raise ValueError(f"Perfilador desconhecido: {self.kind}")
+        self.interval = interval
+        self._profile: cProfile.Profile | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._samples: int = 0
+        self._counts: dict[str, list[int]] = {}
+        self._start: float = 0.0
+
+    def __enter__(self) -> "RunProfiler":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.kind == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._start = time.perf_counter()
+            self._thread = threading.Thread(target=self._sample, args=(threading.get_ident(),), daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.path)
+            return
+        self._stop.set()
+        self._thread.join()
+        elapsed = time.perf_counter() - self._start
+        with open(self.path, "w") as f:
+            json.dump({
+                "interval": self.interval,
+                "elapsed": elapsed,
+                "samples": self._samples,
+                "functions": self._counts,
+            }, f)
+
+    def _sample(self, thread_id: int) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            self._samples += 1
+            seen: set[str] = set()
+            top = True
+            while frame is not None:
+                code = frame.f_code
+                label = _label(code.co_filename, code.co_firstlineno, code.co_name)
+                counts = self._counts.setdefault(label, [0, 0])
+                if top:
+                    counts[0] += 1
+                    top = False
+                if label not in seen:  # recursão conta uma vez por amostra
+                    counts[1] += 1
+                    seen.add(label)
+                frame = frame.f_back
+
+
+def load_profile(path: str | Path) -> dict[str, dict]:
+    """
+    Perfil salvo por `RunProfiler`, por função: chamadas (None na amostragem),
+    tempo próprio e tempo total em segundos (estimados pelas amostras no modo "sample").
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path) as f:
+            data = json.load(f)
+        # Intervalo efetivo entre amostras (o nominal não é respeitado abaixo do switch interval)
+        interval = data["elapsed"] / data["samples"] if data.get("samples") else data["interval"]
+        return {
+            label: {"calls": None, "self_time": own * interval, "total_time": total * interval}
+            for label, (own, total) in data["functions"].items()
+        }
+    return {
+        _label(*func): {"calls": nc, "self_time": tt, "total_time": ct}
+        for func, (_, nc, tt, ct, _) in pstats.Stats(str(path)).stats.items()
+    }
+
+
+def hotspots(paths: list[str | Path], top: int = 30, sort: str = "self_time") -> list[dict]:
+    """
+    Pontos quentes por função somados sobre os perfis `paths` (uma execução por
+    arquivo), ordenados por `sort` ("self_time" ou "total_time"). Cada item traz
+    as chamadas, os tempos somados, o tempo próprio médio por execução e a fração
+    do tempo próprio total.
+    """
+    merged: dict[str, dict] = {}
+    for path in paths:
+        for label, entry in load_profile(path).items():
+            target = merged.setdefault(label, {"calls": 0, "self_time": 0.0, "total_time": 0.0})
+            target["calls"] = None if entry["calls"] is None or target["calls"] is None else target["calls"] + entry["calls"]
+            target["self_time"] += entry["self_time"]
+            target["total_time"] += entry["total_time"]
+    total_self = sum(entry["self_time"] for entry in merged.values()) or 1.0
+    ranked = sorted(merged.items(), key=lambda item: item[1][sort], reverse=True)[:top]
+    return [
+        {
+            "function": label,
+            **entry,
+            "self_time_per_run": entry["self_time"] / len(paths),
+            "self_fraction": entry["self_time"] / total_self,
+        }
+        for label, entry in ranked
+    ]
@@ -0,0 +1,194 @@
+from math import comb
+import numpy as np
+
+# A partir deste número de pontos, o modo "auto" usa a busca na grade de Das-Dennis
+LATTICE_MIN_SIZE = 1024
+# Elementos (consultas × pontos × objetivos) por bloco da busca exaustiva
+_CHUNK_ELEMENTS = 1 << 22
+
+
+class ReferenceIndex:
+    """
+    Índice de vizinho mais próximo sobre um conjunto de pontos de referência.
+
+    Se os pontos são a grade de Das-Dennis de `generate_reference_points(M, p)`
+    (na ordem gerada), as consultas euclidianas são resolvidas na própria grade, sem percorrer
+    os K pontos: cada consulta parte do arredondamento do seu ponto no simplex e
+    faz trocas de uma unidade entre duas coordenadas (x_i + 1/p, x_j - 1/p)
+    enquanto elas melhoram; a posição na ordem de geração é calculada pela
+    contagem combinatória das composições. O custo é O(M²) por iteração e por
+    consulta, independente de K, o que torna utilizáveis grades finas (ex.:
+    `generate_reference_points(6, 21)`, ~66 mil pontos). Caso contrário (ou com
+    `method="brute"`), as consultas são exaustivas, vetorizadas em blocos.
+
+    - `nearest`: ponto mais próximo em distância euclidiana. Na grade o resultado é
+      exato: a distância é separável e convexa nas coordenadas, e para essas funções
+      sobre {x inteiro >= 0, soma p} um ótimo local para trocas é ótimo global.
+    - `nearest_direction`: ponto de maior cosseno com a consulta (equivalente ao
+      mais próximo entre os pontos projetados na hiperesfera unitária). O cosseno
+      não é separável e a busca local por trocas pode parar em ótimos locais (M >= 4),
+      então, no modo grade, as direções ficam em uma k-d tree (`scipy.spatial.cKDTree`,
+      instalado com o PyMoo), com resultado exato; sem o SciPy, a busca é exaustiva.
+
+    Empates entre pontos equidistantes podem ser resolvidos para pontos diferentes
+    nos dois modos.
+
+    :param points: np.ndarray (K, M) com os pontos de referência
+    :param method: "auto" (grade se detectada e K >= LATTICE_MIN_SIZE), "lattice" ou "brute"
+    """
+
+    def __init__(self, points: np.ndarray, method: str = "auto"):
+        if method not in ("auto", "lattice", "brute"):
+            raise ValueError("method deve ser 'auto', 'lattice' ou 'brute'")
+        points = np.asarray(points)
+        # Mantém a precisão dos pontos (ex.: float32); outros tipos viram float64
+        self.points = points if np.issubdtype(points.dtype, np.floating) else points.astype(float)
+        self._directions: np.ndarray | None = None
+        self._direction_tree = None
+        self.divisions = das_dennis_divisions(self.points)
+        if method == "lattice" and self.divisions is None:
+            raise ValueError("Os pontos não formam uma grade de Das-Dennis")
+        use_lattice = method == "lattice" or (
+            method == "auto" and self.divisions is not None and len(self.points) >= LATTICE_MIN_SIZE
+        )
+        self.method = "lattice" if use_lattice else "brute"
+        if use_lattice:
+            self._offsets = _rank_offsets(self.points.shape[1], self.divisions)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @property
+    def directions(self) -> np.ndarray:
+        """Pontos projetados na hiperesfera unitária."""
+        if self._directions is None:
+            self._directions = self.points / np.linalg.norm(self.points, axis=1, keepdims=True)
+        return self._directions
+
+    def nearest(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Ponto de referência mais próximo (euclidiano) de cada linha de `X`.
+
+        :return: (índices, distâncias), ambos de shape (N,)
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=self.points.dtype))
+        if self.method == "brute":
+            return _brute_nearest(self.points, X)
+        r = self._climb_euclidean(X)
+        index = self._rank(r)
+        return index, np.linalg.norm(X - self.points[index], axis=1)
+
+    def nearest_direction(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Direção de referência mais próxima de cada linha de `X` (maior cosseno).
+
+        :return: (índices, distâncias de cada linha até a direção unitária escolhida)
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=self.points.dtype))
+        tree = self._tree() if self.method == "lattice" else None
+        if tree is None:
+            return _brute_nearest(self.directions, X)
+        _, index = tree.query(X)
+        index = np.asarray(index, dtype=np.int64)
+        return index, np.linalg.norm(X - self.directions[index], axis=1)
+
+    def _tree(self):
+        """k-d tree sobre as direções, criada na primeira consulta (None sem o SciPy)."""
+        if self._direction_tree is None:
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                return None
+            self._direction_tree = cKDTree(self.directions)
+        return self._direction_tree
+
+    def _start(self, X: np.ndarray) -> np.ndarray:
+        """Ponto inicial na grade: arredondamento (maiores restos) da projeção no simplex."""
+        p = self.divisions
+        X = np.clip(X, 0.0, None)
+        total = X.sum(axis=1, keepdims=True)
+        target = np.where(total > 0, X / np.where(total > 0, total, 1.0), 1.0 / X.shape[1]) * p
+        r = np.floor(target).astype(np.int64)
+        missing = p - r.sum(axis=1)
+        order = np.argsort(r - target, axis=1, kind="stable")  # maiores restos primeiro
+        bump = np.arange(X.shape[1])[None, :] < missing[:, None]
+        np.add.at(r, (np.arange(len(X))[:, None], order), bump.astype(np.int64))
+        return r
+
+    def _climb_euclidean(self, X: np.ndarray) -> np.ndarray:
+        # Em unidades da grade, a troca (i += 1, j -= 1) melhora se d_i - d_j > 1, com d = pX - r
+        target = X * self.divisions
+        r = self._start(X)
+        rows = np.arange(len(X))
+        active = rows
+        while len(active):
+            d = target[active] - r[active]
+            i = np.argmax(d, axis=1)
+            j = np.argmin(np.where(r[active] > 0, d, np.inf), axis=1)
+            local = np.arange(len(active))
+            move = d[local, i] - d[local, j] > 1 + 1e-12
+            active, i, j = active[move], i[move], j[move]
+            r[active, i] += 1
+            r[active, j] -= 1
+        return r
+
+    def _rank(self, r: np.ndarray) -> np.ndarray:
+        """Posição de cada ponto da grade (em unidades inteiras) na ordem de `generate_reference_points`."""
+        return _lattice_rank(r, self.divisions, self._offsets)
+
+
+def _brute_nearest(points: np.ndarray, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    index = np.empty(len(X), dtype=np.int64)
+    distance = np.empty(len(X), dtype=points.dtype)
+    chunk = max(1, _CHUNK_ELEMENTS // max(1, points.size))
+    for start in range(0, len(X), chunk):
+        block = X[start:start + chunk]
+        distances = np.linalg.norm(block[:, None, :] - points[None, :, :], axis=2)
+        best = np.argmin(distances, axis=1)
+        index[start:start + chunk] = best
+        distance[start:start + chunk] = distances[np.arange(len(block)), best]
+    return index, distance
+
+
+def _rank_offsets(M: int, p: int) -> np.ndarray:
+    """
+    offsets[k, left, v]: quantos pontos da grade precedem os que têm x_k = v, dado
+    que as coordenadas seguintes somam `left` (composições de left - u em M - k - 1 partes, u < v).
+    """
+    offsets = np.zeros((M, p + 1, p + 2), dtype=np.int64)
+    for k in range(M - 1):
+        parts = M - k - 1
+        for left in range(p + 1):
+            counts = [comb(left - u + parts - 1, parts - 1) for u in range(left + 1)]
+            offsets[k, left, 1:left + 2] = np.cumsum(counts)
+    return offsets
+
+
+def _lattice_rank(r: np.ndarray, p: int, offsets: np.ndarray) -> np.ndarray:
+    M = r.shape[1]
+    left = np.full(len(r), p, dtype=np.int64)
+    rank = np.zeros(len(r), dtype=np.int64)
+    for k in range(M - 1):
+        rank += offsets[k, left, r[:, k]]
+        left -= r[:, k]
+    return rank
+
+
+def das_dennis_divisions(points: np.ndarray) -> int | None:
+    """Número de divisões p se `points` for exatamente `generate_reference_points(M, p)`; senão None."""
+    if points.ndim != 2 or len(points) == 0 or points.shape[1] < 2:
+        return None
+    positive = points[points > 0]
+    if np.any(points < 0) or positive.size == 0:
+        return None
+    p = int(round(1.0 / positive.min()))
+    M = points.shape[1]
+    if p < 1 or len(points) != comb(p + M - 1, M - 1):
+        return None
+    scaled = points * p
+    r = np.rint(scaled).astype(np.int64)
+    if not np.allclose(scaled, r, atol=1e-9) or np.any(r.sum(axis=1) != p):
+        return None
+    if not np.array_equal(_lattice_rank(r, p, _rank_offsets(M, p)), np.arange(len(points))):
+        return None
+    return p
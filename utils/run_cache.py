@@ -0,0 +1,52 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+from utils.checkpoint import save_json
+
+CACHE_VERSION = 1
+
+
+class RunCache:
+    """
+    Cache de execuções endereçado por conteúdo.
+
+    Cada execução é identificada pelo hash SHA-256 da sua configuração completa
+    (implementação, parâmetros do algoritmo e dos operadores, semente, ...),
+    serializada como JSON canônico. O resultado (fronteira e métricas) fica em
+    `cache_dir/<hash[:2]>/<hash>.json`, de modo que varreduras repetidas ou
+    sobrepostas só calculam as configurações ausentes.
+
+    :param cache_dir: Diretório do cache (compartilhável entre experimentos)
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key(config: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"cache_version": CACHE_VERSION, **config},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        with open(path) as f:
+            entry = json.load(f)
+        self.hits += 1
+        return entry["data"]
+
+    def put(self, key: str, config: dict[str, Any], data: dict[str, Any]) -> None:
+        save_json(self._path(key), {"config": config, "data": data})
@@ -0,0 +1,11 @@
+import random
+import numpy as np
+
+
+def seed_all(seed: int) -> None:
+    """
+    Semeia os geradores globais usados pelas implementações e operadores
+    (`random` e `numpy.random`), tornando uma execução reprodutível.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
@@ -0,0 +1,90 @@
+from multiprocessing import shared_memory
+from typing import Any
+import numpy as np
+
+ArrayDescriptor = tuple[str, tuple[int, ...], str]
+
+
+class SharedArray:
+    """
+    Array NumPy alocado em `multiprocessing.shared_memory`.
+
+    O processo que cria o array (`create`/`from_array`) é o dono e deve chamar
+    `unlink()` ao final; os demais processos usam `attach(descriptor)` para obter
+    uma view sobre a mesma memória, sem cópia nem serialização dos dados.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, shape: tuple[int, ...], dtype: Any):
+        self.shm = shm
+        self.array: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, shape: tuple[int, ...], dtype: Any = float) -> "SharedArray":
+        nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        return cls(shm, shape, dtype)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "SharedArray":
+        array = np.asarray(array)
+        shared = cls.create(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @classmethod
+    def attach(cls, descriptor: ArrayDescriptor) -> "SharedArray":
+        name, shape, dtype = descriptor
+        return cls(shared_memory.SharedMemory(name=name), tuple(shape), np.dtype(dtype))
+
+    def descriptor(self) -> ArrayDescriptor:
+        return (self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def close(self) -> None:
+        self.array = None
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+
+class SharedPopulation:
+    """
+    Buffers de população em memória compartilhada: matriz de decisão (N, n_var)
+    e matriz de objetivos (N, M). Processos trabalhadores se anexam aos buffers e
+    preenchem as linhas de F que lhes cabem diretamente, sem serializar vetores.
+    """
+
+    def __init__(self, X: SharedArray, F: SharedArray):
+        self._X = X
+        self._F = F
+
+    @classmethod
+    def create(cls, capacity: int, n_var: int, n_obj: int, dtype: Any = float) -> "SharedPopulation":
+        return cls(SharedArray.create((capacity, n_var), dtype), SharedArray.create((capacity, n_obj), dtype))
+
+    @classmethod
+    def attach(cls, descriptor: tuple[ArrayDescriptor, ArrayDescriptor]) -> "SharedPopulation":
+        return cls(SharedArray.attach(descriptor[0]), SharedArray.attach(descriptor[1]))
+
+    def descriptor(self) -> tuple[ArrayDescriptor, ArrayDescriptor]:
+        return (self._X.descriptor(), self._F.descriptor())
+
+    @property
+    def X(self) -> np.ndarray:
+        return self._X.array
+
+    @property
+    def F(self) -> np.ndarray:
+        return self._F.array
+
+    @property
+    def capacity(self) -> int:
+        return self._X.array.shape[0]
+
+    def close(self) -> None:
+        self._X.close()
+        self._F.close()
+
+    def unlink(self) -> None:
+        self._X.unlink()
+        self._F.unlink()